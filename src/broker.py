@@ -0,0 +1,124 @@
+# src/broker.py
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, Optional
+from uuid import UUID
+
+from src.config import get_settings
+
+
+class SlowConsumer(Exception):
+    """The subscriber's queue overflowed and it was dropped from the broker."""
+
+
+_DROPPED = object()
+
+
+class Subscriber:
+    """One consumer of a set of topics, fed through a bounded queue."""
+    def __init__(self, broker: "Broker", topics: frozenset[str], queue_size: int):
+        self.broker = broker
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, message: Any) -> bool:
+        """Queue `message` without waiting; False when the queue is full."""
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def drop(self) -> None:
+        """Discard everything queued and wake the consumer with `SlowConsumer`."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(_DROPPED)
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        message = await self.queue.get()
+        if message is _DROPPED:
+            raise SlowConsumer("Subscriber fell behind and was disconnected")
+        return message
+
+    def __enter__(self) -> "Subscriber":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class Broker:
+    """
+    In-process topic fan-out. `publish` never blocks the publisher: every
+    subscriber has its own bounded queue, and one that is full is dropped
+    instead of holding back the others.
+    """
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._topics: dict[str, set[Subscriber]] = {}
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, *topics: str, queue_size: Optional[int] = None) -> Subscriber:
+        subscriber = Subscriber(self, frozenset(topics), queue_size or self.queue_size)
+        for topic in subscriber.topics:
+            self._topics.setdefault(topic, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        for topic in subscriber.topics:
+            subscribers = self._topics.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._topics[topic]
+
+    def publish(self, topic: str, message: Any) -> int:
+        """Deliver `message` to every subscriber of `topic`; returns how many got it."""
+        self.published += 1
+        delivered = 0
+        for subscriber in list(self._topics.get(topic, ())):
+            if subscriber.offer(message):
+                delivered += 1
+            else:
+                self.unsubscribe(subscriber)
+                subscriber.drop()
+                self.dropped += 1
+        return delivered
+
+    def stats(self) -> dict:
+        return {
+            "topics": len(self._topics),
+            "subscribers": len({s for subscribers in self._topics.values() for s in subscribers}),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+@dataclass(frozen=True)
+class Change:
+    """A committed write to one row. `kind` is CREATED, UPDATED, UPSERTED or DELETED."""
+    kind: str
+    id: UUID
+
+
+_broker = None
+def get_broker() -> Broker:
+    global _broker
+    if _broker is None:
+        _broker = Broker(get_settings().broker_queue_size)
+    return _broker
+
+
+def publish_changes(topic: str, kind: str, ids: Iterable[UUID]) -> None:
+    """Announce committed writes; called by the services after `commit()`."""
+    broker = get_broker()
+    for id in ids:
+        broker.publish(topic, Change(kind, id))
@@ -1,9 +1,85 @@
 # src/config.py
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
 class Settings(BaseSettings):
     db_url: str = "sqlite+aiosqlite:///./game.db"
+    # Optional read replica used by query operations; falls back to db_url
+    db_read_url: Optional[str] = None
+    # Seconds a client stays pinned to the primary after it ran a mutation
+    read_your_writes_window: float = 5.0
+
+    # Connection pool (ignored by in-memory SQLite, which shares one static connection)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800          # seconds, -1 disables
+    db_pool_pre_ping: bool = False
+    db_statement_cache_size: int = 500   # compiled SQL / prepared statement cache entries
+
+    # PRAGMA profile applied to every new SQLite connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024   # bytes
+    sqlite_cache_size: int = -64 * 1024         # negative = KiB, i.e. 64 MiB
+    sqlite_busy_timeout: int = 5_000            # milliseconds
+
+    # Seconds between checks for catalog writes made by other workers (0 disables)
+    catalog_refresh_interval: float = 1.0
+
+    # Parsed seed files are cached here (default: src/seed/.cache)
+    seed_cache_dir: Optional[str] = None
+
+    # Bearer token -> client lookups kept in-process
+    token_cache_size: int = 10_000
+    token_cache_ttl: float = 60.0
+
+    # Automatic persisted queries: stored documents, and an optional
+    # JSON file of sha256 -> query that turns on allowlist mode
+    apq_cache_size: int = 5_000
+    apq_allowlist_path: Optional[str] = None
+
+    # Parsed + validated documents keyed by query text; the byte bound
+    # counts query text, parsed ASTs take a proportional multiple of it
+    document_cache_size: int = 1_000
+    document_cache_max_bytes: int = 4 * 1024 * 1024
+
+    # Static query limits, checked before execution
+    query_max_depth: int = 10
+    query_max_introspection_depth: int = 15   # the standard introspection query needs 14
+    query_max_cost: int = 10_000
+    query_cost_default_rows: int = 10    # estimate for list fields without catalog statistics
+    # Cost each client may spend per sliding window
+    query_cost_budget: int = 100_000
+    query_cost_window: float = 60.0      # seconds
+
+    # Rows per page of connection (`page`) fields
+    page_default_size: int = 50
+    page_max_size: int = 100
+
+    # Messages buffered per subscription before a slow subscriber is dropped
+    broker_queue_size: int = 100
+
+    # Uniform grid of the spatial index: tiles per cell side, and the largest
+    # rectangle (in tiles) a viewport query may cover
+    world_cell_size: int = 32
+    world_max_rect_area: int = 1_000_000
+    # Seconds between full reconciles of the grid with the database, which
+    # pick up writes made by other workers (0 disables)
+    world_reconcile_interval: float = 5.0
+
+    # Fog of war: tiles per side of a bitset chunk, and how many tile changes
+    # each client's log keeps before older versions need a full resync
+    visibility_chunk_size: int = 64
+    visibility_log_size: int = 100_000
+
+    # Tile store: one memory-mapped file per chunk of chunk_size x chunk_size
+    # tiles, at most max_open_chunks mapped at once
+    tile_data_dir: str = "./data/tiles"
+    tile_chunk_size: int = 64
+    tile_max_open_chunks: int = 256
+    tile_max_chunks_per_query: int = 16
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,15 +1,61 @@
 # src/database/__init__.py
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 
-from src.config import get_settings
+from src.config import Settings, get_settings
+
+
+def _engine_kwargs(url: str, settings: Settings) -> dict:
+    parsed = make_url(url)
+    kwargs: dict = {"query_cache_size": settings.db_statement_cache_size}
+
+    in_memory = parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+    if not in_memory:
+        kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+
+    if parsed.get_driver_name() == "asyncpg":
+        kwargs["connect_args"] = {"prepared_statement_cache_size": settings.db_statement_cache_size}
+
+    return kwargs
+
+
+def _install_sqlite_pragmas(engine: AsyncEngine, settings: Settings) -> None:
+    pragmas = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "cache_size": settings.sqlite_cache_size,
+        "busy_timeout": settings.sqlite_busy_timeout,
+    }
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def build_engine(url: str) -> AsyncEngine:
+    settings = get_settings()
+    engine = create_async_engine(url, echo=False, future=True, **_engine_kwargs(url, settings))
+    if engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(engine, settings)
+    return engine
 
 _engine = None
 def get_engine():
     global _engine
     if _engine is None:
-        _engine = create_async_engine(get_settings().db_url, echo=False, future=True)
+        _engine = build_engine(get_settings().db_url)
     return _engine
 
 _session = None
@@ -19,22 +65,66 @@ def get_sessionmaker():
         _session = async_sessionmaker(get_engine(), expire_on_commit=False)
     return _session
 
+_read_engine = None
+def get_read_engine():
+    global _read_engine
+    if _read_engine is None:
+        read_url = get_settings().db_read_url
+        _read_engine = build_engine(read_url) if read_url else get_engine()
+    return _read_engine
+
+_read_session = None
+def get_read_sessionmaker():
+    global _read_session
+    if _read_session is None:
+        if get_read_engine() is get_engine():
+            _read_session = get_sessionmaker()
+        else:
+            _read_session = async_sessionmaker(get_read_engine(), expire_on_commit=False)
+    return _read_session
+
 async def get_db()-> AsyncGenerator[AsyncSession, None]:
     session_local = get_sessionmaker()
     async with session_local() as session:
         yield session
 
 
-from sqlalchemy.orm import selectinload, class_mapper
 
-def eager_load_all(model, depth=2):
-    opts = []
-    if depth <= 0:
-        return opts
-    for rel in class_mapper(model).relationships:
-        loader = selectinload(getattr(model, rel.key))
-        sub_opts = eager_load_all(rel.mapper.class_, depth=depth-1)
-        if sub_opts:
-            loader = loader.options(*sub_opts)
-        opts.append(loader)
-    return opts
\ No newline at end of file
+class LazySession:
+    """
+    Stand-in for an AsyncSession that creates the real session the first time
+    a resolver touches it. Requests that never reach the database (rejected,
+    introspection, cached) never open a session or check out a connection.
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        read_session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
+        self._session: Optional[AsyncSession] = None
+        # Set before first use to route the session to the read replica
+        self.read_only = False
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            factory = self._read_session_factory if self.read_only else self._session_factory
+            self._session = factory()
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+async def get_lazy_db() -> AsyncGenerator[LazySession, None]:
+    db = LazySession(get_sessionmaker(), get_read_sessionmaker())
+    try:
+        yield db
+    finally:
+        await db.close()
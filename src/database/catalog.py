@@ -0,0 +1,438 @@
+# src/database/catalog.py
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, Iterable, Optional, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.database import get_sessionmaker
+from src.database.upsert import upsert_rows
+from src.database.models import (
+    CatalogMeta,
+    ItemType,
+    StructureType,
+    BotType,
+    BotRecipe,
+    BuildingType,
+    BuildingRecipe,
+    Recipe,
+    RecipeIngredient,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ItemTypeEntry:
+    id: UUID
+    name: str
+    durability: Optional[int]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class StructureTypeEntry:
+    id: UUID
+    name: str
+    health: int
+    item_type_id: UUID
+    max_items: int
+    item_to_engage_id: Optional[UUID]
+    created_at: datetime
+    item_type: ItemTypeEntry
+    item_to_engage: Optional[ItemTypeEntry]
+
+
+@dataclass(frozen=True, slots=True)
+class BotRecipeEntry:
+    id: UUID
+    bot_type_id: UUID
+    item_type_id: UUID
+    amount: int
+    created_at: datetime
+    item_type: ItemTypeEntry
+
+
+@dataclass(frozen=True, slots=True)
+class BotTypeEntry:
+    id: UUID
+    name: str
+    health: int
+    strength: int
+    speed: int
+    vision: int
+    created_at: datetime
+    bot_recipes: tuple[BotRecipeEntry, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RecipeIngredientEntry:
+    id: UUID
+    recipe_id: UUID
+    item_type_id: UUID
+    amount: int
+    created_at: datetime
+    item_type: ItemTypeEntry
+
+
+@dataclass(frozen=True, slots=True)
+class RecipeEntry:
+    id: UUID
+    name: str
+    building_type_id: UUID
+    output_item_type_id: UUID
+    output_amount: int
+    created_at: datetime
+    ingredients: tuple[RecipeIngredientEntry, ...]
+    output_item_type: ItemTypeEntry
+
+
+@dataclass(frozen=True, slots=True)
+class BuildingRecipeEntry:
+    id: UUID
+    building_type_id: UUID
+    item_type_id: UUID
+    amount: int
+    created_at: datetime
+    item_type: ItemTypeEntry
+
+
+@dataclass(frozen=True, slots=True)
+class BuildingTypeEntry:
+    id: UUID
+    name: str
+    health: int
+    created_at: datetime
+    building_recipes: tuple[BuildingRecipeEntry, ...]
+    recipes: tuple[RecipeEntry, ...]
+
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class CatalogIndex(Generic[T]):
+    """All entries of one catalog type plus O(1) id and name lookups."""
+    label: str
+    all: tuple[T, ...]
+    by_id: dict[UUID, T] = field(repr=False)
+    by_name: dict[str, T] = field(repr=False)
+
+    @classmethod
+    def build(cls, label: str, entries: Iterable[T]) -> "CatalogIndex[T]":
+        entries = tuple(entries)
+        return cls(
+            label=label,
+            all=entries,
+            by_id={entry.id: entry for entry in entries},
+            by_name={entry.name: entry for entry in entries},
+        )
+
+    def get(self, entry_id: UUID) -> T:
+        entry = self.by_id.get(entry_id)
+        if entry is None:
+            raise HTTPException(status_code=404, detail=f"{self.label} not found")
+        return entry
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of the static game data. Replaced wholesale, never mutated."""
+    version: int
+    # Content fingerprint; identical across workers that loaded the same data
+    digest: str
+    item_types: CatalogIndex[ItemTypeEntry]
+    structure_types: CatalogIndex[StructureTypeEntry]
+    bot_types: CatalogIndex[BotTypeEntry]
+    building_types: CatalogIndex[BuildingTypeEntry]
+    recipes: CatalogIndex[RecipeEntry]
+
+
+def _grouped(rows, key: str) -> dict:
+    groups: dict = {}
+    for row in rows:
+        groups.setdefault(getattr(row, key), []).append(row)
+    return groups
+
+
+def _orphan(label: str, row, column: str) -> None:
+    print(f"⚠ Catalog: {label} {row.id} references missing ItemType {getattr(row, column)}, skipped")
+
+
+# The builders below take ORM rows or entries of the previous snapshot alike
+# (both carry the same attributes), so dependents of a changed table can be
+# relinked in memory instead of being read again.
+
+def _structure_type(row, items: dict) -> Optional[StructureTypeEntry]:
+    if row.item_type_id not in items:
+        _orphan("StructureType", row, "item_type_id")
+        return None
+    return StructureTypeEntry(
+        id=row.id,
+        name=row.name,
+        health=row.health,
+        item_type_id=row.item_type_id,
+        max_items=row.max_items,
+        item_to_engage_id=row.item_to_engage_id,
+        created_at=row.created_at,
+        item_type=items[row.item_type_id],
+        item_to_engage=items.get(row.item_to_engage_id),
+    )
+
+
+def _bot_type(row, recipes, items: dict) -> BotTypeEntry:
+    bot_recipes = []
+    for r in recipes:
+        if r.item_type_id not in items:
+            _orphan("BotRecipe", r, "item_type_id")
+            continue
+        bot_recipes.append(BotRecipeEntry(
+            id=r.id,
+            bot_type_id=r.bot_type_id,
+            item_type_id=r.item_type_id,
+            amount=r.amount,
+            created_at=r.created_at,
+            item_type=items[r.item_type_id],
+        ))
+    return BotTypeEntry(
+        id=row.id,
+        name=row.name,
+        health=row.health,
+        strength=row.strength,
+        speed=row.speed,
+        vision=row.vision,
+        created_at=row.created_at,
+        bot_recipes=tuple(bot_recipes),
+    )
+
+
+def _recipe(row, ingredients, items: dict) -> Optional[RecipeEntry]:
+    if row.output_item_type_id not in items:
+        _orphan("Recipe", row, "output_item_type_id")
+        return None
+    entries = []
+    for i in ingredients:
+        if i.item_type_id not in items:
+            _orphan("RecipeIngredient", i, "item_type_id")
+            continue
+        entries.append(RecipeIngredientEntry(
+            id=i.id,
+            recipe_id=i.recipe_id,
+            item_type_id=i.item_type_id,
+            amount=i.amount,
+            created_at=i.created_at,
+            item_type=items[i.item_type_id],
+        ))
+    return RecipeEntry(
+        id=row.id,
+        name=row.name,
+        building_type_id=row.building_type_id,
+        output_item_type_id=row.output_item_type_id,
+        output_amount=row.output_amount,
+        created_at=row.created_at,
+        ingredients=tuple(entries),
+        output_item_type=items[row.output_item_type_id],
+    )
+
+
+def _building_type(row, building_recipes, recipes, items: dict) -> BuildingTypeEntry:
+    entries = []
+    for r in building_recipes:
+        if r.item_type_id not in items:
+            _orphan("BuildingRecipe", r, "item_type_id")
+            continue
+        entries.append(BuildingRecipeEntry(
+            id=r.id,
+            building_type_id=r.building_type_id,
+            item_type_id=r.item_type_id,
+            amount=r.amount,
+            created_at=r.created_at,
+            item_type=items[r.item_type_id],
+        ))
+    return BuildingTypeEntry(
+        id=row.id,
+        name=row.name,
+        health=row.health,
+        created_at=row.created_at,
+        building_recipes=tuple(entries),
+        recipes=tuple(recipes),
+    )
+
+
+LABELS = ("ItemType", "StructureType", "BotType", "BuildingType", "Recipe")
+
+# Indexes whose entries embed entries of the given one
+_DEPENDENTS = {
+    "ItemType": ("StructureType", "BotType", "BuildingType", "Recipe"),
+    "Recipe": ("BuildingType",),
+}
+
+
+async def _read_snapshot(
+    db: AsyncSession,
+    version: int,
+    previous: Optional[CatalogSnapshot] = None,
+    changed: Iterable[str] = LABELS,
+) -> CatalogSnapshot:
+    """
+    Build a snapshot reading only the tables behind the `changed` labels.
+    Indexes depending on a changed one are relinked from `previous`;
+    the others are reused as they are.
+    """
+    reread = set(changed) if previous is not None else set(LABELS)
+    relink = {dependent for label in reread for dependent in _DEPENDENTS.get(label, ())} - reread
+
+    async def rows(model):
+        return (await db.execute(select(model).order_by(model.created_at, model.id))).scalars().all()
+
+    def built(entries) -> list:
+        return [entry for entry in entries if entry is not None]
+
+    if "ItemType" in reread:
+        items = {
+            row.id: ItemTypeEntry(
+                id=row.id, name=row.name, durability=row.durability, created_at=row.created_at
+            )
+            for row in await rows(ItemType)
+        }
+        item_types = CatalogIndex.build("ItemType", items.values())
+    else:
+        item_types = previous.item_types
+        items = item_types.by_id
+
+    if "StructureType" in reread:
+        structure_types = CatalogIndex.build(
+            "StructureType", built(_structure_type(row, items) for row in await rows(StructureType))
+        )
+    elif "StructureType" in relink:
+        structure_types = CatalogIndex.build(
+            "StructureType", built(_structure_type(entry, items) for entry in previous.structure_types.all)
+        )
+    else:
+        structure_types = previous.structure_types
+
+    if "BotType" in reread:
+        bot_recipes = _grouped(await rows(BotRecipe), "bot_type_id")
+        bot_types = CatalogIndex.build("BotType", [
+            _bot_type(row, bot_recipes.get(row.id, []), items) for row in await rows(BotType)
+        ])
+    elif "BotType" in relink:
+        bot_types = CatalogIndex.build("BotType", [
+            _bot_type(entry, entry.bot_recipes, items) for entry in previous.bot_types.all
+        ])
+    else:
+        bot_types = previous.bot_types
+
+    if "Recipe" in reread:
+        ingredients = _grouped(await rows(RecipeIngredient), "recipe_id")
+        recipes = CatalogIndex.build("Recipe", built(
+            _recipe(row, ingredients.get(row.id, []), items) for row in await rows(Recipe)
+        ))
+    elif "Recipe" in relink:
+        recipes = CatalogIndex.build("Recipe", built(
+            _recipe(entry, entry.ingredients, items) for entry in previous.recipes.all
+        ))
+    else:
+        recipes = previous.recipes
+
+    recipes_by_building = _grouped(recipes.all, "building_type_id")
+    if "BuildingType" in reread:
+        building_recipes = _grouped(await rows(BuildingRecipe), "building_type_id")
+        building_types = CatalogIndex.build("BuildingType", [
+            _building_type(row, building_recipes.get(row.id, []), recipes_by_building.get(row.id, []), items)
+            for row in await rows(BuildingType)
+        ])
+    elif "BuildingType" in relink:
+        building_types = CatalogIndex.build("BuildingType", [
+            _building_type(entry, entry.building_recipes, recipes_by_building.get(entry.id, []), items)
+            for entry in previous.building_types.all
+        ])
+    else:
+        building_types = previous.building_types
+
+    content = (item_types.all, structure_types.all, bot_types.all, building_types.all, recipes.all)
+
+    return CatalogSnapshot(
+        version=version,
+        digest=hashlib.sha256(repr(content).encode()).hexdigest(),
+        item_types=item_types,
+        structure_types=structure_types,
+        bot_types=bot_types,
+        building_types=building_types,
+        recipes=recipes,
+    )
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+# `catalog_meta` revisions the snapshot reflects, and when they were last compared
+_revisions: dict[str, str] = {}
+_checked_at = 0.0
+_lock = asyncio.Lock()
+
+
+async def _refresh(db: AsyncSession, changed: Iterable[str] = ()) -> CatalogSnapshot:
+    """Rebuild the `changed` indexes plus those whose revision moved since the last rebuild."""
+    global _snapshot, _revisions, _checked_at
+    # read before the rows: a write landing in between is picked up again next time
+    revisions = dict((await db.execute(select(CatalogMeta.label, CatalogMeta.revision))).all())
+    stale = set(changed) | {label for label in LABELS if revisions.get(label) != _revisions.get(label)}
+    if _snapshot is None or stale:
+        version = _snapshot.version + 1 if _snapshot is not None else 1
+        _snapshot = await _read_snapshot(db, version, _snapshot, stale)
+    _revisions = revisions
+    _checked_at = time.monotonic()
+    return _snapshot
+
+async def load_catalog(*changed: str) -> CatalogSnapshot:
+    """
+    Rebuild the snapshot from committed data and swap it in with a bumped version.
+    `changed` names the catalog types (`LABELS`) whose tables were written; only
+    those are read again. Without it, everything is.
+    Reads use their own session so uncommitted state of a caller never leaks in.
+    The written types also get a new revision in `catalog_meta`, which other
+    workers compare every `CATALOG_REFRESH_INTERVAL` seconds (see `get_catalog`).
+    """
+    unknown = set(changed) - set(LABELS)
+    if unknown:
+        raise ValueError(f"Unknown catalog types: {sorted(unknown)}")
+    async with _lock:
+        async with get_sessionmaker()() as db:
+            if changed:
+                await bump_revisions(db, changed)
+                await db.commit()
+            return await _refresh(db, changed or LABELS)
+
+async def bump_revisions(db: AsyncSession, labels: Iterable[str]) -> None:
+    """Mark catalog types as written, in the caller's transaction."""
+    await upsert_rows(
+        db, CatalogMeta, [{"label": label, "revision": uuid.uuid4().hex} for label in labels], key="label"
+    )
+
+async def get_catalog() -> CatalogSnapshot:
+    """
+    The current snapshot. At most every `CATALOG_REFRESH_INTERVAL` seconds one
+    caller first compares the `catalog_meta` revisions and rebuilds what other
+    workers changed; the others keep serving the snapshot meanwhile.
+    """
+    global _checked_at
+    if _snapshot is None:
+        return await load_catalog()
+
+    interval = get_settings().catalog_refresh_interval
+    if interval > 0 and time.monotonic() - _checked_at >= interval and not _lock.locked():
+        _checked_at = time.monotonic()
+        async with _lock:
+            async with get_sessionmaker()() as db:
+                return await _refresh(db)
+    return _snapshot
+
+def current_catalog() -> Optional[CatalogSnapshot]:
+    """The loaded snapshot, or None before the first load; for synchronous callers."""
+    return _snapshot
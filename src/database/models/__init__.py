@@ -6,7 +6,9 @@ from .buildings import BuildingRecipe, BuildingType, Building
 from .recipes import RecipeIngredient, Recipe
 from .structures import StructureType, Structure
 from .bots import BotRecipe, BotType, BotInventorySlot, Bot
-from .seed import SeedMeta
+from .seed import SeedMeta, SeedEntry
+from .schema import SchemaMeta
+from .catalog import CatalogMeta
 
 __all__ = [
     "Base", "BaseRepr",
@@ -16,5 +18,7 @@ __all__ = [
     "RecipeIngredient", "Recipe",
     "StructureType", "Structure",
     "BotRecipe", "BotType", "BotInventorySlot", "Bot",
-    "SeedMeta"
+    "SeedMeta", "SeedEntry",
+    "SchemaMeta",
+    "CatalogMeta",
 ]
\ No newline at end of file
@@ -22,7 +22,8 @@ class BaseRepr(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
-        default=lambda: datetime.now(timezone.utc)
+        default=lambda: datetime.now(timezone.utc),
+        index=True,
     )
 
     def __repr__(self) -> str:
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint
+from sqlalchemy import Index, Integer, String, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseRepr
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 class BotRecipe(BaseRepr):
     __tablename__ = "bot_recipes"
 
-    bot_type_id: Mapped[UUID] = mapped_column(ForeignKey("bot_types.id"))
+    bot_type_id: Mapped[UUID] = mapped_column(ForeignKey("bot_types.id"), index=True)
     item_type_id:     Mapped[int] = mapped_column(ForeignKey("item_types.id"))
     amount:      Mapped[int] = mapped_column(Integer)
 
@@ -70,3 +70,7 @@ class Bot(BaseRepr):
     inventory: Mapped[list["BotInventorySlot"]] = relationship(
         "BotInventorySlot", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        Index("ix_bots_x_y", "x", "y"),
+    )
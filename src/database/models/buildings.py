@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Index, Integer, String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseRepr
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 class BuildingRecipe(BaseRepr):
     __tablename__ = "building_recipes"
 
-    building_type_id: Mapped[UUID] = mapped_column(ForeignKey("building_types.id"))
+    building_type_id: Mapped[UUID] = mapped_column(ForeignKey("building_types.id"), index=True)
     item_type_id: Mapped[UUID] = mapped_column(ForeignKey("item_types.id"))
     amount: Mapped[int] = mapped_column(Integer)
 
@@ -48,3 +48,7 @@ class Building(BaseRepr):
 
     type: Mapped["BuildingType"] = relationship("BuildingType")
     client: Mapped["Client"] = relationship("Client")
+
+    __table_args__ = (
+        Index("ix_buildings_x_y", "x", "y"),
+    )
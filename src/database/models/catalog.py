@@ -0,0 +1,17 @@
+# src/database/models/catalog.py
+from __future__ import annotations
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseRepr
+
+class CatalogMeta(BaseRepr):
+    """
+    Current revision of each catalog type, replaced on every write, so all
+    workers notice catalog changes made by any of them.
+    """
+    __tablename__ = "catalog_meta"
+
+    label: Mapped[str] = mapped_column(String, unique=True)
+    revision: Mapped[str] = mapped_column(String)
@@ -17,7 +17,7 @@ class RecipeIngredient(BaseRepr):
 
     item_type_id:   Mapped[int] = mapped_column(ForeignKey("item_types.id"))
     amount:    Mapped[int] = mapped_column(Integer)
-    recipe_id: Mapped[UUID] = mapped_column(ForeignKey("recipes.id"))
+    recipe_id: Mapped[UUID] = mapped_column(ForeignKey("recipes.id"), index=True)
 
     item_type: Mapped["ItemType"] = relationship("ItemType")
 
@@ -27,8 +27,8 @@ class Recipe(BaseRepr):
 
     name: Mapped[str] = mapped_column(String, unique=True)
 
-    building_type_id:    Mapped[UUID] = mapped_column(ForeignKey("building_types.id"))
-    output_item_type_id: Mapped[UUID] = mapped_column(ForeignKey("item_types.id"))
+    building_type_id:    Mapped[UUID] = mapped_column(ForeignKey("building_types.id"), index=True)
+    output_item_type_id: Mapped[UUID] = mapped_column(ForeignKey("item_types.id"), index=True)
     output_amount:       Mapped[int] = mapped_column(Integer)
 
     ingredients:   Mapped[list["RecipeIngredient"]] = relationship(
@@ -0,0 +1,16 @@
+# src/database/models/schema.py
+from __future__ import annotations
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseRepr
+
+class SchemaMeta(BaseRepr):
+    """
+    Fingerprints of every schema version applied to this database, so
+    startup can skip DDL inspection when the models have not changed.
+    """
+    __tablename__ = "schema_meta"
+
+    fingerprint: Mapped[str] = mapped_column(String, index=True)
@@ -1,7 +1,7 @@
 # src/database/models/seed.py
 from __future__ import annotations
 
-from sqlalchemy import String
+from sqlalchemy import String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import BaseRepr
@@ -13,5 +13,21 @@ class SeedMeta(BaseRepr):
     """
     __tablename__ = "seed_meta"
 
-    file_sha: Mapped[str] = mapped_column(String)
+    file_sha: Mapped[str] = mapped_column(String, unique=True)
     file_path: Mapped[str] = mapped_column(String)
+
+
+class SeedEntry(BaseRepr):
+    """
+    Content hash of one entry of a seed file, so a changed file only
+    re-applies the entries that were added, edited or removed.
+    """
+    __tablename__ = "seed_entries"
+
+    seed: Mapped[str] = mapped_column(String, index=True)
+    name: Mapped[str] = mapped_column(String)
+    entry_sha: Mapped[str] = mapped_column(String)
+
+    __table_args__ = (
+        UniqueConstraint("seed", "name", name="uq_seed_entry"),
+    )
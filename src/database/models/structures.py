@@ -4,7 +4,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from sqlalchemy_utils import UUIDType
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Index, Integer, String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseRepr
@@ -22,12 +22,14 @@ class StructureType(BaseRepr):
         UUIDType(binary=True),
         ForeignKey("item_types.id"),
         nullable=False,
+        index=True,
     )
     max_items: Mapped[int] = mapped_column(Integer)
     item_to_engage_id: Mapped[UUID] = mapped_column(
         UUIDType(binary=True),
         ForeignKey("item_types.id"), 
-        nullable=True
+        nullable=True,
+        index=True,
     )
 
     # Specify which FK to use for each relationship
@@ -51,4 +53,8 @@ class Structure(BaseRepr):
     x: Mapped[int] = mapped_column(Integer)
     y: Mapped[int] = mapped_column(Integer)
 
-    type: Mapped[StructureType] = relationship("StructureType")
\ No newline at end of file
+    type: Mapped[StructureType] = relationship("StructureType")
+
+    __table_args__ = (
+        Index("ix_structures_x_y", "x", "y"),
+    )
\ No newline at end of file
@@ -0,0 +1,68 @@
+# src/database/schema.py
+import asyncio
+import hashlib
+
+from sqlalchemy import MetaData, func, insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.database.models import Base, SchemaMeta
+
+# Arbitrary constant identifying the schema apply lock on PostgreSQL
+SCHEMA_LOCK_KEY = 0x5C4E3A
+
+_lock = asyncio.Lock()
+
+
+def schema_fingerprint(metadata: MetaData, dialect) -> str:
+    """Hash of the DDL `create_all` would emit for `metadata` on `dialect`."""
+    ddl = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)).strip())
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+def _create_all(conn, metadata: MetaData) -> None:
+    """`create_all` plus the indexes it skips on tables that already exist."""
+    metadata.create_all(conn)
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+async def _is_applied(engine: AsyncEngine, fingerprint: str) -> bool:
+    stmt = select(SchemaMeta.id).where(SchemaMeta.fingerprint == fingerprint).limit(1)
+    try:
+        async with engine.connect() as conn:
+            return (await conn.execute(stmt)).first() is not None
+    except DBAPIError:
+        # first boot: schema_meta does not exist yet
+        return False
+
+
+async def ensure_schema(engine: AsyncEngine, metadata: MetaData = Base.metadata) -> bool:
+    """
+    Create missing tables and indexes unless this exact schema was applied before.
+    Warm starts cost a single indexed SELECT; otherwise `create_all` runs
+    under a lock (per process, plus an advisory lock on PostgreSQL so
+    concurrently booting workers apply it once) and the fingerprint is recorded.
+    Returns whether DDL was applied.
+    """
+    fingerprint = schema_fingerprint(metadata, engine.dialect)
+    if await _is_applied(engine, fingerprint):
+        return False
+
+    async with _lock:
+        async with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execute(select(func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY)))
+
+            await conn.run_sync(_create_all, metadata)
+
+            stmt = select(SchemaMeta.id).where(SchemaMeta.fingerprint == fingerprint).limit(1)
+            if (await conn.execute(stmt)).first() is None:
+                await conn.execute(insert(SchemaMeta).values(fingerprint=fingerprint))
+    return True
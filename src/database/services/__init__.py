@@ -1,5 +1,5 @@
 # src/database/services/__init__.py
-from .clients import ClientService
+from .clients import ClientService, ClientIdentity, get_token_cache
 from .items import ItemTypeService
 from .structures import StructureTypeService
 from .bots import BotRecipeService, BotTypeService
@@ -7,7 +7,7 @@ from .buildings import BuildingTypeService
 from .recipes import RecipeService
 
 __all__ = [
-    "ClientService",
+    "ClientService", "ClientIdentity", "get_token_cache",
     "ItemTypeService",
     "StructureTypeService",
     "BotRecipeService", "BotTypeService",
@@ -4,12 +4,21 @@ from typing import Sequence, Optional
 from fastapi import HTTPException
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
 import strawberry
 
-from src.database.models import BotType as BotTypeModel, BotRecipe as BotRecipeModel
+from src.database.models import (
+    BotType as BotTypeModel,
+    BotRecipe as BotRecipeModel,
+    ItemType as ItemTypeModel,
+)
 from src.graphql.inputs import BotTypeInput
 from src.graphql.scalars import UUID
-from src.database import eager_load_all
+from src.broker import publish_changes
+from src.database.catalog import load_catalog
+from src.database.services.bulk import ensure_exist, write_many
+from src.database.services.pagination import OrderBy, PageKey, keyset_page
 
 class BotRecipeService:
     @staticmethod
@@ -43,6 +52,8 @@ class BotRecipeService:
         db.add(recipe)
         await db.commit()
         await db.refresh(recipe)
+        await load_catalog("BotType")
+        publish_changes("BotType", "UPDATED", [recipe.bot_type_id])
         return recipe
 
     @staticmethod
@@ -58,6 +69,8 @@ class BotRecipeService:
 
         await db.commit()
         await db.refresh(recipe)
+        await load_catalog("BotType")
+        publish_changes("BotType", "UPDATED", [recipe.bot_type_id])
         return recipe
 
     @staticmethod
@@ -65,20 +78,16 @@ class BotRecipeService:
         recipe = await BotRecipeService.get_by_id(db, recipe_id)
         await db.delete(recipe)
         await db.commit()
+        await load_catalog("BotType")
+        publish_changes("BotType", "UPDATED", [recipe.bot_type_id])
         return True
 
-    @staticmethod
-    async def upsert_from_dict(db: AsyncSession, data: dict) -> Optional[BotRecipeModel]:
-        recipe = BotRecipeModel(**data)
-        db.add(recipe)
-        await db.commit()
-        await db.refresh(recipe)
-        return recipe
-
 class BotTypeService:
     @staticmethod
-    async def get_by_id(db: AsyncSession, bot_type_id: UUID) -> BotTypeModel:
-        stmt = select(BotTypeModel).where(BotTypeModel.id == bot_type_id).options(*eager_load_all(BotTypeModel, depth=2))
+    async def get_by_id(
+        db: AsyncSession, bot_type_id: UUID, options: Sequence[ExecutableOption] = ()
+    ) -> BotTypeModel:
+        stmt = select(BotTypeModel).where(BotTypeModel.id == bot_type_id).options(*options)
         result = await db.execute(stmt)
         bottype = result.scalar_one_or_none()
         if not bottype:
@@ -87,14 +96,27 @@ class BotTypeService:
     
     @staticmethod
     async def get_by_name(db: AsyncSession, bottype_name: str) -> Optional[BotTypeModel]:
-        stmt = select(BotTypeModel).where(BotTypeModel.name == bottype_name).options(*eager_load_all(BotTypeModel, depth=2))
+        stmt = select(BotTypeModel).where(BotTypeModel.name == bottype_name)
         bottype = await db.execute(stmt)
         return bottype.scalar_one_or_none()
 
     @staticmethod
-    async def list_all(db: AsyncSession) -> Sequence[BotTypeModel]:
-        result = await db.execute(select(BotTypeModel).options(*eager_load_all(BotTypeModel, depth=2)))
+    async def list_all(
+        db: AsyncSession, options: Sequence[ExecutableOption] = ()
+    ) -> Sequence[BotTypeModel]:
+        result = await db.execute(select(BotTypeModel).options(*options))
         return result.scalars().all()
+
+    @staticmethod
+    async def list_page(
+        db: AsyncSession,
+        first: int,
+        after: Optional[PageKey] = None,
+        options: Sequence[ExecutableOption] = (),
+        where: Sequence[ColumnElement[bool]] = (),
+        order_by: OrderBy = (),
+    ) -> tuple[list[BotTypeModel], bool]:
+        return await keyset_page(db, BotTypeModel, first, after, options, where, order_by)
     
     @staticmethod
     async def create(db: AsyncSession, data: BotTypeInput) -> BotTypeModel:
@@ -112,7 +134,7 @@ class BotTypeService:
             db.add(
                 BotRecipeModel(
                     bot_type_id=bottype.id,
-                    item_id=recipe.item_type_id,
+                    item_type_id=recipe.item_type_id,
                     amount=recipe.amount,
                 )
             )
@@ -120,8 +142,49 @@ class BotTypeService:
         db.add(bottype)
         await db.commit()
         await db.refresh(bottype)
+        await load_catalog("BotType")
+        publish_changes("BotType", "CREATED", [bottype.id])
         return bottype
     
+    @staticmethod
+    async def create_many(db: AsyncSession, data: Sequence[BotTypeInput]) -> Sequence[BotTypeModel]:
+        return await BotTypeService._write_many(db, data, upsert=False)
+
+    @staticmethod
+    async def upsert_many(db: AsyncSession, data: Sequence[BotTypeInput]) -> Sequence[BotTypeModel]:
+        return await BotTypeService._write_many(db, data, upsert=True)
+
+    @staticmethod
+    async def _write_many(
+        db: AsyncSession, data: Sequence[BotTypeInput], upsert: bool
+    ) -> Sequence[BotTypeModel]:
+        await ensure_exist(
+            db,
+            ItemTypeModel,
+            [r.item_type_id for b in data for r in b.bot_recipes or []],
+            "ItemType",
+        )
+        rows = [
+            {
+                "name": b.name,
+                "health": b.health,
+                "strength": b.strength,
+                "speed": b.speed,
+                "vision": b.vision,
+            }
+            for b in data
+        ]
+        recipes = [
+            None if b.bot_recipes is None
+            else [{"item_type_id": r.item_type_id, "amount": r.amount} for r in b.bot_recipes]
+            for b in data
+        ]
+        return await write_many(
+            db, BotTypeModel, "BotType", rows,
+            upsert=upsert,
+            children=[(BotRecipeModel, "bot_type_id", recipes)],
+        )
+
     @staticmethod
     async def update(
         db: AsyncSession, bottype_id: UUID, data: BotTypeInput
@@ -151,7 +214,7 @@ class BotTypeService:
                 db.add(
                     BotRecipeModel(
                         bot_type_id=bottype.id,
-                        item_id=recipe.item_type_id,
+                        item_type_id=recipe.item_type_id,
                         amount=recipe.amount,
                     )
                 )
@@ -159,6 +222,8 @@ class BotTypeService:
         await db.commit()
         
         await db.refresh(bottype)
+        await load_catalog("BotType")
+        publish_changes("BotType", "UPDATED", [bottype.id])
         return bottype
 
     @staticmethod
@@ -166,15 +231,6 @@ class BotTypeService:
         bottype = await BotTypeService.get_by_id(db, bottype_id)
         await db.delete(bottype)
         await db.commit()
-        return True
-    
-    @staticmethod
-    async def upsert_from_dict(db: AsyncSession, data: dict) -> Optional[BotTypeModel]:
-        if await BotTypeService.get_by_name(db, data.get("name", "")) is not None:
-            return None
-
-        instance = BotTypeModel(**data)
-        db.add(instance)
-        await db.commit()
-        await db.refresh(instance)
-        return instance
\ No newline at end of file
+        await load_catalog("BotType")
+        publish_changes("BotType", "DELETED", [bottype_id])
+        return True
\ No newline at end of file
@@ -4,18 +4,28 @@ from typing import Sequence, Optional
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
 import strawberry
 
-from src.database.models import BuildingType as BuildingTypeModel, BuildingRecipe as BuildingRecipeModel
-from src.database.services import ItemTypeService
+from src.database.models import (
+    BuildingType as BuildingTypeModel,
+    BuildingRecipe as BuildingRecipeModel,
+    ItemType as ItemTypeModel,
+)
 from src.graphql.inputs import BuildingTypeInput
 from src.graphql.scalars import UUID
-from src.database import eager_load_all
+from src.broker import publish_changes
+from src.database.catalog import load_catalog
+from src.database.services.bulk import ensure_exist, write_many
+from src.database.services.pagination import OrderBy, PageKey, keyset_page
 
 class BuildingTypeService:
     @staticmethod
-    async def get_by_id(db: AsyncSession, building_type_id: UUID) -> BuildingTypeModel:
-        stmt = select(BuildingTypeModel).where(BuildingTypeModel.id == building_type_id).options(*eager_load_all(BuildingTypeModel, depth=2))
+    async def get_by_id(
+        db: AsyncSession, building_type_id: UUID, options: Sequence[ExecutableOption] = ()
+    ) -> BuildingTypeModel:
+        stmt = select(BuildingTypeModel).where(BuildingTypeModel.id == building_type_id).options(*options)
         result = await db.execute(stmt)
         building_type = result.scalar_one_or_none()
         if not building_type:
@@ -24,15 +34,28 @@ class BuildingTypeService:
 
     @staticmethod
     async def get_by_name(db: AsyncSession, building_type_name: str) -> Optional[BuildingTypeModel]:
-        stmt = select(BuildingTypeModel).where(BuildingTypeModel.name == building_type_name).options(*eager_load_all(BuildingTypeModel, depth=2))
+        stmt = select(BuildingTypeModel).where(BuildingTypeModel.name == building_type_name)
         building_type = await db.execute(stmt)
         return building_type.scalar_one_or_none()
 
     @staticmethod
-    async def list_all(db: AsyncSession) -> Sequence[BuildingTypeModel]:
-        result = await db.execute(select(BuildingTypeModel).options(*eager_load_all(BuildingTypeModel, depth=2)))
+    async def list_all(
+        db: AsyncSession, options: Sequence[ExecutableOption] = ()
+    ) -> Sequence[BuildingTypeModel]:
+        result = await db.execute(select(BuildingTypeModel).options(*options))
         return result.scalars().all()
 
+    @staticmethod
+    async def list_page(
+        db: AsyncSession,
+        first: int,
+        after: Optional[PageKey] = None,
+        options: Sequence[ExecutableOption] = (),
+        where: Sequence[ColumnElement[bool]] = (),
+        order_by: OrderBy = (),
+    ) -> tuple[list[BuildingTypeModel], bool]:
+        return await keyset_page(db, BuildingTypeModel, first, after, options, where, order_by)
+
     @staticmethod
     async def create(db: AsyncSession, data: BuildingTypeInput) -> BuildingTypeModel:
         if await BuildingTypeService.get_by_name(db, data.name) is not None:
@@ -40,28 +63,56 @@ class BuildingTypeService:
 
         building_type = BuildingTypeModel(name=data.name, health=data.health)
         db.add(building_type)
+        await db.flush()
+
+        for recipe in data.building_recipes or []:
+            db.add(
+                BuildingRecipeModel(
+                    building_type_id=building_type.id,
+                    item_type_id=recipe.item_type_id,
+                    amount=recipe.amount
+                )
+            )
+        # one commit, catalog reload and CREATED event with the recipes in place
         await db.commit()
         await db.refresh(building_type)
+        await load_catalog("BuildingType")
+        publish_changes("BuildingType", "CREATED", [building_type.id])
         return building_type
-    
+
     @staticmethod
-    async def create_with_recipes(db: AsyncSession, data: BuildingTypeInput) -> BuildingTypeModel:
-        building_type = await BuildingTypeService.create(db, data)
-
-        if data.building_recipes:
-            for recipe in data.building_recipes:
-                db.add(
-                    BuildingRecipeModel(
-                        building_type_id=building_type.id,
-                        item_type_id=recipe.item_type_id,
-                        amount=recipe.amount
-                    )
-                )
-            await db.commit()
-            await db.refresh(building_type)
+    async def create_many(
+        db: AsyncSession, data: Sequence[BuildingTypeInput]
+    ) -> Sequence[BuildingTypeModel]:
+        return await BuildingTypeService._write_many(db, data, upsert=False)
 
-        return building_type
+    @staticmethod
+    async def upsert_many(
+        db: AsyncSession, data: Sequence[BuildingTypeInput]
+    ) -> Sequence[BuildingTypeModel]:
+        return await BuildingTypeService._write_many(db, data, upsert=True)
 
+    @staticmethod
+    async def _write_many(
+        db: AsyncSession, data: Sequence[BuildingTypeInput], upsert: bool
+    ) -> Sequence[BuildingTypeModel]:
+        await ensure_exist(
+            db,
+            ItemTypeModel,
+            [r.item_type_id for b in data for r in b.building_recipes or []],
+            "ItemType",
+        )
+        rows = [{"name": b.name, "health": b.health} for b in data]
+        recipes = [
+            None if b.building_recipes is None
+            else [{"item_type_id": r.item_type_id, "amount": r.amount} for r in b.building_recipes]
+            for b in data
+        ]
+        return await write_many(
+            db, BuildingTypeModel, "BuildingType", rows,
+            upsert=upsert,
+            children=[(BuildingRecipeModel, "building_type_id", recipes)],
+        )
 
     @staticmethod
     async def update(db: AsyncSession, building_type_id: UUID, data: BuildingTypeInput) -> BuildingTypeModel:
@@ -74,6 +125,8 @@ class BuildingTypeService:
 
         await db.commit()
         await db.refresh(building_type)
+        await load_catalog("BuildingType")
+        publish_changes("BuildingType", "UPDATED", [building_type.id])
         return building_type
 
     @staticmethod
@@ -81,31 +134,6 @@ class BuildingTypeService:
         building_type = await BuildingTypeService.get_by_id(db, building_type_id)
         await db.delete(building_type)
         await db.commit()
+        await load_catalog("BuildingType")
+        publish_changes("BuildingType", "DELETED", [building_type_id])
         return True
-
-    @staticmethod
-    async def upsert_from_dict(db: AsyncSession, data: dict) -> Optional[BuildingTypeModel]:
-        building_type = await BuildingTypeService.get_by_name(db, data.get("name", ""))
-        if building_type:
-            return None
-
-        building_type = BuildingTypeModel(name=data["name"], health=data["health"])
-        db.add(building_type)
-        await db.commit()
-        await db.refresh(building_type)
-
-        for recipe in data.get("recipes", []):
-            item_type = await ItemTypeService.get_by_name(db, recipe["item_type"])
-            if item_type is None:
-                raise RuntimeError(f'ItemType "{recipe["item_type"]}" not found')
-
-            db.add(
-                BuildingRecipeModel(
-                    building_type_id=building_type.id,
-                    item_type_id=item_type.id,
-                    amount=recipe["amount"],
-                )
-            )
-
-        await db.commit()
-        return building_type
@@ -0,0 +1,91 @@
+# src/database/services/bulk.py
+import uuid
+from collections import Counter
+from typing import Any, Iterable, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.broker import publish_changes
+from src.database.catalog import load_catalog
+from src.database.upsert import upsert_rows
+
+
+async def ensure_exist(db: AsyncSession, model, ids: Iterable[Any], label: str) -> None:
+    """One `SELECT id ... WHERE id IN (...)` covering every referenced row of `model`."""
+    wanted = {id for id in ids if id is not None}
+    if not wanted:
+        return
+    found = set((await db.execute(select(model.id).where(model.id.in_(wanted)))).scalars())
+    if wanted - found:
+        raise HTTPException(status_code=404, detail=f"{label} not found")
+
+
+async def replace_children(db: AsyncSession, model, parent_key: str, rows_by_parent: dict[Any, list[dict]]) -> None:
+    """Drop the `model` rows of the given parents and insert the new ones in one statement."""
+    if not rows_by_parent:
+        return
+    parent_column = getattr(model, parent_key)
+    await db.execute(delete(model).where(parent_column.in_(list(rows_by_parent))))
+    rows = [
+        {**row, parent_key: parent_id}
+        for parent_id, children in rows_by_parent.items()
+        for row in children
+    ]
+    if rows:
+        await db.execute(insert(model), rows)
+
+
+async def write_many(
+    db: AsyncSession,
+    model,
+    label: str,
+    rows: list[dict],
+    *,
+    upsert: bool,
+    children: Sequence[tuple[Any, str, list[Optional[list[dict]]]]] = (),
+) -> list:
+    """
+    Insert (or, with `upsert`, insert-or-update by name) many rows of `model`
+    in one transaction, using one statement per table instead of one per row.
+
+    `children` lists `(child model, parent fk key, per-row child dicts)`; a row's
+    children replace the existing ones, `None` leaves them untouched.
+    Returns the written rows in input order.
+    """
+    if not rows:
+        return []
+
+    names = [row["name"] for row in rows]
+    duplicates = [name for name, count in Counter(names).items() if count > 1]
+    if duplicates:
+        raise HTTPException(status_code=403, detail=f"{label} {duplicates[0]!r} is given more than once")
+
+    if upsert:
+        written = await upsert_rows(db, model, rows)
+    else:
+        result = await db.execute(select(model.id).where(model.name.in_(names)).limit(1))
+        if result.first() is not None:
+            raise HTTPException(status_code=403, detail=f"{label} with that name already exists")
+        for row in rows:
+            row["id"] = uuid.uuid4()
+        await db.execute(insert(model), rows)
+        written = None
+
+    ids = [instance.id for instance in written] if written is not None else [row["id"] for row in rows]
+    for child_model, parent_key, per_row in children:
+        await replace_children(
+            db, child_model, parent_key,
+            {id: items for id, items in zip(ids, per_row) if items is not None},
+        )
+
+    if written is None:
+        stmt = select(model).where(model.id.in_(ids)).execution_options(populate_existing=True)
+        by_id = {instance.id: instance for instance in (await db.scalars(stmt))}
+        written = [by_id[id] for id in ids]
+
+    await db.commit()
+    await load_catalog(label)
+    publish_changes(label, "UPSERTED" if upsert else "CREATED", ids)
+    return written
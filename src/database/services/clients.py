@@ -1,15 +1,44 @@
 # src/database/services/clients.py
 import secrets
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Sequence, Optional
 
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import LRUCache
+from src.config import get_settings
 from src.database.models import Client as ClientModel
 from src.graphql.inputs import ClientCreateInput, ClientUpdateInput
 from src.graphql.scalars import UUID
 
+@dataclass(frozen=True)
+class ClientIdentity:
+    """Detached, cacheable snapshot of the columns `current_client` needs."""
+    id: UUID
+    name: str
+    _token: str
+    created_at: datetime
+
+    @classmethod
+    def from_model(cls, client: ClientModel) -> "ClientIdentity":
+        return cls(
+            id=client.id,
+            name=client.name,
+            _token=client._token,
+            created_at=client.created_at,
+        )
+
+_token_cache = None
+def get_token_cache() -> LRUCache:
+    global _token_cache
+    if _token_cache is None:
+        settings = get_settings()
+        _token_cache = LRUCache(maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl)
+    return _token_cache
+
 class ClientService:
     @staticmethod
     async def get_by_id(db: AsyncSession, client_id: UUID) -> ClientModel:
@@ -26,6 +55,20 @@ class ClientService:
         
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_identity_by_token(db: AsyncSession, token: str) -> Optional[ClientIdentity]:
+        identity = get_token_cache().get(token)
+        if identity is not None:
+            return identity
+
+        client = await ClientService.get_by_token(db, token)
+        if client is None:
+            return None
+
+        identity = ClientIdentity.from_model(client)
+        get_token_cache().set(token, identity)
+        return identity
+
     @staticmethod
     async def get_by_name(db: AsyncSession, name: str) -> Optional[ClientModel]:
         stmt = select(ClientModel).where(ClientModel.name == name)
@@ -62,6 +105,7 @@ class ClientService:
             client.name = data.name
 
         await db.commit()
+        get_token_cache().pop(client._token)
         await db.refresh(client)
 
         return client
@@ -71,4 +115,5 @@ class ClientService:
         client = await ClientService.get_by_id(db, client_id)
         await db.delete(client)
         await db.commit()
+        get_token_cache().pop(client._token)
         return True
\ No newline at end of file
@@ -4,16 +4,24 @@ from typing import Sequence, Optional
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
 import strawberry
 
 from src.database.models import ItemType as ItemTypeModel
 from src.graphql.inputs import ItemTypeInput
 from src.graphql.scalars import UUID
+from src.broker import publish_changes
+from src.database.catalog import load_catalog
+from src.database.services.bulk import write_many
+from src.database.services.pagination import OrderBy, PageKey, keyset_page
 
 class ItemTypeService:
     @staticmethod
-    async def get_by_id(db: AsyncSession, item_type_id: UUID) -> ItemTypeModel:
-        itemtype = await db.get(ItemTypeModel, item_type_id)
+    async def get_by_id(
+        db: AsyncSession, item_type_id: UUID, options: Sequence[ExecutableOption] = ()
+    ) -> ItemTypeModel:
+        itemtype = await db.get(ItemTypeModel, item_type_id, options=options)
         if not itemtype:
             raise HTTPException(status_code=404, detail="ItemType not found")
         return itemtype
@@ -24,18 +32,48 @@ class ItemTypeService:
         return (await db.execute(stmt)).scalar_one_or_none()
 
     @staticmethod
-    async def list_all(db: AsyncSession) -> Sequence[ItemTypeModel]:
-        result = await db.execute(select(ItemTypeModel))
+    async def list_all(
+        db: AsyncSession, options: Sequence[ExecutableOption] = ()
+    ) -> Sequence[ItemTypeModel]:
+        result = await db.execute(select(ItemTypeModel).options(*options))
         return result.scalars().all()
 
+    @staticmethod
+    async def list_page(
+        db: AsyncSession,
+        first: int,
+        after: Optional[PageKey] = None,
+        options: Sequence[ExecutableOption] = (),
+        where: Sequence[ColumnElement[bool]] = (),
+        order_by: OrderBy = (),
+    ) -> tuple[list[ItemTypeModel], bool]:
+        return await keyset_page(db, ItemTypeModel, first, after, options, where, order_by)
+
     @staticmethod
     async def create(db: AsyncSession, data: ItemTypeInput) -> ItemTypeModel:
         itemtype = ItemTypeModel(name=data.name, durability=data.durability)
         db.add(itemtype)
         await db.commit()
         await db.refresh(itemtype)
+        await load_catalog("ItemType")
+        publish_changes("ItemType", "CREATED", [itemtype.id])
         return itemtype
 
+    @staticmethod
+    async def create_many(db: AsyncSession, data: Sequence[ItemTypeInput]) -> Sequence[ItemTypeModel]:
+        return await ItemTypeService._write_many(db, data, upsert=False)
+
+    @staticmethod
+    async def upsert_many(db: AsyncSession, data: Sequence[ItemTypeInput]) -> Sequence[ItemTypeModel]:
+        return await ItemTypeService._write_many(db, data, upsert=True)
+
+    @staticmethod
+    async def _write_many(
+        db: AsyncSession, data: Sequence[ItemTypeInput], upsert: bool
+    ) -> Sequence[ItemTypeModel]:
+        rows = [{"name": item.name, "durability": item.durability} for item in data]
+        return await write_many(db, ItemTypeModel, "ItemType", rows, upsert=upsert)
+
     @staticmethod
     async def update(
         db: AsyncSession, item_type_id: UUID, data: ItemTypeInput
@@ -50,6 +88,8 @@ class ItemTypeService:
         await db.commit()
         
         await db.refresh(itemtype)
+        await load_catalog("ItemType")
+        publish_changes("ItemType", "UPDATED", [itemtype.id])
         return itemtype
 
     @staticmethod
@@ -57,15 +97,6 @@ class ItemTypeService:
         itemtype = await ItemTypeService.get_by_id(db, item_type_id)
         await db.delete(itemtype)
         await db.commit()
-        return True
-    
-    @staticmethod
-    async def upsert_from_dict(db: AsyncSession, data: dict) -> Optional[ItemTypeModel]:
-        if await ItemTypeService.get_by_name(db, data.get("name", "")) is not None:
-            return None
-        
-        instance = ItemTypeModel(**data)
-        db.add(instance)
-        await db.commit()
-        await db.refresh(instance)
-        return instance
\ No newline at end of file
+        await load_catalog("ItemType")
+        publish_changes("ItemType", "DELETED", [item_type_id])
+        return True
\ No newline at end of file
@@ -0,0 +1,64 @@
+# src/database/services/pagination.py
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
+
+# (column name, descending) pairs a page is ordered by
+OrderBy = Sequence[tuple[str, bool]]
+# values of the sort keys of the last row of the previous page
+PageKey = Sequence[Any]
+
+
+def sort_keys(order_by: OrderBy = ()) -> list[tuple[str, bool]]:
+    """`order_by` completed with `created_at` and `id`, so every row has a unique position."""
+    keys = list(order_by)
+    for name in ("created_at", "id"):
+        if name not in (key for key, _ in keys):
+            keys.append((name, False))
+    return keys
+
+
+def _after(model, keys: list[tuple[str, bool]], values: PageKey) -> ColumnElement[bool]:
+    """Rows sorting after `values`: `(a > x) OR (a = x AND b > y) OR ...`, flipped for descending keys."""
+    clauses = []
+    for i, ((name, descending), value) in enumerate(zip(keys, values)):
+        column = getattr(model, name)
+        ties = [getattr(model, tie) == tie_value for (tie, _), tie_value in zip(keys[:i], values)]
+        clauses.append(and_(*ties, column < value if descending else column > value))
+    return or_(*clauses)
+
+
+async def keyset_page(
+    db: AsyncSession,
+    model,
+    first: int,
+    after: Optional[PageKey] = None,
+    options: Sequence[ExecutableOption] = (),
+    where: Sequence[ColumnElement[bool]] = (),
+    order_by: OrderBy = (),
+) -> tuple[list, bool]:
+    """
+    Up to `first` rows of `model` matching `where`, ordered by `sort_keys(order_by)`
+    and starting right after the `after` key values. One extra row is read to
+    tell whether another page follows, so no COUNT is needed.
+    Returns `(rows, has_next_page)`.
+    """
+    keys = sort_keys(order_by)
+    stmt = (
+        select(model)
+        .options(*options)
+        .where(*where)
+        .order_by(*(
+            getattr(model, name).desc() if descending else getattr(model, name)
+            for name, descending in keys
+        ))
+        .limit(first + 1)
+    )
+    if after is not None:
+        stmt = stmt.where(_after(model, keys, after))
+
+    rows = list((await db.execute(stmt)).scalars())
+    return rows[:first], len(rows) > first
@@ -4,19 +4,31 @@ from typing import Sequence, Optional
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
 import strawberry
 
-from src.database.models import Recipe as RecipeModel, RecipeIngredient as RecipeIngredientModel
-from src.database.services import ItemTypeService
+from src.database.models import (
+    Recipe as RecipeModel,
+    RecipeIngredient as RecipeIngredientModel,
+    BuildingType as BuildingTypeModel,
+    ItemType as ItemTypeModel,
+)
 from src.graphql.inputs import RecipeInput
 from src.graphql.scalars import UUID
-from src.database import eager_load_all
+from src.broker import publish_changes
+from src.database.catalog import load_catalog
+from src.database.services.bulk import ensure_exist, write_many
+from src.database.services.pagination import OrderBy, PageKey, keyset_page
 
 
 class RecipeService:
     @staticmethod
-    async def get_by_id(db: AsyncSession, recipe_id: UUID) -> RecipeModel:
-        stmt = select(RecipeModel).where(RecipeModel.id == recipe_id).options(*eager_load_all(RecipeModel, depth=2))
+    async def get_by_id(
+        db: AsyncSession, recipe_id: UUID, options: Sequence[ExecutableOption] = ()
+    ) -> RecipeModel:
+        stmt = select(RecipeModel).where(RecipeModel.id == recipe_id).options(*options)
         result = await db.execute(stmt)
         recipe = result.scalar_one_or_none()
         if not recipe:
@@ -25,15 +37,28 @@ class RecipeService:
 
     @staticmethod
     async def get_by_name(db: AsyncSession, recipe_name: str) -> Optional[RecipeModel]:
-        stmt = select(RecipeModel).where(RecipeModel.name == recipe_name).options(*eager_load_all(RecipeModel, depth=2))
+        stmt = select(RecipeModel).where(RecipeModel.name == recipe_name)
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def list_all(db: AsyncSession) -> Sequence[RecipeModel]:
-        result = await db.execute(select(RecipeModel).options(*eager_load_all(RecipeModel, depth=2)))
+    async def list_all(
+        db: AsyncSession, options: Sequence[ExecutableOption] = ()
+    ) -> Sequence[RecipeModel]:
+        result = await db.execute(select(RecipeModel).options(*options))
         return result.scalars().all()
 
+    @staticmethod
+    async def list_page(
+        db: AsyncSession,
+        first: int,
+        after: Optional[PageKey] = None,
+        options: Sequence[ExecutableOption] = (),
+        where: Sequence[ColumnElement[bool]] = (),
+        order_by: OrderBy = (),
+    ) -> tuple[list[RecipeModel], bool]:
+        return await keyset_page(db, RecipeModel, first, after, options, where, order_by)
+
     @staticmethod
     async def create(db: AsyncSession, data: RecipeInput) -> RecipeModel:
         if await RecipeService.get_by_name(db, data.name) is not None:
@@ -59,11 +84,67 @@ class RecipeService:
 
         await db.commit()
         await db.refresh(recipe)
+        await load_catalog("Recipe")
+        publish_changes("Recipe", "CREATED", [recipe.id])
+        # building types embed their recipes
+        publish_changes("BuildingType", "UPDATED", [recipe.building_type_id])
         return recipe
 
+    @staticmethod
+    async def create_many(db: AsyncSession, data: Sequence[RecipeInput]) -> Sequence[RecipeModel]:
+        return await RecipeService._write_many(db, data, upsert=False)
+
+    @staticmethod
+    async def upsert_many(db: AsyncSession, data: Sequence[RecipeInput]) -> Sequence[RecipeModel]:
+        return await RecipeService._write_many(db, data, upsert=True)
+
+    @staticmethod
+    async def _write_many(
+        db: AsyncSession, data: Sequence[RecipeInput], upsert: bool
+    ) -> Sequence[RecipeModel]:
+        await ensure_exist(db, BuildingTypeModel, [r.building_type_id for r in data], "BuildingType")
+        await ensure_exist(
+            db,
+            ItemTypeModel,
+            [r.output_item_type_id for r in data]
+            + [i.item_type_id for r in data for i in r.ingredients or []],
+            "ItemType",
+        )
+        rows = [
+            {
+                "name": r.name,
+                "building_type_id": r.building_type_id,
+                "output_item_type_id": r.output_item_type_id,
+                "output_amount": r.output_amount,
+            }
+            for r in data
+        ]
+        ingredients = [
+            None if r.ingredients is None
+            else [{"item_type_id": i.item_type_id, "amount": i.amount} for i in r.ingredients]
+            for r in data
+        ]
+        # building types embed their recipes, including those an upsert moves away
+        parents = []
+        if upsert:
+            stmt = select(RecipeModel.building_type_id).where(RecipeModel.name.in_([r["name"] for r in rows]))
+            parents.extend((await db.execute(stmt)).scalars())
+
+        recipes = await write_many(
+            db, RecipeModel, "Recipe", rows,
+            upsert=upsert,
+            children=[(RecipeIngredientModel, "recipe_id", ingredients)],
+        )
+        parents.extend(recipe.building_type_id for recipe in recipes)
+        publish_changes("BuildingType", "UPDATED", dict.fromkeys(parents))
+        return recipes
+
     @staticmethod
     async def update(db: AsyncSession, recipe_id: UUID, data: RecipeInput) -> RecipeModel:
-        recipe = await RecipeService.get_by_id(db, recipe_id)
+        recipe = await RecipeService.get_by_id(
+            db, recipe_id, options=[selectinload(RecipeModel.ingredients)]
+        )
+        previous_building_type_id = recipe.building_type_id
 
         if data.name is not strawberry.UNSET:
             recipe.name = data.name
@@ -85,6 +166,11 @@ class RecipeService:
 
         await db.commit()
         await db.refresh(recipe)
+        await load_catalog("Recipe")
+        publish_changes("Recipe", "UPDATED", [recipe.id])
+        publish_changes(
+            "BuildingType", "UPDATED", dict.fromkeys([previous_building_type_id, recipe.building_type_id])
+        )
         return recipe
 
     @staticmethod
@@ -92,34 +178,7 @@ class RecipeService:
         recipe = await RecipeService.get_by_id(db, recipe_id)
         await db.delete(recipe)
         await db.commit()
-        return True
-
-    @staticmethod
-    async def upsert_from_dict(db: AsyncSession, data: dict) -> Optional[RecipeModel]:
-        recipe = await RecipeService.get_by_name(db, data["name"])
-        if recipe:
-            return None
-
-        recipe = RecipeModel(
-            name=data["name"],
-            building_type_id=data["building_type_id"],
-            output_item_type_id=data["output_item_type_id"],
-            output_amount=data["output_amount"]
-        )
-        db.add(recipe)
-        await db.commit()
-        await db.refresh(recipe)
-
-        for ing in data.get("ingredients", []):
-            item_type = await ItemTypeService.get_by_name(db, ing["item_type"])
-            if item_type is None:
-                raise RuntimeError(f'ItemType "{ing["item_type"]}" not found')
-
-            db.add(RecipeIngredientModel(
-                recipe_id=recipe.id,
-                item_type_id=item_type.id,
-                amount=ing["amount"]
-            ))
-
-        await db.commit()
-        return recipe
\ No newline at end of file
+        await load_catalog("Recipe")
+        publish_changes("Recipe", "DELETED", [recipe_id])
+        publish_changes("BuildingType", "UPDATED", [recipe.building_type_id])
+        return True
\ No newline at end of file
@@ -4,16 +4,24 @@ from typing import Sequence, Optional
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnElement
 import strawberry
 
-from src.database.models import StructureType as StructureTypeModel
+from src.database.models import StructureType as StructureTypeModel, ItemType as ItemTypeModel
 from src.graphql.inputs import StructureTypeInput
 from src.graphql.scalars import UUID
+from src.broker import publish_changes
+from src.database.catalog import load_catalog
+from src.database.services.bulk import ensure_exist, write_many
+from src.database.services.pagination import OrderBy, PageKey, keyset_page
 
 class StructureTypeService:
     @staticmethod
-    async def get_by_id(db: AsyncSession, structure_type_id: UUID) -> StructureTypeModel:
-        structuretype = await db.get(StructureTypeModel, structure_type_id)
+    async def get_by_id(
+        db: AsyncSession, structure_type_id: UUID, options: Sequence[ExecutableOption] = ()
+    ) -> StructureTypeModel:
+        structuretype = await db.get(StructureTypeModel, structure_type_id, options=options)
         if not structuretype:
             raise HTTPException(status_code=404, detail="StructureType not found")
         return structuretype
@@ -24,9 +32,22 @@ class StructureTypeService:
         return (await db.execute(stmt)).scalar_one_or_none()
 
     @staticmethod
-    async def list_all(db: AsyncSession) -> Sequence[StructureTypeModel]:
-        result = await db.execute(select(StructureTypeModel))
+    async def list_all(
+        db: AsyncSession, options: Sequence[ExecutableOption] = ()
+    ) -> Sequence[StructureTypeModel]:
+        result = await db.execute(select(StructureTypeModel).options(*options))
         return result.scalars().all()
+
+    @staticmethod
+    async def list_page(
+        db: AsyncSession,
+        first: int,
+        after: Optional[PageKey] = None,
+        options: Sequence[ExecutableOption] = (),
+        where: Sequence[ColumnElement[bool]] = (),
+        order_by: OrderBy = (),
+    ) -> tuple[list[StructureTypeModel], bool]:
+        return await keyset_page(db, StructureTypeModel, first, after, options, where, order_by)
     
     @staticmethod
     async def create(db: AsyncSession, data: StructureTypeInput) -> StructureTypeModel:
@@ -40,8 +61,44 @@ class StructureTypeService:
         db.add(structuretype)
         await db.commit()
         await db.refresh(structuretype)
+        await load_catalog("StructureType")
+        publish_changes("StructureType", "CREATED", [structuretype.id])
         return structuretype
     
+    @staticmethod
+    async def create_many(
+        db: AsyncSession, data: Sequence[StructureTypeInput]
+    ) -> Sequence[StructureTypeModel]:
+        return await StructureTypeService._write_many(db, data, upsert=False)
+
+    @staticmethod
+    async def upsert_many(
+        db: AsyncSession, data: Sequence[StructureTypeInput]
+    ) -> Sequence[StructureTypeModel]:
+        return await StructureTypeService._write_many(db, data, upsert=True)
+
+    @staticmethod
+    async def _write_many(
+        db: AsyncSession, data: Sequence[StructureTypeInput], upsert: bool
+    ) -> Sequence[StructureTypeModel]:
+        await ensure_exist(
+            db,
+            ItemTypeModel,
+            [s.item_type_id for s in data] + [s.item_to_engage_id for s in data],
+            "ItemType",
+        )
+        rows = [
+            {
+                "name": s.name,
+                "health": s.health,
+                "item_type_id": s.item_type_id,
+                "max_items": s.max_items,
+                "item_to_engage_id": s.item_to_engage_id,
+            }
+            for s in data
+        ]
+        return await write_many(db, StructureTypeModel, "StructureType", rows, upsert=upsert)
+
     @staticmethod
     async def update(
         db: AsyncSession, structure_type_id: UUID, data: StructureTypeInput
@@ -66,6 +123,8 @@ class StructureTypeService:
         await db.commit()
         
         await db.refresh(structuretype)
+        await load_catalog("StructureType")
+        publish_changes("StructureType", "UPDATED", [structuretype.id])
         return structuretype
 
     @staticmethod
@@ -73,15 +132,6 @@ class StructureTypeService:
         structuretype = await StructureTypeService.get_by_id(db, structure_type_id)
         await db.delete(structuretype)
         await db.commit()
-        return True
-    
-    @staticmethod
-    async def upsert_from_dict(db: AsyncSession, data: dict) -> Optional[StructureTypeModel]:
-        if await StructureTypeService.get_by_name(db, data.get("name", "")) is not None:
-            return None
-
-        instance = StructureTypeModel(**data)
-        db.add(instance)
-        await db.commit()
-        await db.refresh(instance)
-        return instance
\ No newline at end of file
+        await load_catalog("StructureType")
+        publish_changes("StructureType", "DELETED", [structure_type_id])
+        return True
\ No newline at end of file
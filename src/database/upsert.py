@@ -0,0 +1,61 @@
+# src/database/upsert.py
+from typing import Sequence, Union
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+async def upsert_rows(
+    db: AsyncSession, model, rows: Union[dict, Sequence[dict]], key: str = "name"
+) -> list:
+    """
+    `INSERT ... ON CONFLICT (<key>) DO UPDATE ... RETURNING` for one row or many,
+    as a single statement against the unique `key` column. Conflicting rows keep
+    their id and `created_at` and take every other given column.
+    Other dialects fall back to one SELECT of the existing keys followed by
+    ORM inserts and updates in the caller's transaction; unlike the native
+    statement, that can fail on a row inserted concurrently by someone else.
+    Returns the written rows as ORM instances, in input order.
+    """
+    rows = [rows] if isinstance(rows, dict) else list(rows)
+    if not rows:
+        return []
+
+    columns = [name for name in rows[0] if name not in ("id", "created_at", key)] or [key]
+    dialect = db.get_bind().dialect.name
+    if dialect not in _DIALECT_INSERTS:
+        return await _upsert_selecting(db, model, rows, key, columns)
+
+    stmt = _DIALECT_INSERTS[dialect](model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[getattr(model, key)],
+        set_={name: stmt.excluded[name] for name in columns},
+    )
+    stmt = stmt.returning(model, sort_by_parameter_order=True)
+    result = await db.scalars(stmt.execution_options(populate_existing=True), rows)
+    return list(result.all())
+
+
+async def _upsert_selecting(db: AsyncSession, model, rows: list[dict], key: str, columns: list[str]) -> list:
+    column = getattr(model, key)
+    result = await db.scalars(select(model).where(column.in_({row[key] for row in rows})))
+    existing = {getattr(instance, key): instance for instance in result}
+
+    written = []
+    for row in rows:
+        instance = existing.get(row[key])
+        if instance is None:
+            instance = existing[row[key]] = model(**row)
+            db.add(instance)
+        else:
+            for name in columns:
+                setattr(instance, name, row[name])
+        written.append(instance)
+    await db.flush()
+    return written
@@ -0,0 +1,18 @@
+# src/graphql/extensions/__init__.py
+from .routing import ReadReplicaRouter
+from .etag import CatalogETag
+from .persisted import PersistedQueries, get_persisted_queries
+from .documents import DocumentCache, get_document_cache
+from .cost import CostAnalysis, QueryCost, get_cost_budget
+
+__all__ = [
+    "ReadReplicaRouter",
+    "CatalogETag",
+    "PersistedQueries",
+    "get_persisted_queries",
+    "DocumentCache",
+    "get_document_cache",
+    "CostAnalysis",
+    "QueryCost",
+    "get_cost_budget",
+]
@@ -0,0 +1,305 @@
+# src/graphql/extensions/cost.py
+import math
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLEnumType,
+    GraphQLError,
+    GraphQLField,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    IntValueNode,
+    SchemaMetaFieldDef,
+    SelectionSetNode,
+    TypeMetaFieldDef,
+    VariableNode,
+    get_named_type,
+)
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionResult
+
+from src.cache import LRUCache
+from src.config import get_settings
+from src.database.catalog import CatalogSnapshot, get_catalog
+
+
+def _average(groups) -> int:
+    groups = list(groups)
+    return math.ceil(sum(len(group) for group in groups) / len(groups)) if groups else 0
+
+
+_estimates: tuple[int, dict] = (0, {})
+
+def row_estimates(catalog: CatalogSnapshot) -> dict[tuple[str, str], int]:
+    """Expected rows of each list field, taken from the catalog snapshot (cached per version)."""
+    global _estimates
+    version, estimates = _estimates
+    if version == catalog.version:
+        return estimates
+
+    estimates = {
+        ("ItemTypeQuery", "all"): len(catalog.item_types.all),
+        ("StructureTypeQuery", "all"): len(catalog.structure_types.all),
+        ("BotTypeQuery", "all"): len(catalog.bot_types.all),
+        ("BuildingTypeQuery", "all"): len(catalog.building_types.all),
+        ("RecipeQuery", "all"): len(catalog.recipes.all),
+        ("BotTypeScheme", "botRecipes"): _average(b.bot_recipes for b in catalog.bot_types.all),
+        ("BuildingTypeScheme", "buildingRecipes"): _average(
+            b.building_recipes for b in catalog.building_types.all
+        ),
+        ("BuildingTypeScheme", "recipes"): _average(b.recipes for b in catalog.building_types.all),
+        ("RecipeScheme", "ingredients"): _average(r.ingredients for r in catalog.recipes.all),
+    }
+    _estimates = (catalog.version, estimates)
+    return estimates
+
+
+# `__schema` / `__type` are not in the root type's field map
+_META_FIELDS = {"__schema": SchemaMetaFieldDef, "__type": TypeMetaFieldDef}
+
+_introspection: tuple[Optional[GraphQLSchema], dict] = (None, {})
+
+def introspection_estimates(schema: GraphQLSchema) -> dict[tuple[str, str], int]:
+    """Expected length of the introspection lists, taken from the schema itself (cached per schema)."""
+    global _introspection
+    cached, estimates = _introspection
+    if cached is schema:
+        return estimates
+
+    # averaged over every type, so `types × fields` is the number of fields in the schema
+    types = list(schema.type_map.values())
+    fields = [
+        list(t.fields.values()) if isinstance(t, (GraphQLObjectType, GraphQLInterfaceType)) else []
+        for t in types
+    ]
+    estimates = {
+        ("__Schema", "types"): len(types),
+        ("__Schema", "directives"): len(schema.directives),
+        ("__Directive", "args"): _average(d.args for d in schema.directives),
+        ("__Type", "fields"): _average(fields),
+        ("__Type", "inputFields"): _average(
+            t.fields if isinstance(t, GraphQLInputObjectType) else () for t in types
+        ),
+        ("__Type", "enumValues"): _average(t.values if isinstance(t, GraphQLEnumType) else () for t in types),
+        ("__Type", "interfaces"): _average(getattr(t, "interfaces", ()) for t in types),
+        ("__Type", "possibleTypes"): _average(
+            schema.get_possible_types(t) if isinstance(t, (GraphQLInterfaceType, GraphQLUnionType)) else ()
+            for t in types
+        ),
+        ("__Field", "args"): _average(f.args for group in fields for f in group),
+    }
+    _introspection = (schema, estimates)
+    return estimates
+
+
+class QueryCost:
+    """
+    Static cost of an operation: every object field costs 1 plus its children,
+    list fields multiply that by their estimated row count, scalars are free.
+    Lists under a field with a `first` argument (connections) count `first`
+    rows, or `page_rows` when it is not given. Introspection fields cost like
+    any other, their lists sized from the schema; their depth is tracked
+    apart (`introspection_depth`) since the standard introspection query nests
+    `ofType` deeper than data queries need to go.
+    """
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        estimates: dict,
+        default_rows: int,
+        page_rows: int = 0,
+        variables: Optional[dict] = None,
+    ):
+        self.schema = schema
+        self.estimates = estimates
+        self.default_rows = default_rows
+        self.page_rows = page_rows or default_rows
+        self.variables = variables or {}
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        self.depth = 0
+        self.introspection_depth = 0
+        self.cost = 0
+
+    def analyze(self, document: DocumentNode, operation_name: Optional[str]) -> "QueryCost":
+        operation = get_operation_ast(document, operation_name)
+        if operation is not None:
+            root = self.schema.get_root_type(operation.operation)
+            self.cost = self._selection_cost(root, operation.selection_set, depth=1)
+        return self
+
+    def _fields(self, selection_set: SelectionSetNode) -> Iterator[FieldNode]:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield selection
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is not None:
+                    yield from self._fields(fragment.selection_set)
+            else:
+                yield from self._fields(selection.selection_set)
+
+    def _first(self, node: FieldNode, field: GraphQLField) -> Optional[int]:
+        """Rows below a connection field: its `first` argument, or `page_rows` when omitted."""
+        if "first" not in field.args:
+            return None
+        for argument in node.arguments or ():
+            if argument.name.value != "first":
+                continue
+            value = argument.value
+            if isinstance(value, IntValueNode):
+                return int(value.value)
+            if isinstance(value, VariableNode):
+                first = self.variables.get(value.name.value)
+                return first if isinstance(first, int) else self.page_rows
+            return self.page_rows
+        return self.page_rows
+
+    def _selection_cost(
+        self,
+        parent: GraphQLObjectType,
+        selection_set: SelectionSetNode,
+        depth: int,
+        rows: Optional[int] = None,
+        introspection: bool = False,
+    ) -> int:
+        cost = 0
+        for node in self._fields(selection_set):
+            name = node.name.value
+            field = parent.fields.get(name) or _META_FIELDS.get(name)
+            if field is None or node.selection_set is None:
+                continue
+
+            field_introspection = introspection or name in _META_FIELDS
+            if field_introspection:
+                self.introspection_depth = max(self.introspection_depth, depth)
+            else:
+                self.depth = max(self.depth, depth)
+            field_type = field.type.of_type if isinstance(field.type, GraphQLNonNull) else field.type
+            child = get_named_type(field_type)
+            field_cost = 1
+            if isinstance(child, GraphQLObjectType):
+                field_cost += self._selection_cost(
+                    child, node.selection_set, depth + 1, self._first(node, field), field_introspection
+                )
+            if isinstance(field_type, GraphQLList):
+                estimate = rows if rows is not None else self.estimates.get((parent.name, name), self.default_rows)
+                field_cost *= max(estimate, 1)
+            cost += field_cost
+        return cost
+
+
+class CostBudget:
+    """Sliding-window sum of query cost per key."""
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._spent = LRUCache(maxsize=100_000, ttl=window)
+
+    def spend(self, key: Any, cost: int) -> Optional[int]:
+        """Record `cost` and return what is left, or None (recording nothing) if it does not fit."""
+        now = time.monotonic()
+        entries = self._spent.get(key)
+        if entries is None:
+            entries = deque()
+        while entries and entries[0][0] <= now - self.window:
+            entries.popleft()
+
+        spent = sum(entry[1] for entry in entries)
+        if spent + cost > self.limit:
+            return None
+        entries.append((now, cost))
+        self._spent.set(key, entries)
+        return self.limit - spent - cost
+
+
+_budget = None
+def get_cost_budget() -> CostBudget:
+    global _budget
+    if _budget is None:
+        settings = get_settings()
+        _budget = CostBudget(settings.query_cost_budget, settings.query_cost_window)
+    return _budget
+
+
+def _error(message: str, code: str) -> ExecutionResult:
+    return ExecutionResult(data=None, errors=[GraphQLError(message, extensions={"code": code})])
+
+
+class CostAnalysis(SchemaExtension):
+    """
+    Rejects operations that are too deep or too expensive before any resolver
+    runs, and charges the rest against the client's cost budget for the
+    sliding window (`QUERY_COST_BUDGET` per `QUERY_COST_WINDOW` seconds).
+    """
+    async def on_execute(self) -> AsyncIterator[None]:
+        execution_context = self.execution_context
+        # already answered, e.g. by `CatalogETag`
+        if execution_context.result is None:
+            execution_context.result = await self._check()
+        yield
+
+    async def _check(self) -> Optional[ExecutionResult]:
+        settings = get_settings()
+        execution_context = self.execution_context
+        catalog = await get_catalog()
+
+        analysis = QueryCost(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            {**introspection_estimates(execution_context.schema._schema), **row_estimates(catalog)},
+            settings.query_cost_default_rows,
+            page_rows=settings.page_default_size,
+            variables=execution_context.variables,
+        ).analyze(execution_context.graphql_document, execution_context.operation_name)
+
+        if analysis.depth > settings.query_max_depth:
+            return _error(
+                f"Query depth {analysis.depth} exceeds the maximum of {settings.query_max_depth}",
+                "QUERY_TOO_DEEP",
+            )
+        if analysis.introspection_depth > settings.query_max_introspection_depth:
+            return _error(
+                f"Introspection depth {analysis.introspection_depth} exceeds the maximum of "
+                f"{settings.query_max_introspection_depth}",
+                "QUERY_TOO_DEEP",
+            )
+        if analysis.cost > settings.query_max_cost:
+            return _error(
+                f"Query cost {analysis.cost} exceeds the maximum of {settings.query_max_cost}",
+                "QUERY_TOO_COSTLY",
+            )
+
+        context = execution_context.context
+        client = context.get("current_client")
+        request = context.get("request")
+        if client is not None:
+            key = client.id
+        elif request is not None and request.client is not None:
+            key = request.client.host
+        else:
+            return None
+
+        if get_cost_budget().spend(key, analysis.cost) is None:
+            return _error(
+                f"Query cost budget of {settings.query_cost_budget} per "
+                f"{settings.query_cost_window:g}s exceeded, retry later",
+                "QUERY_BUDGET_EXCEEDED",
+            )
+        return None
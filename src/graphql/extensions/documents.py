@@ -0,0 +1,58 @@
+# src/graphql/extensions/documents.py
+from typing import Iterator
+
+from strawberry.extensions import SchemaExtension
+
+from src.cache import LRUCache
+from src.config import get_settings
+
+_document_cache = None
+def get_document_cache() -> LRUCache:
+    """(query text, operation name) -> [DocumentNode, validation errors or None]."""
+    global _document_cache
+    if _document_cache is None:
+        settings = get_settings()
+        _document_cache = LRUCache(
+            maxsize=settings.document_cache_size,
+            maxbytes=settings.document_cache_max_bytes,
+        )
+    return _document_cache
+
+
+class DocumentCache(SchemaExtension):
+    """
+    Reuses the parsed document and its validation result for query strings
+    seen before, so hot polling queries skip both parse and validate.
+    Documents already provided by `PersistedQueries` are left alone.
+    """
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        self._entry = None
+        if execution_context.graphql_document is not None or not execution_context.query:
+            yield
+            return
+
+        key = (execution_context.query, execution_context.operation_name)
+        entry = get_document_cache().get(key)
+        if entry is not None:
+            execution_context.graphql_document = entry[0]
+            self._entry = entry
+            yield
+            return
+
+        yield
+
+        if execution_context.graphql_document is not None:
+            self._entry = [execution_context.graphql_document, None]
+            get_document_cache().set(key, self._entry, size=len(execution_context.query.encode()))
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        entry = self._entry
+        if entry is not None and entry[1] is not None and execution_context.pre_execution_errors is None:
+            execution_context.pre_execution_errors = list(entry[1])
+
+        yield
+
+        if entry is not None and entry[1] is None and execution_context.pre_execution_errors is not None:
+            entry[1] = list(execution_context.pre_execution_errors)
@@ -0,0 +1,99 @@
+# src/graphql/extensions/etag.py
+import hashlib
+import json
+from typing import AsyncIterator, Iterator, Optional
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    SelectionSetNode,
+)
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionResult
+from strawberry.types.graphql import OperationType
+
+from src.database.catalog import get_catalog
+
+# Root Query fields that only read the catalog snapshot
+CATALOG_ROOT_FIELDS = frozenset({
+    "itemType", "structureType", "botType", "buildingType", "recipe", "__typename",
+})
+
+
+def _root_fields(selection_set: SelectionSetNode, document: DocumentNode) -> Iterator[str]:
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            yield selection.name.value
+        elif isinstance(selection, InlineFragmentNode):
+            yield from _root_fields(selection.selection_set, document)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from _root_fields(fragment.selection_set, document)
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+class CatalogETag(SchemaExtension):
+    """
+    Conditional GET requests for catalog-only queries. The ETag is derived
+    from the catalog snapshot plus the operation and its variables; a matching
+    `If-None-Match` skips execution and the router answers `304`. POST
+    requests execute normally: `304` is only defined for GET and HEAD.
+    The catalog is the same for every client, so responses are shareable
+    (no `Vary: Authorization`); `max-age=0, must-revalidate` makes shared caches
+    revalidate each use with the requester's own token, which this extension
+    only honours for authenticated clients.
+    """
+    async def on_execute(self) -> AsyncIterator[None]:
+        etag = await self._etag()
+        if etag is not None:
+            context = self.execution_context.context
+            response = context["response"]
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "public, max-age=0, must-revalidate"
+            # multipart (@defer / @stream) and JSON answers differ
+            response.headers["Vary"] = "Accept"
+
+            if _matches(context["request"].headers.get("If-None-Match"), etag):
+                response.status_code = 304
+                self.execution_context.result = ExecutionResult(data=None, errors=None)
+        yield
+
+    async def _etag(self) -> Optional[str]:
+        execution_context = self.execution_context
+        context = execution_context.context
+        # Only authenticated HTTP requests; a 304 must never bypass permission checks
+        if not isinstance(context, dict) or context.get("current_client") is None:
+            return None
+        if "response" not in context or execution_context.operation_type != OperationType.QUERY:
+            return None
+        if context["request"].method != "GET":
+            return None
+
+        document = execution_context.graphql_document
+        operation = get_operation_ast(document, execution_context.operation_name)
+        if operation is None or not set(_root_fields(operation.selection_set, document)) <= CATALOG_ROOT_FIELDS:
+            return None
+
+        catalog = await get_catalog()
+        key = json.dumps(
+            [catalog.digest, execution_context.query, execution_context.operation_name, execution_context.variables],
+            sort_keys=True,
+            default=str,
+        )
+        return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
@@ -0,0 +1,111 @@
+# src/graphql/extensions/persisted.py
+import hashlib
+import json
+from typing import Iterator, Optional
+
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from src.cache import LRUCache
+from src.config import get_settings
+
+# https://github.com/apollographql/apollo-link-persisted-queries#protocol
+NOT_FOUND = "PersistedQueryNotFound"
+NOT_ALLOWED = "PersistedQueryNotAllowed"
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _load_allowlist(path: str) -> dict[str, str]:
+    """A JSON object of `sha256 -> query`; every hash is checked against its query."""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    for sha, query in manifest.items():
+        if query_hash(query) != sha:
+            raise ValueError(f"Persisted query allowlist {path}: hash {sha} does not match its query")
+    return manifest
+
+
+_persisted_queries = None
+_allowlist = None
+
+def get_persisted_queries() -> LRUCache:
+    """sha256 -> (query text, parsed and validated DocumentNode)."""
+    global _persisted_queries
+    if _persisted_queries is None:
+        _persisted_queries = LRUCache(maxsize=get_settings().apq_cache_size)
+    return _persisted_queries
+
+def get_allowlist() -> Optional[dict[str, str]]:
+    """sha256 -> query text of every operation accepted in allowlist mode, or None."""
+    global _allowlist
+    path = get_settings().apq_allowlist_path
+    if _allowlist is None and path:
+        _allowlist = _load_allowlist(path)
+    return _allowlist
+
+
+def _error(message: str) -> GraphQLError:
+    code = "PERSISTED_QUERY_NOT_FOUND" if message == NOT_FOUND else "PERSISTED_QUERY_NOT_ALLOWED"
+    return GraphQLError(message, extensions={"code": code})
+
+
+class PersistedQueries(SchemaExtension):
+    """
+    Automatic persisted queries. Clients send
+    `extensions: {persistedQuery: {version: 1, sha256Hash}}`, with or without
+    the query text:
+      - hash only, known: the stored document is reused, parse and validation are skipped
+      - hash only, unknown: `PersistedQueryNotFound`, the client retries with the text
+      - hash and text: the text is checked against the hash, and once it validates
+        the document is stored under the hash
+    With `APQ_ALLOWLIST_PATH` set, only documents listed in that file are executed.
+    """
+    def on_operation(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        self._register: Optional[str] = None
+
+        persisted = (execution_context.operation_extensions or {}).get("persistedQuery")
+        allowlist = get_allowlist()
+
+        if persisted is None:
+            if allowlist is not None and query_hash(execution_context.query or "") not in allowlist:
+                raise _error(NOT_ALLOWED)
+            yield
+            return
+
+        sha = persisted.get("sha256Hash") if isinstance(persisted, dict) else None
+        if not isinstance(sha, str) or persisted.get("version", 1) != 1:
+            raise GraphQLError("Unsupported persisted query version")
+
+        if execution_context.query:
+            if query_hash(execution_context.query) != sha:
+                raise GraphQLError("provided sha does not match query")
+            if allowlist is not None and sha not in allowlist:
+                raise _error(NOT_ALLOWED)
+        else:
+            stored = get_persisted_queries().get(sha)
+            if stored is not None:
+                execution_context.query, execution_context.graphql_document = stored
+                # already validated when it was stored
+                execution_context.pre_execution_errors = []
+                yield
+                return
+            if allowlist is None:
+                raise _error(NOT_FOUND)
+            if sha not in allowlist:
+                raise _error(NOT_ALLOWED)
+            execution_context.query = allowlist[sha]
+
+        self._register = sha
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        yield
+        execution_context = self.execution_context
+        if self._register is not None and not execution_context.pre_execution_errors:
+            get_persisted_queries().set(
+                self._register, (execution_context.query, execution_context.graphql_document)
+            )
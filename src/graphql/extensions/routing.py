@@ -0,0 +1,39 @@
+# src/graphql/extensions/routing.py
+from typing import Iterator
+
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from src.cache import LRUCache
+from src.config import get_settings
+from src.database import LazySession
+
+_recent_writers = None
+def get_recent_writers() -> LRUCache:
+    """Clients that mutated within the read-your-writes window."""
+    global _recent_writers
+    if _recent_writers is None:
+        _recent_writers = LRUCache(maxsize=100_000, ttl=get_settings().read_your_writes_window)
+    return _recent_writers
+
+
+class ReadReplicaRouter(SchemaExtension):
+    """
+    Routes the request's lazy session before any resolver touches it:
+    queries go to the read replica, mutations (and queries from clients
+    that just mutated) stay on the primary.
+    """
+    def on_execute(self) -> Iterator[None]:
+        context = self.execution_context.context
+        db = context.get("db")
+        client = context.get("current_client")
+        operation_type = self.execution_context.operation_type
+
+        if isinstance(db, LazySession):
+            pinned = client is not None and get_recent_writers().get(client.id) is not None
+            db.read_only = operation_type == OperationType.QUERY and not pinned
+
+        yield
+
+        if operation_type == OperationType.MUTATION and client is not None:
+            get_recent_writers().set(client.id, True)
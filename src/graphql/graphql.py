@@ -1,41 +1,86 @@
 # src/graphql/graphql.py
-from fastapi import Request, Depends
+from typing import Optional
+
+from fastapi import Response, Depends
+from starlette.requests import HTTPConnection
 import strawberry
 from strawberry.fastapi import GraphQLRouter
-from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.schema.config import StrawberryConfig
+
+from src.database import LazySession, get_lazy_db, get_sessionmaker
+from src.graphql.resolvers import Query, Mutation, Subscription
+from src.graphql.loaders import Loaders
+from src.graphql.extensions import (
+    ReadReplicaRouter,
+    CatalogETag,
+    PersistedQueries,
+    DocumentCache,
+    CostAnalysis,
+)
+from src.database.services import ClientService, ClientIdentity
 
-from src.database import get_db
-from src.graphql.resolvers import Query, Mutation
-from src.database.services import ClientService 
+async def identify_client(authorization: str) -> Optional[ClientIdentity]:
+    """Client matched by a `Bearer <token>` value (or None); cache misses use a
+    short-lived session so the connection is back in the pool before resolvers run."""
+    token = authorization[7:] if authorization.lower().startswith("bearer ") else None
+    if not token:
+        return None
+    async with get_sessionmaker()() as auth_db:
+        return await ClientService.get_identity_by_token(auth_db, token)
 
 async def get_context(
-    request: Request,
-    db: AsyncSession = Depends(get_db),
+    request: HTTPConnection,
+    db: LazySession = Depends(get_lazy_db),
 ) -> dict:
     """
-    Strawberry context getter: injects:
-      - `db`: an AsyncSession
-      - `current_client`: the Client matched by the Bearer token (or None)
+    Strawberry context getter (HTTP requests and websockets): injects:
+      - `db`: a lazily opened AsyncSession, closed at the end of the request
+      - `current_client`: identity of the Client matched by the Bearer token
+        (or None), served from an in-process TTL cache when possible
+      - `loaders`: per-request DataLoaders for nested relationships
     """
-    # 1) grab the raw header
-    auth: str = request.headers.get("Authorization", "")
-    # 2) strip off "Bearer " if present
-    token = auth[7:] if auth.lower().startswith("bearer ") else None
-
-    # 3) look up the client by token (or None)
-    current_client = None
-    if token:
-        current_client = await ClientService.get_by_token(db, token)
-
     return {
         "db": db,
-        "current_client": current_client,
+        "current_client": await identify_client(request.headers.get("Authorization", "")),
+        "loaders": Loaders(db),
     }
 
-graphql_app = GraphQLRouter(
+class Router(GraphQLRouter):
+    def create_response(self, response_data, sub_response: Response) -> Response:
+        # `CatalogETag` matched If-None-Match: answer without a body
+        if sub_response.status_code == 304:
+            response = Response(status_code=304)
+            response.headers.raw.extend(
+                (key, value) for key, value in sub_response.headers.raw
+                if key not in (b"content-length", b"content-type")
+            )
+            return response
+        return super().create_response(response_data, sub_response)
+
+    async def on_ws_connect(self, context: dict):
+        # browsers cannot set headers on websockets: accept the token in the
+        # `connection_init` payload as well
+        if context.get("current_client") is None:
+            params = context.get("connection_params")
+            if isinstance(params, dict):
+                authorization = params.get("Authorization") or params.get("authorization") or ""
+                context["current_client"] = await identify_client(str(authorization))
+        return await super().on_ws_connect(context)
+
+graphql_app = Router(
     strawberry.Schema(
         query=Query, 
-        mutation=Mutation
+        mutation=Mutation,
+        subscription=Subscription,
+        extensions=[
+            PersistedQueries,
+            DocumentCache,
+            ReadReplicaRouter,
+            CatalogETag,
+            CostAnalysis,
+        ],
+        # @defer / @stream, answered as multipart/mixed
+        config=StrawberryConfig(enable_experimental_incremental_execution=True),
     ), 
     context_getter=get_context,
     graphql_ide="graphiql"
@@ -1,16 +1,18 @@
 # src/graphql/inputs/__init__.py
 from .clients import ClientCreateInput, ClientUpdateInput
-from .items import ItemTypeInput
-from .structures import StructureTypeInput
-from .bots import BotRecipeInput, BotTypeInput
-from .buildings import BuildingRecipeInput, BuildingTypeInput
-from .recipes import RecipeIngredientInput, RecipeInput
+from .items import ItemTypeInput, ItemTypeFilterInput
+from .structures import StructureTypeInput, StructureTypeFilterInput
+from .bots import BotRecipeInput, BotTypeInput, BotTypeFilterInput
+from .buildings import BuildingRecipeInput, BuildingTypeInput, BuildingTypeFilterInput
+from .recipes import RecipeIngredientInput, RecipeInput, RecipeFilterInput
+from .ordering import OrderByInput, OrderField, SortDirection
 
 __all__ = [
     "ClientCreateInput", "ClientUpdateInput",
-    "ItemTypeInput",
-    "StructureTypeInput",
-    "BotRecipeInput", "BotTypeInput",
-    "BuildingRecipeInput", "BuildingTypeInput",
-    "RecipeIngredientInput", "RecipeInput"
+    "ItemTypeInput", "ItemTypeFilterInput",
+    "StructureTypeInput", "StructureTypeFilterInput",
+    "BotRecipeInput", "BotTypeInput", "BotTypeFilterInput",
+    "BuildingRecipeInput", "BuildingTypeInput", "BuildingTypeFilterInput",
+    "RecipeIngredientInput", "RecipeInput", "RecipeFilterInput",
+    "OrderByInput", "OrderField", "SortDirection"
 ]
\ No newline at end of file
@@ -7,7 +7,7 @@ from src.graphql.scalars import UUID
 class BotRecipeInput:
     bot_type_id: UUID
     item_type_id: UUID
-    amount: UUID
+    amount: int
 
 @strawberry.input(description="Payload for creating/updating a BotType")
 class BotTypeInput:
@@ -16,4 +16,8 @@ class BotTypeInput:
     strength: int
     speed: int
     vision: int
-    bot_recipes: list[BotRecipeInput] | None = None
\ No newline at end of file
+    bot_recipes: list[BotRecipeInput] | None = None
+
+@strawberry.input(description="Conditions bot types must match; unset fields are ignored")
+class BotTypeFilterInput:
+    name: str | None = None
\ No newline at end of file
@@ -13,4 +13,8 @@ class BuildingRecipeInput:
 class BuildingTypeInput:
     name: str
     health: int
-    building_recipes: list[BuildingRecipeInput] | None
\ No newline at end of file
+    building_recipes: list[BuildingRecipeInput] | None
+
+@strawberry.input(description="Conditions building types must match; unset fields are ignored")
+class BuildingTypeFilterInput:
+    name: str | None = None
\ No newline at end of file
@@ -4,4 +4,8 @@ import strawberry
 @strawberry.input(description="Payload for creating/updating a ItemType")
 class ItemTypeInput:
     name: str
-    durability: int | None
\ No newline at end of file
+    durability: int | None
+
+@strawberry.input(description="Conditions item types must match; unset fields are ignored")
+class ItemTypeFilterInput:
+    name: str | None = None
\ No newline at end of file
@@ -0,0 +1,19 @@
+# src/graphql/inputs/ordering.py
+from enum import Enum
+
+import strawberry
+
+@strawberry.enum(description="Indexed columns list queries can be ordered by")
+class OrderField(Enum):
+    CREATED_AT = "created_at"
+    NAME = "name"
+
+@strawberry.enum(description="Sort direction")
+class SortDirection(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+@strawberry.input(description="Order of a list query; ties are broken by creation time and ID")
+class OrderByInput:
+    field: OrderField = OrderField.CREATED_AT
+    direction: SortDirection = SortDirection.ASC
@@ -14,4 +14,10 @@ class RecipeInput:
     building_type_id: UUID
     output_item_type_id: UUID
     output_amount: int
-    ingredients: list[RecipeIngredientInput] | None
\ No newline at end of file
+    ingredients: list[RecipeIngredientInput] | None
+
+@strawberry.input(description="Conditions recipes must match; unset fields are ignored")
+class RecipeFilterInput:
+    name: str | None = None
+    building_type_id: UUID | None = None
+    output_item_type_id: UUID | None = None
\ No newline at end of file
@@ -9,4 +9,10 @@ class StructureTypeInput:
     health: int
     item_type_id: UUID
     max_items: int
-    item_to_engage_id: UUID | None
\ No newline at end of file
+    item_to_engage_id: UUID | None
+
+@strawberry.input(description="Conditions structure types must match; unset fields are ignored")
+class StructureTypeFilterInput:
+    name: str | None = None
+    item_type_id: UUID | None = None
+    item_to_engage_id: UUID | None = None
\ No newline at end of file
@@ -0,0 +1,70 @@
+# src/graphql/loaders.py
+from collections import defaultdict
+from typing import Any, Callable
+
+from sqlalchemy import select, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+from strawberry.types import Info
+
+from src.database.models import (
+    ItemType,
+    BotRecipe,
+    BuildingRecipe,
+    RecipeIngredient,
+    Recipe,
+)
+
+
+def _load_by_id(db: AsyncSession, model) -> Callable:
+    """One `SELECT ... WHERE id IN (...)` per batch, results in key order."""
+    async def load(keys: list[Any]) -> list[Any]:
+        result = await db.execute(select(model).where(model.id.in_(keys)))
+        rows = {row.id: row for row in result.scalars()}
+        return [rows.get(key) for key in keys]
+    return load
+
+
+def _load_grouped(db: AsyncSession, model, column) -> Callable:
+    """One `SELECT ... WHERE <fk> IN (...)` per batch, grouped by the fk."""
+    async def load(keys: list[Any]) -> list[list[Any]]:
+        result = await db.execute(select(model).where(column.in_(keys)))
+        groups = defaultdict(list)
+        for row in result.scalars():
+            groups[getattr(row, column.key)].append(row)
+        return [groups.get(key, []) for key in keys]
+    return load
+
+
+class Loaders:
+    """
+    Per-request DataLoaders used by nested schema fields.
+    Each relationship is fetched with a single batched query, and only
+    when the client actually selects it.
+    """
+    def __init__(self, db: AsyncSession):
+        self.item_type = DataLoader(load_fn=_load_by_id(db, ItemType))
+        self.bot_recipes_by_bot_type = DataLoader(
+            load_fn=_load_grouped(db, BotRecipe, BotRecipe.bot_type_id)
+        )
+        self.building_recipes_by_building_type = DataLoader(
+            load_fn=_load_grouped(db, BuildingRecipe, BuildingRecipe.building_type_id)
+        )
+        self.recipes_by_building_type = DataLoader(
+            load_fn=_load_grouped(db, Recipe, Recipe.building_type_id)
+        )
+        self.ingredients_by_recipe = DataLoader(
+            load_fn=_load_grouped(db, RecipeIngredient, RecipeIngredient.recipe_id)
+        )
+
+
+async def load_related(info: Info, root: Any, attr: str, loader: str, key: Any) -> Any:
+    """
+    Return `root.<attr>` when it is already available (catalog snapshot entries,
+    or relationships the query planner loaded), otherwise fetch it through the
+    named per-request DataLoader.
+    """
+    state = inspect(root, raiseerr=False)
+    if state is None or attr not in state.unloaded:
+        return getattr(root, attr)
+    return await getattr(info.context["loaders"], loader).load(key)
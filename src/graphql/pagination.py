@@ -0,0 +1,137 @@
+# src/graphql/pagination.py
+import base64
+import binascii
+import dataclasses
+import json
+from datetime import datetime
+from typing import Generic, Optional, Sequence, TypeVar
+from uuid import UUID
+
+import strawberry
+from fastapi import HTTPException
+from strawberry.types import Info
+
+from src.config import get_settings
+from src.database.services.pagination import OrderBy, PageKey, sort_keys
+from src.graphql.inputs import OrderByInput, SortDirection
+from src.graphql.planner import plan_options
+
+T = TypeVar("T")
+
+
+@strawberry.type(description="Where a page ends and whether another one follows")
+class PageInfo:
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+@strawberry.type(description="A row of a connection with the cursor pointing at it")
+class Edge(Generic[T]):
+    cursor: str
+    node: T
+
+
+@strawberry.type(description="One page of rows, oldest first")
+class Connection(Generic[T]):
+    edges: list[Edge[T]]
+    page_info: PageInfo
+
+
+def _signature(keys: OrderBy) -> str:
+    return ",".join(f"-{name}" if descending else name for name, descending in keys)
+
+
+def encode_cursor(row, keys: OrderBy) -> str:
+    """Opaque cursor holding the sort key values of `row` and the order they belong to."""
+    values = [getattr(row, name) for name, _ in keys]
+    payload = [_signature(keys)] + [
+        value.isoformat() if isinstance(value, datetime) else value.hex if isinstance(value, UUID) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, model, keys: OrderBy) -> PageKey:
+    """Sort key values of a cursor; it must have been issued for the same order."""
+    try:
+        signature, *values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if signature != _signature(keys) or len(values) != len(keys):
+            raise ValueError(signature)
+        key = []
+        for (name, _), value in zip(keys, values):
+            python_type = getattr(model, name).type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is UUID:
+                value = UUID(hex=value)
+            elif not isinstance(value, python_type):
+                raise ValueError(value)
+            key.append(value)
+        return key
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def filter_clauses(model, filter: Optional[object]) -> list:
+    """`column = value` for every field set on a filter input; its fields name indexed columns of `model`."""
+    if filter is None:
+        return []
+    return [
+        getattr(model, field.name) == getattr(filter, field.name)
+        for field in dataclasses.fields(filter)
+        if getattr(filter, field.name) is not None
+    ]
+
+
+def order_keys(order_by: Optional[OrderByInput]) -> OrderBy:
+    if order_by is None:
+        return sort_keys()
+    return sort_keys([(order_by.field.value, order_by.direction is SortDirection.DESC)])
+
+
+def page_size(first: Optional[int]) -> int:
+    settings = get_settings()
+    if first is None:
+        return min(settings.page_default_size, settings.page_max_size)
+    if not 0 < first <= settings.page_max_size:
+        raise HTTPException(
+            status_code=400, detail=f"first must be between 1 and {settings.page_max_size}"
+        )
+    return first
+
+
+def connection(rows: Sequence, has_next_page: bool, keys: OrderBy) -> Connection:
+    edges = [Edge(cursor=encode_cursor(row, keys), node=row) for row in rows]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
+
+
+async def paginate(
+    info: Info,
+    service,
+    model,
+    first: Optional[int],
+    after: Optional[str],
+    filter: Optional[object] = None,
+    order_by: Optional[OrderByInput] = None,
+) -> Connection:
+    """
+    Resolve a connection field through `service.list_page`: the filter and
+    order are compiled into the query, and only the selected node fields
+    (plus the sort keys) are loaded.
+    """
+    keys = order_keys(order_by)
+    rows, has_next_page = await service.list_page(
+        info.context["db"],
+        page_size(first),
+        decode_cursor(after, model, keys) if after else None,
+        plan_options(info, model, path=("edges", "node"), columns=[name for name, _ in keys]),
+        filter_clauses(model, filter),
+        keys,
+    )
+    return connection(rows, has_next_page, keys)
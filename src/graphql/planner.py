@@ -0,0 +1,99 @@
+# src/graphql/planner.py
+from collections import OrderedDict
+from typing import Iterable, Sequence
+
+from sqlalchemy.orm import class_mapper, joinedload, load_only, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
+from strawberry.utils.str_converters import to_snake_case
+
+# Loader options for resolvers that read rows from the database. Catalog
+# `byId` / `all` fields are answered from the snapshot (src/database/catalog.py)
+# and do not plan; the DB-backed `page` connections are the callers.
+PLAN_CACHE_SIZE = 512
+
+_plan_cache: OrderedDict[tuple, list[ExecutableOption]] = OrderedDict()
+
+
+def _fields(selections: Iterable[Selection]) -> Iterable[SelectedField]:
+    """Flatten fragment spreads and inline fragments into plain fields."""
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            yield from _fields(selection.selections)
+
+
+def _required_columns(mapper) -> set[str]:
+    """Primary and foreign keys are always loaded so loaders can follow them."""
+    keys = {col.key for col in mapper.primary_key}
+    for prop in mapper.column_attrs:
+        if any(col.foreign_keys for col in prop.columns):
+            keys.add(prop.key)
+    return keys
+
+
+def _build(model, selections: Iterable[Selection], extra: Iterable[str] = ()) -> list[ExecutableOption]:
+    mapper = class_mapper(model)
+    columns = _required_columns(mapper) | set(extra)
+    relations: dict[str, list[Selection]] = {}
+
+    for field in _fields(selections):
+        key = to_snake_case(field.name)
+        if key in mapper.column_attrs:
+            columns.add(key)
+        elif key in mapper.relationships:
+            relations.setdefault(key, []).extend(field.selections)
+
+    opts = [load_only(*(getattr(model, key) for key in sorted(columns)))]
+
+    for key, sub_selections in relations.items():
+        rel = mapper.relationships[key]
+        attr = getattr(model, key)
+        # many-to-one rides along in the same query, collections get one IN (...) pass
+        rel_loader = selectinload(attr) if rel.uselist else joinedload(attr)
+        opts.append(rel_loader.options(*_build(rel.mapper.class_, sub_selections)))
+
+    return opts
+
+
+def plan_options(
+    info: Info, model, path: Sequence[str] = (), columns: Sequence[str] = ()
+) -> list[ExecutableOption]:
+    """
+    Build loader options matching the client's selection set for `model`:
+    `load_only` for requested columns, `joinedload`/`selectinload` for
+    requested relationships. `path` names the fields between the resolved
+    field and the rows, e.g. `("edges", "node")` for connections; `columns`
+    are loaded whether selected or not.
+    Plans are cached per (operation, path, model).
+    """
+    field_path = tuple(key for key in info.path.as_list() if not isinstance(key, int))
+    cache_key = (
+        info.query, info.operation.name and info.operation.name.value, field_path, tuple(path), tuple(columns), model
+    )
+
+    opts = _plan_cache.get(cache_key)
+    if opts is not None:
+        _plan_cache.move_to_end(cache_key)
+        return opts
+
+    selections = [
+        child
+        for field in _fields(info.selected_fields)
+        for child in field.selections
+    ]
+    for name in path:
+        selections = [
+            child
+            for field in _fields(selections)
+            if field.name == name
+            for child in field.selections
+        ]
+    opts = _build(model, selections, columns)
+
+    _plan_cache[cache_key] = opts
+    if len(_plan_cache) > PLAN_CACHE_SIZE:
+        _plan_cache.popitem(last=False)
+    return opts
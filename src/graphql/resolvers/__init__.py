@@ -1,12 +1,19 @@
 # src/graphql/resolvers/__init__.py
 import strawberry
 
+from src.graphql.permissions import IsAuthenticated
+from src.graphql.schemas import (
+    ItemTypeScheme, StructureTypeScheme, BotTypeScheme, BuildingTypeScheme, RecipeScheme
+)
+from src.graphql.subscriptions import Change
+
 from .clients import ClientQuery, ClientMutation
-from .items import ItemTypeQuery, ItemTypeMutation
-from .structures import StructureTypeQuery, StructureTypeMutation
-from .bots import BotTypeQuery, BotTypeMutation
-from .buildings import BuildingTypeQuery, BuildingTypeMutation
-from .recipes import RecipeQuery, RecipeMutation
+from .items import ItemTypeQuery, ItemTypeMutation, item_type_changes
+from .structures import StructureTypeQuery, StructureTypeMutation, structure_type_changes
+from .bots import BotTypeQuery, BotTypeMutation, bot_type_changes
+from .buildings import BuildingTypeQuery, BuildingTypeMutation, building_type_changes
+from .recipes import RecipeQuery, RecipeMutation, recipe_changes
+from .world import WorldQuery
 
 @strawberry.type
 class Query():
@@ -16,6 +23,7 @@ class Query():
     bot_type: BotTypeQuery = strawberry.field(resolver=BotTypeQuery)
     building_type: BuildingTypeQuery = strawberry.field(resolver=BuildingTypeQuery)
     recipe: RecipeQuery = strawberry.field(resolver=RecipeQuery)
+    world: WorldQuery = strawberry.field(resolver=WorldQuery)
 
 @strawberry.type
 class Mutation():
@@ -26,6 +34,34 @@ class Mutation():
     building_type: BuildingTypeMutation = strawberry.field(resolver=BuildingTypeMutation)
     recipe: RecipeMutation = strawberry.field(resolver=RecipeMutation)
 
+@strawberry.type
+class Subscription():
+    item_type: Change[ItemTypeScheme] = strawberry.subscription(
+        resolver=item_type_changes,
+        description="Item types as they are created, updated or deleted",
+        permission_classes=[IsAuthenticated],
+    )
+    structure_type: Change[StructureTypeScheme] = strawberry.subscription(
+        resolver=structure_type_changes,
+        description="Structure types as they are created, updated or deleted",
+        permission_classes=[IsAuthenticated],
+    )
+    bot_type: Change[BotTypeScheme] = strawberry.subscription(
+        resolver=bot_type_changes,
+        description="Bot types (and their recipes) as they are created, updated or deleted",
+        permission_classes=[IsAuthenticated],
+    )
+    building_type: Change[BuildingTypeScheme] = strawberry.subscription(
+        resolver=building_type_changes,
+        description="Building types as they are created, updated or deleted",
+        permission_classes=[IsAuthenticated],
+    )
+    recipe: Change[RecipeScheme] = strawberry.subscription(
+        resolver=recipe_changes,
+        description="Recipes as they are created, updated or deleted",
+        permission_classes=[IsAuthenticated],
+    )
+
 __all__ = [
-    "Query", "Mutation"
+    "Query", "Mutation", "Subscription"
 ]
\ No newline at end of file
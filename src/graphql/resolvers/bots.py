@@ -1,24 +1,39 @@
 # src/graphql/resolvers/bots.py
-from typing import Sequence
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional, Sequence
 from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.catalog import get_catalog
+from src.database.models import BotType as BotTypeModel
 from src.database.services import BotTypeService
 from src.graphql.schemas import BotTypeScheme
-from src.graphql.inputs import BotTypeInput
+from src.graphql.inputs import BotTypeInput, BotTypeFilterInput, OrderByInput
+from src.graphql.pagination import Connection, paginate
 from src.graphql.permissions import IsAuthenticated
+from src.graphql.subscriptions import Change, watch
 
 
 async def get_bot_type_by_id(info: Info, id: UUID) -> BotTypeScheme:
-    db: AsyncSession = info.context["db"]
-    return await BotTypeService.get_by_id(db, id)
+    catalog = await get_catalog()
+    return catalog.bot_types.get(id)
 
-async def list_bot_types(info: Info) -> Sequence[BotTypeScheme]:
-    db: AsyncSession = info.context["db"]
-    return await BotTypeService.list_all(db)
+async def list_bot_types(info: Info) -> strawberry.Streamable[BotTypeScheme]:
+    catalog = await get_catalog()
+    for entry in catalog.bot_types.all:
+        yield entry
+
+async def page_bot_types(
+    info: Info,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    filter: Optional[BotTypeFilterInput] = None,
+    order_by: Optional[OrderByInput] = None,
+) -> Connection[BotTypeScheme]:
+    return await paginate(info, BotTypeService, BotTypeModel, first, after, filter, order_by)
 
 @strawberry.type
 class BotTypeQuery:
@@ -28,17 +43,31 @@ class BotTypeQuery:
         permission_classes=[IsAuthenticated],
     )
 
-    all: Sequence[BotTypeScheme] = strawberry.field(
+    all: strawberry.Streamable[BotTypeScheme] = strawberry.field(
         resolver=list_bot_types,
         description="List all bot types",
         permission_classes=[IsAuthenticated],
     )
 
+    page: Connection[BotTypeScheme] = strawberry.field(
+        resolver=page_bot_types,
+        description="Page through bot types, filtered and ordered by the database (oldest first by default)",
+        permission_classes=[IsAuthenticated],
+    )
+
 
 async def create_bot_type(info: Info, input: BotTypeInput) -> BotTypeScheme:
     db: AsyncSession = info.context["db"]
     return await BotTypeService.create(db, input)
 
+async def create_many_bot_types(info: Info, input: list[BotTypeInput]) -> Sequence[BotTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await BotTypeService.create_many(db, input)
+
+async def upsert_many_bot_types(info: Info, input: list[BotTypeInput]) -> Sequence[BotTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await BotTypeService.upsert_many(db, input)
+
 async def update_bot_type(
     info: Info, id: UUID, input: BotTypeInput
 ) -> BotTypeScheme:
@@ -56,6 +85,18 @@ class BotTypeMutation:
         description="Create a new bot type",
     )
 
+    create_many: Sequence[BotTypeScheme] = strawberry.mutation(
+        resolver=create_many_bot_types,
+        description="Create many bot types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
+    upsert_many: Sequence[BotTypeScheme] = strawberry.mutation(
+        resolver=upsert_many_bot_types,
+        description="Create or update (by name) many bot types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
     update: BotTypeScheme = strawberry.mutation(
         resolver=update_bot_type,
         description="Update an existing bot type",
@@ -66,4 +107,10 @@ class BotTypeMutation:
         resolver=delete_bot_type,
         description="Delete a bot type by its ID",
         permission_classes=[IsAuthenticated],
-    )
\ No newline at end of file
+    )
+
+
+async def bot_type_changes(info: Info) -> AsyncGenerator[Change[BotTypeScheme], None]:
+    async with aclosing(watch("BotType", lambda catalog: catalog.bot_types)) as changes:
+        async for change in changes:
+            yield change
@@ -1,24 +1,39 @@
 # src/graphql/resolvers/buildings.py
-from typing import Sequence
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional, Sequence
 from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.catalog import get_catalog
+from src.database.models import BuildingType as BuildingTypeModel
 from src.database.services import BuildingTypeService
 from src.graphql.schemas import BuildingTypeScheme
-from src.graphql.inputs import BuildingTypeInput
+from src.graphql.inputs import BuildingTypeInput, BuildingTypeFilterInput, OrderByInput
+from src.graphql.pagination import Connection, paginate
 from src.graphql.permissions import IsAuthenticated
+from src.graphql.subscriptions import Change, watch
 
 
 async def get_building_type_by_id(info: Info, id: UUID) -> BuildingTypeScheme:
-    db: AsyncSession = info.context["db"]
-    return await BuildingTypeService.get_by_id(db, id)
+    catalog = await get_catalog()
+    return catalog.building_types.get(id)
 
-async def list_building_types(info: Info) -> Sequence[BuildingTypeScheme]:
-    db: AsyncSession = info.context["db"]
-    return await BuildingTypeService.list_all(db)
+async def list_building_types(info: Info) -> strawberry.Streamable[BuildingTypeScheme]:
+    catalog = await get_catalog()
+    for entry in catalog.building_types.all:
+        yield entry
+
+async def page_building_types(
+    info: Info,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    filter: Optional[BuildingTypeFilterInput] = None,
+    order_by: Optional[OrderByInput] = None,
+) -> Connection[BuildingTypeScheme]:
+    return await paginate(info, BuildingTypeService, BuildingTypeModel, first, after, filter, order_by)
 
 @strawberry.type
 class BuildingTypeQuery:
@@ -28,17 +43,31 @@ class BuildingTypeQuery:
         permission_classes=[IsAuthenticated],
     )
 
-    all: Sequence[BuildingTypeScheme] = strawberry.field(
+    all: strawberry.Streamable[BuildingTypeScheme] = strawberry.field(
         resolver=list_building_types,
         description="List all building types",
         permission_classes=[IsAuthenticated],
     )
 
+    page: Connection[BuildingTypeScheme] = strawberry.field(
+        resolver=page_building_types,
+        description="Page through building types, filtered and ordered by the database (oldest first by default)",
+        permission_classes=[IsAuthenticated],
+    )
+
 
 async def create_building_type(info: Info, input: BuildingTypeInput) -> BuildingTypeScheme:
     db: AsyncSession = info.context["db"]
     return await BuildingTypeService.create(db, input)
 
+async def create_many_building_types(info: Info, input: list[BuildingTypeInput]) -> Sequence[BuildingTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await BuildingTypeService.create_many(db, input)
+
+async def upsert_many_building_types(info: Info, input: list[BuildingTypeInput]) -> Sequence[BuildingTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await BuildingTypeService.upsert_many(db, input)
+
 async def update_building_type(info: Info, id: UUID, input: BuildingTypeInput) -> BuildingTypeScheme:
     db: AsyncSession = info.context["db"]
     return await BuildingTypeService.update(db, id, input)
@@ -55,6 +84,18 @@ class BuildingTypeMutation:
         permission_classes=[IsAuthenticated],
     )
 
+    create_many: Sequence[BuildingTypeScheme] = strawberry.mutation(
+        resolver=create_many_building_types,
+        description="Create many building types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
+    upsert_many: Sequence[BuildingTypeScheme] = strawberry.mutation(
+        resolver=upsert_many_building_types,
+        description="Create or update (by name) many building types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
     update: BuildingTypeScheme = strawberry.mutation(
         resolver=update_building_type,
         description="Update an existing building type",
@@ -66,3 +107,9 @@ class BuildingTypeMutation:
         description="Delete a building type by its ID",
         permission_classes=[IsAuthenticated],
     )
+
+
+async def building_type_changes(info: Info) -> AsyncGenerator[Change[BuildingTypeScheme], None]:
+    async with aclosing(watch("BuildingType", lambda catalog: catalog.building_types)) as changes:
+        async for change in changes:
+            yield change
@@ -1,25 +1,40 @@
 # src/graphql/resolvers/items.py
-from typing import Sequence
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional, Sequence
 from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.catalog import get_catalog
+from src.database.models import ItemType as ItemTypeModel
 from src.database.services import ItemTypeService
 from src.graphql.schemas import ItemTypeScheme
-from src.graphql.inputs import ItemTypeInput
+from src.graphql.inputs import ItemTypeInput, ItemTypeFilterInput, OrderByInput
+from src.graphql.pagination import Connection, paginate
 from src.graphql.permissions import IsAuthenticated
+from src.graphql.subscriptions import Change, watch
 
 
 async def get_item_type_by_id(info: Info, id: UUID) -> ItemTypeScheme:
-    db: AsyncSession = info.context["db"]
-    return await ItemTypeService.get_by_id(db, id)
+    catalog = await get_catalog()
+    return catalog.item_types.get(id)
 
 
-async def list_item_types(info: Info) -> Sequence[ItemTypeScheme]:
-    db: AsyncSession = info.context["db"]
-    return await ItemTypeService.list_all(db)
+async def list_item_types(info: Info) -> strawberry.Streamable[ItemTypeScheme]:
+    catalog = await get_catalog()
+    for entry in catalog.item_types.all:
+        yield entry
+
+async def page_item_types(
+    info: Info,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    filter: Optional[ItemTypeFilterInput] = None,
+    order_by: Optional[OrderByInput] = None,
+) -> Connection[ItemTypeScheme]:
+    return await paginate(info, ItemTypeService, ItemTypeModel, first, after, filter, order_by)
 
 @strawberry.type
 class ItemTypeQuery:
@@ -29,17 +44,31 @@ class ItemTypeQuery:
         permission_classes=[IsAuthenticated],
     )
 
-    all: Sequence[ItemTypeScheme] = strawberry.field(
+    all: strawberry.Streamable[ItemTypeScheme] = strawberry.field(
         resolver=list_item_types,
         description="List all item types",
         permission_classes=[IsAuthenticated],
     )
 
+    page: Connection[ItemTypeScheme] = strawberry.field(
+        resolver=page_item_types,
+        description="Page through item types, filtered and ordered by the database (oldest first by default)",
+        permission_classes=[IsAuthenticated],
+    )
+
 
 async def create_item_type(info: Info, input: ItemTypeInput) -> ItemTypeScheme:
     db: AsyncSession = info.context["db"]
     return await ItemTypeService.create(db, input)
 
+async def create_many_item_types(info: Info, input: list[ItemTypeInput]) -> Sequence[ItemTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await ItemTypeService.create_many(db, input)
+
+async def upsert_many_item_types(info: Info, input: list[ItemTypeInput]) -> Sequence[ItemTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await ItemTypeService.upsert_many(db, input)
+
 async def update_item_type(info: Info, id: UUID, input: ItemTypeInput) -> ItemTypeScheme:
     db: AsyncSession = info.context["db"]
     return await ItemTypeService.update(db, id, input)
@@ -56,6 +85,18 @@ class ItemTypeMutation:
         description="Create a new item type",
     )
 
+    create_many: Sequence[ItemTypeScheme] = strawberry.mutation(
+        resolver=create_many_item_types,
+        description="Create many item types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
+    upsert_many: Sequence[ItemTypeScheme] = strawberry.mutation(
+        resolver=upsert_many_item_types,
+        description="Create or update (by name) many item types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
     update: ItemTypeScheme = strawberry.mutation(
         resolver=update_item_type,
         description="Update an existing item type",
@@ -66,4 +107,10 @@ class ItemTypeMutation:
         resolver=delete_item_type,
         description="Delete an item type by its ID",
         permission_classes=[IsAuthenticated],
-    )
\ No newline at end of file
+    )
+
+
+async def item_type_changes(info: Info) -> AsyncGenerator[Change[ItemTypeScheme], None]:
+    async with aclosing(watch("ItemType", lambda catalog: catalog.item_types)) as changes:
+        async for change in changes:
+            yield change
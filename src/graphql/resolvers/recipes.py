@@ -1,24 +1,40 @@
 # src/graphql/resolvers/recipes.py
-from typing import Sequence
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional, Sequence
 from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.catalog import get_catalog
+from src.database.models import Recipe as RecipeModel
 from src.database.services import RecipeService
 from src.graphql.schemas.recipes import RecipeScheme
-from src.graphql.inputs.recipes import RecipeInput
+from src.graphql.inputs.recipes import RecipeInput, RecipeFilterInput
+from src.graphql.inputs.ordering import OrderByInput
+from src.graphql.pagination import Connection, paginate
 from src.graphql.permissions import IsAuthenticated
+from src.graphql.subscriptions import Change, watch
 
 
 async def get_recipe_by_id(info: Info, id: UUID) -> RecipeScheme:
-    db: AsyncSession = info.context["db"]
-    return await RecipeService.get_by_id(db, id)
+    catalog = await get_catalog()
+    return catalog.recipes.get(id)
 
-async def list_recipes(info: Info) -> Sequence[RecipeScheme]:
-    db: AsyncSession = info.context["db"]
-    return await RecipeService.list_all(db)
+async def list_recipes(info: Info) -> strawberry.Streamable[RecipeScheme]:
+    catalog = await get_catalog()
+    for entry in catalog.recipes.all:
+        yield entry
+
+async def page_recipes(
+    info: Info,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    filter: Optional[RecipeFilterInput] = None,
+    order_by: Optional[OrderByInput] = None,
+) -> Connection[RecipeScheme]:
+    return await paginate(info, RecipeService, RecipeModel, first, after, filter, order_by)
 
 
 @strawberry.type
@@ -29,17 +45,31 @@ class RecipeQuery:
         permission_classes=[IsAuthenticated],
     )
 
-    all: Sequence[RecipeScheme] = strawberry.field(
+    all: strawberry.Streamable[RecipeScheme] = strawberry.field(
         resolver=list_recipes,
         description="List all recipes",
         permission_classes=[IsAuthenticated],
     )
 
+    page: Connection[RecipeScheme] = strawberry.field(
+        resolver=page_recipes,
+        description="Page through recipes, filtered and ordered by the database (oldest first by default)",
+        permission_classes=[IsAuthenticated],
+    )
+
 
 async def create_recipe(info: Info, input: RecipeInput) -> RecipeScheme:
     db: AsyncSession = info.context["db"]
     return await RecipeService.create(db, input)
 
+async def create_many_recipes(info: Info, input: list[RecipeInput]) -> Sequence[RecipeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await RecipeService.create_many(db, input)
+
+async def upsert_many_recipes(info: Info, input: list[RecipeInput]) -> Sequence[RecipeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await RecipeService.upsert_many(db, input)
+
 async def update_recipe(info: Info, id: UUID, input: RecipeInput) -> RecipeScheme:
     db: AsyncSession = info.context["db"]
     return await RecipeService.update(db, id, input)
@@ -57,6 +87,18 @@ class RecipeMutation:
         permission_classes=[IsAuthenticated],
     )
 
+    create_many: Sequence[RecipeScheme] = strawberry.mutation(
+        resolver=create_many_recipes,
+        description="Create many recipes in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
+    upsert_many: Sequence[RecipeScheme] = strawberry.mutation(
+        resolver=upsert_many_recipes,
+        description="Create or update (by name) many recipes in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
     update: RecipeScheme = strawberry.mutation(
         resolver=update_recipe,
         description="Update an existing recipe",
@@ -67,4 +109,10 @@ class RecipeMutation:
         resolver=delete_recipe,
         description="Delete a recipe by its ID",
         permission_classes=[IsAuthenticated],
-    )
\ No newline at end of file
+    )
+
+
+async def recipe_changes(info: Info) -> AsyncGenerator[Change[RecipeScheme], None]:
+    async with aclosing(watch("Recipe", lambda catalog: catalog.recipes)) as changes:
+        async for change in changes:
+            yield change
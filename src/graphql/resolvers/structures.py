@@ -1,24 +1,39 @@
 # src/graphql/resolvers/structures.py
-from typing import Sequence
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional, Sequence
 from uuid import UUID
 
 import strawberry
 from strawberry.types import Info
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.catalog import get_catalog
+from src.database.models import StructureType as StructureTypeModel
 from src.database.services import StructureTypeService
 from src.graphql.schemas import StructureTypeScheme
-from src.graphql.inputs import StructureTypeInput
+from src.graphql.inputs import StructureTypeInput, StructureTypeFilterInput, OrderByInput
+from src.graphql.pagination import Connection, paginate
 from src.graphql.permissions import IsAuthenticated
+from src.graphql.subscriptions import Change, watch
 
 
 async def get_structure_type_by_id(info: Info, id: UUID) -> StructureTypeScheme:
-    db: AsyncSession = info.context["db"]
-    return await StructureTypeService.get_by_id(db, id)
+    catalog = await get_catalog()
+    return catalog.structure_types.get(id)
 
-async def list_structure_types(info: Info) -> Sequence[StructureTypeScheme]:
-    db: AsyncSession = info.context["db"]
-    return await StructureTypeService.list_all(db)
+async def list_structure_types(info: Info) -> strawberry.Streamable[StructureTypeScheme]:
+    catalog = await get_catalog()
+    for entry in catalog.structure_types.all:
+        yield entry
+
+async def page_structure_types(
+    info: Info,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    filter: Optional[StructureTypeFilterInput] = None,
+    order_by: Optional[OrderByInput] = None,
+) -> Connection[StructureTypeScheme]:
+    return await paginate(info, StructureTypeService, StructureTypeModel, first, after, filter, order_by)
 
 @strawberry.type
 class StructureTypeQuery:
@@ -28,17 +43,31 @@ class StructureTypeQuery:
         permission_classes=[IsAuthenticated],
     )
 
-    all: Sequence[StructureTypeScheme] = strawberry.field(
+    all: strawberry.Streamable[StructureTypeScheme] = strawberry.field(
         resolver=list_structure_types,
         description="List all structure types",
         permission_classes=[IsAuthenticated],
     )
 
+    page: Connection[StructureTypeScheme] = strawberry.field(
+        resolver=page_structure_types,
+        description="Page through structure types, filtered and ordered by the database (oldest first by default)",
+        permission_classes=[IsAuthenticated],
+    )
+
 
 async def create_structure_type(info: Info, input: StructureTypeInput) -> StructureTypeScheme:
     db: AsyncSession = info.context["db"]
     return await StructureTypeService.create(db, input)
 
+async def create_many_structure_types(info: Info, input: list[StructureTypeInput]) -> Sequence[StructureTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await StructureTypeService.create_many(db, input)
+
+async def upsert_many_structure_types(info: Info, input: list[StructureTypeInput]) -> Sequence[StructureTypeScheme]:
+    db: AsyncSession = info.context["db"]
+    return await StructureTypeService.upsert_many(db, input)
+
 async def update_structure_type(
     info: Info, id: UUID, input: StructureTypeInput
 ) -> StructureTypeScheme:
@@ -56,6 +85,18 @@ class StructureTypeMutation:
         description="Create a new structure type",
     )
 
+    create_many: Sequence[StructureTypeScheme] = strawberry.mutation(
+        resolver=create_many_structure_types,
+        description="Create many structure types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
+    upsert_many: Sequence[StructureTypeScheme] = strawberry.mutation(
+        resolver=upsert_many_structure_types,
+        description="Create or update (by name) many structure types in a single transaction",
+        permission_classes=[IsAuthenticated],
+    )
+
     update: StructureTypeScheme = strawberry.mutation(
         resolver=update_structure_type,
         description="Update an existing structure type",
@@ -66,4 +107,10 @@ class StructureTypeMutation:
         resolver=delete_structure_type,
         description="Delete a structure type by its ID",
         permission_classes=[IsAuthenticated],
-    )
\ No newline at end of file
+    )
+
+
+async def structure_type_changes(info: Info) -> AsyncGenerator[Change[StructureTypeScheme], None]:
+    async with aclosing(watch("StructureType", lambda catalog: catalog.structure_types)) as changes:
+        async for change in changes:
+            yield change
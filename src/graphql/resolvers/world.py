@@ -0,0 +1,88 @@
+# src/graphql/resolvers/world.py
+import asyncio
+from typing import Optional
+
+import strawberry
+from fastapi import HTTPException
+from strawberry.types import Info
+
+from src.config import get_settings
+from src.graphql.schemas import (
+    WorldEntitiesScheme, VisibleTileScheme, VisibilityScheme, TilePlaneScheme, TileChunkScheme
+)
+from src.graphql.permissions import IsAuthenticated
+from src.world import (
+    PLANES, BotEntry, BuildingEntry, StructureEntry, get_spatial_grid, get_tile_store, get_visibility
+)
+
+
+async def get_entities_in_rect(info: Info, x0: int, y0: int, x1: int, y1: int) -> WorldEntitiesScheme:
+    area = (abs(x1 - x0) + 1) * (abs(y1 - y0) + 1)
+    if area > get_settings().world_max_rect_area:
+        raise HTTPException(status_code=400, detail="Rectangle is too large")
+
+    bots, buildings, structures = [], [], []
+    for entry in get_spatial_grid().query(x0, y0, x1, y1):
+        if isinstance(entry, BotEntry):
+            bots.append(entry)
+        elif isinstance(entry, BuildingEntry):
+            buildings.append(entry)
+        elif isinstance(entry, StructureEntry):
+            structures.append(entry)
+    return WorldEntitiesScheme(bots=bots, buildings=buildings, structures=structures)
+
+async def get_visibility_changes(info: Info, since: int = 0, epoch: Optional[str] = None) -> VisibilityScheme:
+    engine = get_visibility()
+    visibility = engine.client(info.context["current_client"].id)
+    # versions of another epoch (before a restart) mean nothing here
+    reset, tiles = visibility.changes_since(since if epoch in (None, engine.epoch) else -1)
+    return VisibilityScheme(
+        epoch=engine.epoch,
+        version=visibility.version,
+        reset=reset,
+        tiles=[
+            VisibleTileScheme(x=x, y=y, visible=visible, explored=explored)
+            for (x, y), visible, explored in tiles
+        ],
+    )
+
+async def get_tile_chunks(info: Info, cx0: int, cy0: int, cx1: int, cy1: int) -> list[TileChunkScheme]:
+    cx0, cx1 = sorted((cx0, cx1))
+    cy0, cy1 = sorted((cy0, cy1))
+    if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > get_settings().tile_max_chunks_per_query:
+        raise HTTPException(status_code=400, detail="Too many chunks requested")
+
+    store = get_tile_store()
+    planes, offset = [], 0
+    for name, dtype in PLANES:
+        length = store.chunk_size * store.chunk_size * dtype.itemsize
+        planes.append(TilePlaneScheme(name=name, dtype=dtype.str, offset=offset, length=length))
+        offset += length
+
+    coords = [(cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)]
+    # mapping files and copying pages block: keep them off the event loop
+    data = await asyncio.to_thread(lambda: [store.read(cx, cy).tobytes() for cx, cy in coords])
+    return [
+        TileChunkScheme(cx=cx, cy=cy, size=store.chunk_size, planes=planes, data=chunk)
+        for (cx, cy), chunk in zip(coords, data)
+    ]
+
+@strawberry.type
+class WorldQuery:
+    entities_in_rect: WorldEntitiesScheme = strawberry.field(
+        resolver=get_entities_in_rect,
+        description="Bots, buildings and structures with x0 <= x <= x1 and y0 <= y <= y1 (corners in any order)",
+        permission_classes=[IsAuthenticated],
+    )
+
+    visibility: VisibilityScheme = strawberry.field(
+        resolver=get_visibility_changes,
+        description="Tiles of your fog of war that changed after version `since` of `epoch`",
+        permission_classes=[IsAuthenticated],
+    )
+
+    tile_chunks: list[TileChunkScheme] = strawberry.field(
+        resolver=get_tile_chunks,
+        description="Tile chunks cx0..cx1 x cy0..cy1 (corners in any order), row by row, as base64-packed planes",
+        permission_classes=[IsAuthenticated],
+    )
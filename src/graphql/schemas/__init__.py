@@ -5,6 +5,10 @@ from .structures import StructureTypeScheme
 from .bots import BotRecipeScheme, BotTypeScheme
 from .buildings import BuildingRecipeScheme, BuildingTypeScheme
 from .recipes import RecipeIngredientScheme, RecipeScheme
+from .world import (
+    BotScheme, BuildingScheme, StructureScheme, WorldEntitiesScheme, VisibleTileScheme, VisibilityScheme,
+    TilePlaneScheme, TileChunkScheme
+)
 
 __all__ = [
     "ClientScheme",
@@ -12,5 +16,8 @@ __all__ = [
     "StructureTypeScheme",
     "BotRecipeScheme", "BotTypeScheme",
     "BuildingRecipeScheme", "BuildingTypeScheme",
-    "RecipeIngredientScheme", "RecipeScheme"
+    "RecipeIngredientScheme", "RecipeScheme",
+    "BotScheme", "BuildingScheme", "StructureScheme", "WorldEntitiesScheme",
+    "VisibleTileScheme", "VisibilityScheme",
+    "TilePlaneScheme", "TileChunkScheme"
 ]
\ No newline at end of file
@@ -2,17 +2,24 @@
 from datetime import datetime
 
 import strawberry
+from strawberry.types import Info
 
 from src.graphql.scalars import UUID
+from src.graphql.loaders import load_related
+from .items import ItemTypeScheme
 
 @strawberry.type(description="A BotRecipe in the system")
 class BotRecipeScheme:
     id: UUID
     bot_type_id: UUID
     item_type_id: UUID
-    amount: UUID
+    amount: int
     created_at: datetime
 
+    @strawberry.field
+    async def item_type(self, info: Info) -> ItemTypeScheme:
+        return await load_related(info, self, "item_type", "item_type", self.item_type_id)
+
 
 @strawberry.type(description="A BotType in the system")
 class BotTypeScheme:
@@ -22,5 +29,8 @@ class BotTypeScheme:
     strength: int
     speed: int
     vision: int
-    bot_recipes: list[BotRecipeScheme]
     created_at: datetime
+
+    @strawberry.field
+    async def bot_recipes(self, info: Info) -> list[BotRecipeScheme]:
+        return await load_related(info, self, "bot_recipes", "bot_recipes_by_bot_type", self.id)
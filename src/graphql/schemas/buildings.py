@@ -2,8 +2,12 @@
 from datetime import datetime
 
 import strawberry
+from strawberry.types import Info
 
 from src.graphql.scalars import UUID
+from src.graphql.loaders import load_related
+from .items import ItemTypeScheme
+from .recipes import RecipeScheme
 
 @strawberry.type(description="A BuildingRecipe in the system")
 class BuildingRecipeScheme:
@@ -13,10 +17,21 @@ class BuildingRecipeScheme:
     amount: int
     created_at: datetime
 
+    @strawberry.field
+    async def item_type(self, info: Info) -> ItemTypeScheme:
+        return await load_related(info, self, "item_type", "item_type", self.item_type_id)
+
 @strawberry.type(description="Payload for creating/updating a BuildingType")
 class BuildingTypeScheme:
     id: UUID
     name: str
     health: int
-    building_recipes: list[BuildingRecipeScheme] | None
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+    @strawberry.field
+    async def building_recipes(self, info: Info) -> list[BuildingRecipeScheme] | None:
+        return await load_related(info, self, "building_recipes", "building_recipes_by_building_type", self.id)
+
+    @strawberry.field
+    async def recipes(self, info: Info) -> list[RecipeScheme]:
+        return await load_related(info, self, "recipes", "recipes_by_building_type", self.id)
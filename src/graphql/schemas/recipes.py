@@ -2,8 +2,11 @@
 from datetime import datetime
 
 import strawberry
+from strawberry.types import Info
 
 from src.graphql.scalars import UUID
+from src.graphql.loaders import load_related
+from .items import ItemTypeScheme
 
 @strawberry.type(description="A RecipeIngredient in the system")
 class RecipeIngredientScheme:
@@ -13,6 +16,10 @@ class RecipeIngredientScheme:
     amount: int
     created_at: datetime
 
+    @strawberry.field
+    async def item_type(self, info: Info) -> ItemTypeScheme:
+        return await load_related(info, self, "item_type", "item_type", self.item_type_id)
+
 @strawberry.type(description="A Recipe in the system")
 class RecipeScheme:
     id: UUID
@@ -20,5 +27,12 @@ class RecipeScheme:
     building_type_id: UUID
     output_item_type_id: UUID
     output_amount: int
-    ingredients: list[RecipeIngredientScheme] | None
     created_at: datetime
+
+    @strawberry.field
+    async def ingredients(self, info: Info) -> list[RecipeIngredientScheme] | None:
+        return await load_related(info, self, "ingredients", "ingredients_by_recipe", self.id)
+
+    @strawberry.field
+    async def output_item_type(self, info: Info) -> ItemTypeScheme:
+        return await load_related(info, self, "output_item_type", "item_type", self.output_item_type_id)
@@ -2,8 +2,11 @@
 from datetime import datetime
 
 import strawberry
+from strawberry.types import Info
 
 from src.graphql.scalars import UUID
+from src.graphql.loaders import load_related
+from .items import ItemTypeScheme
 
 @strawberry.type(description="A StructureType in the system")
 class StructureTypeScheme:
@@ -15,3 +18,14 @@ class StructureTypeScheme:
     item_to_engage_id: UUID | None
     created_at: datetime
 
+    @strawberry.field
+    async def item_type(self, info: Info) -> ItemTypeScheme:
+        return await load_related(info, self, "item_type", "item_type", self.item_type_id)
+
+    @strawberry.field
+    async def item_to_engage(self, info: Info) -> ItemTypeScheme | None:
+        if self.item_to_engage_id is None:
+            return None
+        return await load_related(info, self, "item_to_engage", "item_type", self.item_to_engage_id)
+
+
@@ -0,0 +1,99 @@
+# src/graphql/schemas/world.py
+from datetime import datetime
+
+import strawberry
+from strawberry.scalars import Base64
+
+from src.database.catalog import get_catalog
+from src.graphql.scalars import UUID
+from .structures import StructureTypeScheme
+from .bots import BotTypeScheme
+from .buildings import BuildingTypeScheme
+
+@strawberry.type(description="A Bot placed in the world")
+class BotScheme:
+    id: UUID
+    name: str
+    type_id: UUID
+    client_id: UUID
+    x: int
+    y: int
+    level: int
+    created_at: datetime
+
+    @strawberry.field
+    async def type(self) -> BotTypeScheme:
+        return (await get_catalog()).bot_types.get(self.type_id)
+
+
+@strawberry.type(description="A Building placed in the world")
+class BuildingScheme:
+    id: UUID
+    name: str
+    type_id: UUID
+    client_id: UUID
+    x: int
+    y: int
+    level: int
+    current_health: int
+    created_at: datetime
+
+    @strawberry.field
+    async def type(self) -> BuildingTypeScheme:
+        return (await get_catalog()).building_types.get(self.type_id)
+
+
+@strawberry.type(description="A Structure placed in the world")
+class StructureScheme:
+    id: UUID
+    type_id: UUID
+    items: int
+    x: int
+    y: int
+    created_at: datetime
+
+    @strawberry.field
+    async def type(self) -> StructureTypeScheme:
+        return (await get_catalog()).structure_types.get(self.type_id)
+
+
+@strawberry.type(description="Everything placed inside a rectangle of the world")
+class WorldEntitiesScheme:
+    bots: list[BotScheme]
+    buildings: list[BuildingScheme]
+    structures: list[StructureScheme]
+
+
+@strawberry.type(description="Fog of war state of one tile")
+class VisibleTileScheme:
+    x: int
+    y: int
+    visible: bool
+    explored: bool
+
+
+@strawberry.type(description="Tiles whose fog of war changed since a version")
+class VisibilityScheme:
+    epoch: str
+    version: int
+    reset: bool = strawberry.field(
+        description="True when `tiles` lists the whole explored map and replaces what the client holds"
+    )
+    tiles: list[VisibleTileScheme]
+
+
+@strawberry.type(description="Where one plane lies in a packed tile chunk")
+class TilePlaneScheme:
+    name: str
+    dtype: str = strawberry.field(description="NumPy dtype string, e.g. `<u2` for little-endian uint16")
+    offset: int
+    length: int
+
+
+@strawberry.type(description="A chunk of world tiles, packed as consecutive planes of size x size (y, x) arrays")
+class TileChunkScheme:
+    cx: int
+    cy: int
+    size: int
+    planes: list[TilePlaneScheme]
+    data: Base64
@@ -0,0 +1,42 @@
+# src/graphql/subscriptions.py
+from enum import Enum
+from typing import AsyncGenerator, Callable, Generic, Optional, TypeVar
+
+import strawberry
+
+from src.broker import get_broker
+from src.database.catalog import CatalogIndex, CatalogSnapshot, get_catalog
+from src.graphql.scalars import UUID
+
+T = TypeVar("T")
+
+
+@strawberry.enum(description="What happened to a row")
+class ChangeKind(Enum):
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    UPSERTED = "UPSERTED"  # created or updated by name
+    DELETED = "DELETED"
+
+
+@strawberry.type(description="A committed change; `node` is the row as it is now, null once deleted")
+class Change(Generic[T]):
+    kind: ChangeKind
+    id: UUID
+    node: Optional[T]
+
+
+async def watch(
+    topic: str, index: Callable[[CatalogSnapshot], CatalogIndex]
+) -> AsyncGenerator[Change, None]:
+    """
+    Changes published on `topic`, with the changed row looked up in the
+    catalog snapshot (reloaded before services publish). Ends with an error
+    if the subscriber falls too far behind.
+    """
+    with get_broker().subscribe(topic) as subscriber:
+        async for change in subscriber:
+            node = None
+            if change.kind != ChangeKind.DELETED.value:
+                node = index(await get_catalog()).by_id.get(change.id)
+            yield Change(kind=ChangeKind(change.kind), id=change.id, node=node)
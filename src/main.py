@@ -1,33 +1,76 @@
 # src/main.py
+import asyncio
 from pathlib import Path
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request
 
 from src.database import get_engine
-from src.database.models import Base
+from src.database.catalog import load_catalog
+from src.database.schema import ensure_schema
 
 from src.graphql import graphql_app
+from src.graphql.graphql import identify_client
+from src.graphql.extensions import get_document_cache, get_persisted_queries
+from src.database.services import get_token_cache
 from src.workers.seed import run_all_seeds
+from src.world import (
+    get_tile_store,
+    load_spatial_grid,
+    load_visibility,
+    run_spatial_reconciler,
+    track_spatial_writes,
+    track_visibility,
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Game server is starting up")
     
-    local_engine = get_engine()
-    async with local_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if await ensure_schema(get_engine()):
+        print("✔ Database schema applied")
 
     seed_file = Path(__file__).parent / "seed"
 
     await run_all_seeds(seed_file)
 
+    catalog = await load_catalog()
+    print(f"✔ Catalog snapshot v{catalog.version} loaded")
+
+    track_spatial_writes()
+    grid = await load_spatial_grid()
+    print(f"✔ Spatial grid loaded: {len(grid)} entities")
+
+    track_visibility()
+    load_visibility(grid)
+    # writes by other workers only reach this process's grid through reconciles
+    reconciler = asyncio.create_task(run_spatial_reconciler())
+
     print("✅ GraphiQL available at http://127.0.0.1:8000/graphql")
 
     yield
 
+    reconciler.cancel()
+    get_tile_store().flush()
     print("Game server is shutting down")
 
 app = FastAPI(lifespan=lifespan)
 
-app.include_router(graphql_app, prefix="/graphql")
\ No newline at end of file
+app.include_router(graphql_app, prefix="/graphql")
+
+async def require_client(request: Request):
+    """Identity of the Bearer token's client; 401 without a valid one."""
+    client = await identify_client(request.headers.get("Authorization", ""))
+    if client is None:
+        raise HTTPException(status_code=401, detail="Authorization required")
+    return client
+
+@app.get("/stats/caches", dependencies=[Depends(require_client)])
+async def cache_stats() -> dict:
+    """Size and hit ratio of the in-process caches."""
+    return {
+        "documents": get_document_cache().stats(),
+        "persisted_queries": get_persisted_queries().stats(),
+        "tokens": get_token_cache().stats(),
+        "tiles": get_tile_store().stats(),
+    }
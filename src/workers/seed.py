@@ -1,166 +1,314 @@
 # src/workers/seed.py
 from __future__ import annotations
 
+import asyncio
 import pathlib
 import hashlib
-import yaml
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
 
+from sqlalchemy import delete, func, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.database import get_db
-from src.database.services import (
-    ItemTypeService, 
-    StructureTypeService, 
-    BotTypeService, 
-    BotRecipeService, 
-    BuildingTypeService
+from src.config import get_settings
+from src.database import get_engine, get_sessionmaker
+from src.database.catalog import bump_revisions
+from src.database.models import (
+    SeedMeta,
+    SeedEntry,
+    ItemType,
+    StructureType,
+    BotType,
+    BotRecipe,
+    BuildingType,
+    BuildingRecipe,
 )
-
-from src.database.models import SeedMeta
-
-async def _already_applied(db, sha):
-    result = await db.execute(select(SeedMeta).where(SeedMeta.file_sha == sha))
-    return result.scalar_one_or_none() is not None
-
-
-async def _mark_applied(db: AsyncSession, sha: str, path: pathlib.Path) -> None:
-    db.add(SeedMeta(file_sha=sha, file_path=str(path)))
-
-    try:
-        await db.commit()
-    except IntegrityError:
-        await db.rollback()
-
-
-def _file_sha256(path: pathlib.Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
-async def seed_item_types(file: pathlib.Path) -> None:
-    sha = _file_sha256(file)
-
-    async for db in get_db():
-        if await _already_applied(db, sha):
-            print(f"✔ ItemType seed already applied: {sha[:7]}")
+from src.database.upsert import upsert_rows
+from src.workers.seed_cache import file_sha256, load_seed_file
+
+# name -> id of every row of each referenced table
+Refs = dict[type, dict[str, uuid.UUID]]
+
+
+@dataclass(frozen=True)
+class Child:
+    """Rows of `model` listed under `key` in each entry, linked to it by `parent_key`."""
+    model: type
+    key: str
+    parent_key: str
+    row: Callable[[dict, Refs], dict]
+
+
+@dataclass(frozen=True)
+class Seed:
+    """One seed file: the table it fills, the tables it references and how entries map to rows."""
+    file: str
+    section: str
+    label: str
+    table: type
+    depends_on: tuple[type, ...]
+    row: Callable[[dict, Refs], dict]
+    children: tuple[Child, ...] = ()
+
+
+def _parse(path: pathlib.Path, sha: str, section: str) -> list[dict]:
+    cache_dir = get_settings().seed_cache_dir
+    payload = load_seed_file(path, sha, pathlib.Path(cache_dir) if cache_dir else None)
+    return payload.get(section) or []
+
+
+async def _applied_shas(shas: list[str]) -> set[str]:
+    async with get_sessionmaker()() as db:
+        result = await db.execute(select(SeedMeta.file_sha).where(SeedMeta.file_sha.in_(shas)))
+        return set(result.scalars())
+
+
+async def _name_map(db: AsyncSession, model) -> dict[str, uuid.UUID]:
+    """name -> id for every row of `model`, in one query."""
+    result = await db.execute(select(model.name, model.id))
+    return dict(result.all())
+
+
+def _resolve(names: dict[str, uuid.UUID], name: str, label: str) -> uuid.UUID:
+    if name not in names:
+        raise RuntimeError(f'{label} "{name}" not found')
+    return names[name]
+
+
+async def _referenced(db: AsyncSession, seed: Seed, ids: list[uuid.UUID]) -> set[uuid.UUID]:
+    """ids of `seed.table` rows still pointed at by rows other than the seed's own children."""
+    if not ids:
+        return set()
+    target = seed.table.__table__
+    own = {child.model.__table__ for child in seed.children}
+    found: set[uuid.UUID] = set()
+    for table in target.metadata.tables.values():
+        if table in own:
+            continue
+        for fk in table.foreign_keys:
+            if fk.column.table is target:
+                result = await db.execute(select(fk.parent).where(fk.parent.in_(ids)).distinct())
+                found.update(result.scalars())
+    return found
+
+
+def _lock_key(file: str) -> int:
+    """Signed 64-bit advisory lock key for a seed file."""
+    return int.from_bytes(hashlib.sha256(f"seed:{file}".encode()).digest()[:8], "big", signed=True)
+
+
+def _entry_sha(raw: dict) -> str:
+    return hashlib.sha256(json.dumps(raw, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def _apply(seed: Seed, file: pathlib.Path, sha: str, entries: list[dict]) -> None:
+    """
+    Apply the difference between a changed seed file and what was seeded
+    before, in a single transaction on its own session. Entries are compared
+    by content hash; only added, changed and removed entries (and their child
+    rows) are written, each table with one bulk statement.
+    Rows that exist without a recorded hash are treated as changed. Removed
+    entries still referenced by other rows are kept (with a warning) and
+    retried on the next change of the file.
+    Workers applying the same file concurrently are serialized by an advisory
+    lock on PostgreSQL; elsewhere the unique `seed_meta.file_sha` and
+    `seed_entries (seed, name)` make all but the first one roll back.
+    """
+    async with get_sessionmaker()() as db:
+        if db.bind.dialect.name == "postgresql":
+            await db.execute(select(func.pg_advisory_xact_lock(_lock_key(seed.file))))
+        applied = await db.execute(select(SeedMeta.id).where(SeedMeta.file_sha == sha).limit(1))
+        if applied.first() is not None:
+            print(f"✔ {seed.label} seed already applied: {sha[:7]}")
             return
 
-        payload = yaml.safe_load(file.read_text())
-        items = payload.get("items", [])
-
-        # Upsert each item
-        for raw in items:
-            await ItemTypeService.upsert_from_dict(db, raw)
-
-        await _mark_applied(db, sha, file)
-        await db.commit()
-        print(f"✔ Seeded {len(items)} item types (hash {sha[:7]})")
-
-
-async def seed_structure_types(file: pathlib.Path) -> None:
-    sha = _file_sha256(file)
-
-    async for db in get_db():
-        if await _already_applied(db, sha):
-            print(f"✔ StructureType seed already applied: {sha[:7]}")
+        try:
+            added, changed, removed = await _write(db, seed, file, sha, entries)
+            await db.commit()
+        except IntegrityError:
+            # another worker applied the same file concurrently
+            await db.rollback()
+            print(f"✔ {seed.label} seed applied concurrently: {sha[:7]}")
             return
 
-        payload = yaml.safe_load(file.read_text())
-        structs = payload.get("structures", [])
-
-        for raw in structs:
-            item_type_name = raw.pop("item_type")
-            item_type_row = await ItemTypeService.get_by_name(db, item_type_name)
-            if item_type_row is None:
-                raise RuntimeError(f'ItemType "{item_type_name}" not found')
-            raw["item_type_id"] = item_type_row.id
-
-            engage_name = raw.pop("item_to_engage", None)
-            if engage_name:
-                engage_row = await ItemTypeService.get_by_name(db, engage_name)
-                if engage_row is None:
-                    raise RuntimeError(f'ItemType "{engage_name}" not found')
-                raw["item_to_engage_id"] = engage_row.id
-            else:
-                raw["item_to_engage_id"] = None
-
-            await StructureTypeService.upsert_from_dict(db, raw)
-
-        await _mark_applied(db, sha, file)
-        await db.commit()
-        print(f"✔ Seeded {len(structs)} structure types (hash {sha[:7]})")
-
-
-async def seed_bot_types(file: pathlib.Path) -> None:
-    sha = _file_sha256(file)
+    print(
+        f"✔ Seeded {seed.label} (hash {sha[:7]}): "
+        f"{len(added)} added, {len(changed)} changed, {len(removed)} removed"
+    )
+
+
+async def _write(
+    db: AsyncSession, seed: Seed, file: pathlib.Path, sha: str, entries: list[dict]
+) -> tuple[list[str], list[str], list[str]]:
+    """Stage the diff of `entries` against the database; returns added, changed and removed names."""
+    refs = {table: await _name_map(db, table) for table in seed.depends_on}
+    existing = await _name_map(db, seed.table)
+    result = await db.execute(
+        select(SeedEntry.name, SeedEntry.entry_sha).where(SeedEntry.seed == seed.label)
+    )
+    stored = dict(result.all())
+
+    by_name: dict[str, dict] = {}
+    for raw in entries:
+        by_name.setdefault(raw["name"], raw)
+    hashes = {name: _entry_sha(raw) for name, raw in by_name.items()}
+
+    added = [name for name in by_name if name not in existing]
+    changed = [name for name in by_name if name in existing and stored.get(name) != hashes[name]]
+    dropped = [name for name in stored if name not in by_name]
+    removed = [name for name in dropped if name in existing]
+
+    referenced = await _referenced(db, seed, [existing[name] for name in removed])
+    kept = [name for name in removed if existing[name] in referenced]
+    if kept:
+        print(f"⚠ {seed.label} still referenced, not removed: {', '.join(kept)}")
+        removed = [name for name in removed if name not in kept]
+        dropped = [name for name in dropped if name not in kept]
+
+    written = added + changed
+    stale = [existing[name] for name in changed + removed]
+    for child in seed.children:
+        if stale:
+            await db.execute(delete(child.model).where(getattr(child.model, child.parent_key).in_(stale)))
+    if removed:
+        await db.execute(delete(seed.table).where(seed.table.id.in_([existing[n] for n in removed])))
+
+    # one INSERT ... ON CONFLICT (name) for added and changed rows alike, so a
+    # row inserted meanwhile by another worker is updated instead of failing
+    rows = await upsert_rows(db, seed.table, [seed.row(by_name[name], refs) for name in written])
+    ids = {name: row.id for name, row in zip(written, rows)}
+
+    for child in seed.children:
+        child_rows = [
+            {**child.row(line, refs), child.parent_key: ids[name]}
+            for name in added + changed
+            for line in by_name[name].get(child.key) or []
+        ]
+        if child_rows:
+            await db.execute(insert(child.model), child_rows)
+
+    if written or dropped:
+        await db.execute(
+            delete(SeedEntry).where(SeedEntry.seed == seed.label, SeedEntry.name.in_(written + dropped))
+        )
+    if written:
+        await db.execute(
+            insert(SeedEntry),
+            [{"seed": seed.label, "name": name, "entry_sha": hashes[name]} for name in written],
+        )
+    if written or removed:
+        # workers that already loaded their catalog rebuild it
+        await bump_revisions(db, [seed.label])
+    db.add(SeedMeta(file_sha=sha, file_path=str(file)))
+    await db.flush()
+    return added, changed, removed
+
+
+def _item_type_row(raw: dict, refs: Refs) -> dict:
+    return {"name": raw["name"], "durability": raw.get("durability")}
+
+
+def _structure_type_row(raw: dict, refs: Refs) -> dict:
+    items = refs[ItemType]
+    engage_name = raw.get("item_to_engage")
+    return {
+        "name": raw["name"],
+        "health": raw["health"],
+        "item_type_id": _resolve(items, raw["item_type"], "ItemType"),
+        "max_items": raw["max_items"],
+        "item_to_engage_id": _resolve(items, engage_name, "ItemType") if engage_name else None,
+    }
+
+
+def _bot_type_row(raw: dict, refs: Refs) -> dict:
+    return {
+        "name": raw["name"],
+        "health": raw["health"],
+        "strength": raw["strength"],
+        "speed": raw["speed"],
+        "vision": raw["vision"],
+    }
+
+
+def _building_type_row(raw: dict, refs: Refs) -> dict:
+    return {"name": raw["name"], "health": raw["health"]}
+
+
+def _item_amount_row(raw: dict, refs: Refs) -> dict:
+    return {"item_type_id": _resolve(refs[ItemType], raw["item_type"], "ItemType"), "amount": raw["amount"]}
+
+
+SEEDS: tuple[Seed, ...] = (
+    Seed("items.yaml", "items", "ItemType", ItemType, (), _item_type_row),
+    Seed("structures.yaml", "structures", "StructureType", StructureType, (ItemType,), _structure_type_row),
+    Seed(
+        "bots.yaml", "bots", "BotType", BotType, (ItemType,), _bot_type_row,
+        children=(Child(BotRecipe, "recipes", "bot_type_id", _item_amount_row),),
+    ),
+    Seed(
+        "buildings.yaml", "buildings", "BuildingType", BuildingType, (ItemType,), _building_type_row,
+        children=(Child(BuildingRecipe, "recipes", "building_type_id", _item_amount_row),),
+    ),
+)
 
-    async for db in get_db():
-        if await _already_applied(db, sha):
-            print(f"✔ BotType seed already applied: {sha[:7]}")
-            return
 
-        payload = yaml.safe_load(file.read_text())
-        bots = payload.get("bots", [])
-
-        for raw in bots:
-            # Extract and transform recipe info
-            raw_recipes = raw.pop("recipes", [])
-            recipe_models = []
-
-            for r in raw_recipes:
-                item_type_name = r.get("item_type")
-                item_type = await ItemTypeService.get_by_name(db, item_type_name)
-                if item_type is None:
-                    raise RuntimeError(f'ItemType "{item_type_name}" not found')
-
-                recipe_models.append({
-                    "item_type_id": item_type.id,
-                    "amount": r["amount"],
-                })
-
-            # Create BotType
-            bottype = await BotTypeService.upsert_from_dict(db, {
-                "name": raw["name"],
-                "health": raw["health"],
-                "strength": raw["strength"],
-                "speed": raw["speed"],
-                "vision": raw["vision"],
-            })
-
-            if bottype:
-                for r in recipe_models:
-                    await BotRecipeService.create(
-                        db=db,
-                        bot_type_id=bottype.id,
-                        item_type_id=r["item_type_id"],
-                        amount=r["amount"]
-                    )
-
-        await _mark_applied(db, sha, file)
-        await db.commit()
-        print(f"✔ Seeded {len(bots)} bot types (hash {sha[:7]})")
-
-async def seed_building_types(file: pathlib.Path) -> None:
-    sha = _file_sha256(file)
-
-    async for db in get_db():
-        if await _already_applied(db, sha):
-            print(f"✔ BuildingType seed already applied: {sha[:7]}")
+def _check_graph(seeds: Sequence[Seed]) -> None:
+    """Every dependency must be filled by some seed, and the graph must be acyclic."""
+    producers = {seed.table: seed for seed in seeds}
+    for seed in seeds:
+        for table in seed.depends_on:
+            if table not in producers:
+                raise RuntimeError(f"{seed.file}: no seed fills {table.__name__}")
+
+    done: set[type] = set()
+    pending = list(seeds)
+    while pending:
+        ready = [seed for seed in pending if set(seed.depends_on) <= done]
+        if not ready:
+            raise RuntimeError(f"Seed dependency cycle between {[seed.file for seed in pending]}")
+        done.update(seed.table for seed in ready)
+        pending = [seed for seed in pending if seed not in ready]
+
+
+async def run_all_seeds(seed_dir: pathlib.Path, seeds: Sequence[Seed] = SEEDS) -> None:
+    """
+    Hash all seed files in worker threads, parse the ones not applied yet the
+    same way (from the parsed-seed cache when possible), then apply each seed as soon as the seeds filling its
+    dependencies are done. Independent seeds run concurrently on separate
+    sessions; SQLite has a single writer, so there they are applied one at a time.
+    """
+    _check_graph(seeds)
+    files = [seed_dir / seed.file for seed in seeds]
+
+    shas = await asyncio.gather(*(asyncio.to_thread(file_sha256, file) for file in files))
+    applied = await _applied_shas(list(shas))
+
+    async def parse(seed: Seed, file: pathlib.Path, sha: str) -> Optional[list[dict]]:
+        if sha in applied:
+            return None
+        return await asyncio.to_thread(_parse, file, sha, seed.section)
+
+    parsed = await asyncio.gather(*(parse(*args) for args in zip(seeds, files, shas)))
+
+    writers = asyncio.Semaphore(1 if get_engine().dialect.name == "sqlite" else len(seeds))
+    tasks: dict[type, asyncio.Task] = {}
+
+    async def run(seed: Seed, file: pathlib.Path, sha: str, entries: Optional[list[dict]]) -> None:
+        await asyncio.gather(*(tasks[table] for table in seed.depends_on))
+        if entries is None:
+            print(f"✔ {seed.label} seed already applied: {sha[:7]}")
             return
+        async with writers:
+            await _apply(seed, file, sha, entries)
 
-        payload = yaml.safe_load(file.read_text())
-        buildings = payload.get("buildings", [])
-
-        for raw in buildings:
-            await BuildingTypeService.upsert_from_dict(db, raw)
-
-        await _mark_applied(db, sha, file)
-        await db.commit()
-        print(f"✔ Seeded {len(buildings)} building types (hash {sha[:7]})")
-
-async def run_all_seeds(seed_dir: pathlib.Path) -> None:
-    await seed_item_types(seed_dir / "items.yaml")
-    await seed_structure_types(seed_dir / "structures.yaml")
-    await seed_bot_types(seed_dir / "bots.yaml")
-    await seed_building_types(seed_dir / "buildings.yaml")
\ No newline at end of file
+    for args in zip(seeds, files, shas, parsed):
+        tasks[args[0].table] = asyncio.create_task(run(*args))
+    try:
+        await asyncio.gather(*tasks.values())
+    finally:
+        for task in tasks.values():
+            task.cancel()
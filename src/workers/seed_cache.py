@@ -0,0 +1,70 @@
+# src/workers/seed_cache.py
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import pathlib
+import tempfile
+from typing import Any, Optional
+
+import yaml
+
+# libyaml bindings when PyYAML was built with them, the pure-Python loader otherwise
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when the cached structure changes; blobs of other versions are ignored
+CACHE_FORMAT = 1
+LOADER_VERSION = f"{CACHE_FORMAT}-{yaml.__version__}-{Loader.__name__}-m{marshal.version}"
+
+
+def file_sha256(path: pathlib.Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _cache_path(cache_dir: pathlib.Path, path: pathlib.Path, sha: str) -> pathlib.Path:
+    key = hashlib.sha256(f"{sha}:{LOADER_VERSION}".encode()).hexdigest()[:32]
+    return cache_dir / f"{path.stem}.{key}.marshal"
+
+
+def _store(cache_dir: pathlib.Path, path: pathlib.Path, sha: str, payload: Any) -> None:
+    """Write the blob atomically and drop older blobs of the same file. Best effort."""
+    try:
+        blob = marshal.dumps(payload)
+    except ValueError:
+        # e.g. YAML timestamps; such files are simply not cached
+        return
+
+    target = _cache_path(cache_dir, path, sha)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=f".{path.stem}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, target)
+        for stale in cache_dir.glob(f"{path.stem}.*.marshal"):
+            if stale != target:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def load_seed_file(
+    path: pathlib.Path, sha: Optional[str] = None, cache_dir: Optional[pathlib.Path] = None
+) -> Any:
+    """
+    Parsed contents of a YAML seed file. A marshal blob keyed by the file's
+    SHA-256 and `LOADER_VERSION` is used when present, and written after a
+    fresh parse. `cache_dir` defaults to `.cache/` next to the file.
+    """
+    sha = sha or file_sha256(path)
+    cache_dir = cache_dir or path.parent / ".cache"
+
+    try:
+        return marshal.loads(_cache_path(cache_dir, path, sha).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    payload = yaml.load(path.read_bytes(), Loader=Loader)
+    _store(cache_dir, path, sha, payload)
+    return payload
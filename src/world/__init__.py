@@ -0,0 +1,28 @@
+# src/world/__init__.py
+from .spatial import (
+    BotEntry,
+    BuildingEntry,
+    StructureEntry,
+    SpatialGrid,
+    get_spatial_grid,
+    load_spatial_grid,
+    reconcile_spatial_grid,
+    run_spatial_reconciler,
+    track_spatial_writes,
+)
+from .tiles import PLANES, TileChunk, TileStore, get_tile_store
+from .visibility import (
+    TileBitset,
+    VisibilityEngine,
+    get_visibility,
+    load_visibility,
+    track_visibility,
+)
+
+__all__ = [
+    "BotEntry", "BuildingEntry", "StructureEntry",
+    "SpatialGrid", "get_spatial_grid", "load_spatial_grid", "reconcile_spatial_grid",
+    "run_spatial_reconciler", "track_spatial_writes",
+    "PLANES", "TileChunk", "TileStore", "get_tile_store",
+    "TileBitset", "VisibilityEngine", "get_visibility", "load_visibility", "track_visibility"
+]
@@ -0,0 +1,258 @@
+# src/world/spatial.py
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, fields
+from datetime import datetime
+from itertools import chain
+from typing import Callable, Iterator, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.database import get_sessionmaker
+from src.database.models import Bot, Building, Structure
+
+
+@dataclass(frozen=True, slots=True)
+class BotEntry:
+    id: UUID
+    name: str
+    type_id: UUID
+    client_id: UUID
+    x: int
+    y: int
+    level: int
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class BuildingEntry:
+    id: UUID
+    name: str
+    type_id: UUID
+    client_id: UUID
+    x: int
+    y: int
+    level: int
+    current_health: int
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class StructureEntry:
+    id: UUID
+    type_id: UUID
+    items: int
+    x: int
+    y: int
+    created_at: datetime
+
+
+Entry = Union[BotEntry, BuildingEntry, StructureEntry]
+
+_ENTRIES: dict[type, type] = {
+    Bot: BotEntry,
+    Building: BuildingEntry,
+    Structure: StructureEntry,
+}
+
+
+def _entry(instance) -> Entry:
+    entry_type = _ENTRIES[type(instance)]
+    return entry_type(**{f.name: getattr(instance, f.name) for f in fields(entry_type)})
+
+
+class SpatialGrid:
+    """
+    Uniform-grid hash of every positioned entity: `(x // cell_size, y // cell_size)`
+    -> entities in that cell. Rectangle queries visit the covered cells (or the
+    occupied ones, whichever are fewer) and check exact bounds only there.
+    """
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[UUID, Entry]] = {}
+        self._entries: dict[UUID, Entry] = {}
+
+    def cell(self, x: int, y: int) -> tuple[int, int]:
+        return x // self.cell_size, y // self.cell_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Entry]:
+        return iter(self._entries.values())
+
+    def get(self, id: UUID) -> Optional[Entry]:
+        return self._entries.get(id)
+
+    def put(self, entry: Entry) -> None:
+        """Insert `entry`, or replace (and possibly move) the one with its id."""
+        self.remove(entry.id)
+        self._entries[entry.id] = entry
+        self._cells.setdefault(self.cell(entry.x, entry.y), {})[entry.id] = entry
+
+    def remove(self, id: UUID) -> None:
+        entry = self._entries.pop(id, None)
+        if entry is None:
+            return
+        key = self.cell(entry.x, entry.y)
+        bucket = self._cells[key]
+        del bucket[id]
+        if not bucket:
+            del self._cells[key]
+
+    def _buckets(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[dict[UUID, Entry]]:
+        cx0, cy0 = self.cell(x0, y0)
+        cx1, cy1 = self.cell(x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) <= len(self._cells):
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    bucket = self._cells.get((cx, cy))
+                    if bucket:
+                        yield bucket
+        else:
+            for (cx, cy), bucket in self._cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    yield bucket
+
+    def query(self, x0: int, y0: int, x1: int, y1: int) -> list[Entry]:
+        """Entities with `x0 <= x <= x1` and `y0 <= y <= y1` (corners in any order)."""
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        return [
+            entry
+            for bucket in self._buckets(x0, y0, x1, y1)
+            for entry in bucket.values()
+            if x0 <= entry.x <= x1 and y0 <= entry.y <= y1
+        ]
+
+
+_grid: Optional[SpatialGrid] = None
+_lock = asyncio.Lock()
+
+def get_spatial_grid() -> SpatialGrid:
+    global _grid
+    if _grid is None:
+        _grid = SpatialGrid(get_settings().world_cell_size)
+    return _grid
+
+async def _committed_entries() -> dict[UUID, Entry]:
+    async with get_sessionmaker()() as db:
+        return {
+            instance.id: _entry(instance)
+            for model in _ENTRIES
+            for instance in (await db.execute(select(model))).scalars()
+        }
+
+async def load_spatial_grid() -> SpatialGrid:
+    """Build the grid from committed rows and swap it in."""
+    global _grid
+    async with _lock:
+        grid = SpatialGrid(get_settings().world_cell_size)
+        for entry in (await _committed_entries()).values():
+            grid.put(entry)
+        _grid = grid
+        return grid
+
+
+_PENDING = "spatial_grid_pending"
+# id -> new entry, or None when the row was deleted
+Changes = dict[UUID, Optional[Entry]]
+_hooks: list[Callable[[Changes], None]] = []
+# ids committed by this process while a reconcile reads the tables
+_touched: Optional[set[UUID]] = None
+
+def on_spatial_commit(hook: Callable[[Changes], None]) -> None:
+    """Call `hook(changes)` after each commit's changes are applied to the grid."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+def _after_flush(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe what this flush wrote
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if type(instance) in _ENTRIES:
+            pending = session.info.setdefault(_PENDING, {})
+            pending[instance.id] = None if instance in session.deleted else _entry(instance)
+
+def _apply(changes: Changes) -> None:
+    grid = get_spatial_grid()
+    for id, entry in changes.items():
+        if entry is None:
+            grid.remove(id)
+        else:
+            grid.put(entry)
+    for hook in _hooks:
+        hook(changes)
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if not pending:
+        return
+    if _touched is not None:
+        _touched.update(pending)
+    _apply(pending)
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+def track_spatial_writes() -> None:
+    """
+    Keep the grid in sync with ORM writes to bots, buildings and structures:
+    changes are collected on flush and applied once the transaction commits.
+    Core-level bulk statements and other workers bypass this; see
+    `reconcile_spatial_grid`.
+    """
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
+
+
+def _same(a: Entry, b: Entry) -> bool:
+    # `created_at` never changes, but a freshly flushed instance holds it timezone-aware
+    return type(a) is type(b) and all(
+        getattr(a, f.name) == getattr(b, f.name) for f in fields(a) if f.name != "created_at"
+    )
+
+async def reconcile_spatial_grid() -> Changes:
+    """
+    Bring the grid in line with the committed rows, including writes by other
+    workers (and Core-level statements), which never reach this process's
+    commit events. Differences are applied like a local commit, hooks
+    included. Ids this process commits while the rows are read are left
+    alone: their commit is newer than what was read.
+    """
+    global _touched
+    async with _lock:
+        _touched = set()
+        try:
+            committed = await _committed_entries()
+            touched = _touched
+        finally:
+            _touched = None
+
+    grid = get_spatial_grid()
+    changes: Changes = {}
+    for id, entry in committed.items():
+        current = grid.get(id)
+        if id not in touched and (current is None or not _same(current, entry)):
+            changes[id] = entry
+    changes.update({entry.id: None for entry in grid if entry.id not in committed and entry.id not in touched})
+    if changes:
+        _apply(changes)
+    return changes
+
+async def run_spatial_reconciler() -> None:
+    """Reconcile the grid every `WORLD_RECONCILE_INTERVAL` seconds; runs until cancelled."""
+    interval = get_settings().world_reconcile_interval
+    if interval <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await reconcile_spatial_grid()
+        except Exception as exc:
+            print(f"⚠ Spatial grid reconcile failed: {exc!r}")
@@ -0,0 +1,143 @@
+# src/world/tiles.py
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.config import get_settings
+
+# (name, dtype) of each plane, widest first so every plane stays aligned
+PLANES: tuple[tuple[str, np.dtype], ...] = (
+    ("resource", np.dtype("<u4")),
+    ("terrain", np.dtype("<u2")),
+    ("occupancy", np.dtype("u1")),
+)
+TILE_BYTES = sum(dtype.itemsize for _, dtype in PLANES)
+
+
+class TileChunk:
+    """
+    `size` x `size` tiles as one flat byte buffer holding each plane in turn;
+    `resource`, `terrain` and `occupancy` are (y, x) array views into it.
+    The buffer is exactly the packed wire and file format.
+    """
+    def __init__(self, cx: int, cy: int, size: int, buffer: np.ndarray):
+        self.cx = cx
+        self.cy = cy
+        self.size = size
+        self.buffer = buffer
+        offset = 0
+        for name, dtype in PLANES:
+            end = offset + size * size * dtype.itemsize
+            setattr(self, name, buffer[offset:end].view(dtype).reshape(size, size))
+            offset = end
+
+    def tobytes(self) -> bytes:
+        return self.buffer.tobytes()
+
+    def flush(self) -> None:
+        if isinstance(self.buffer, np.memmap):
+            self.buffer.flush()
+
+
+class TileStore:
+    """
+    Chunked tile planes persisted as one memory-mapped file per chunk under
+    `root`. Chunks are mapped on first access and unmapped (after flushing)
+    once more than `max_open` are held; the OS page cache does the rest.
+    Chunks never written read as zeros and get no file. Mapping and page
+    faults block, so async callers use the store from a worker thread
+    (`asyncio.to_thread`); the open-chunk cache is guarded by a lock.
+    """
+    def __init__(self, root: Path, chunk_size: int, max_open: int):
+        self.root = root
+        self.chunk_size = chunk_size
+        self.max_open = max_open
+        self.chunk_bytes = chunk_size * chunk_size * TILE_BYTES
+        self._open: OrderedDict[tuple[int, int], TileChunk] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, cx: int, cy: int) -> Path:
+        return self.root / f"{cx}_{cy}.tiles"
+
+    def locate(self, x: int, y: int) -> tuple[int, int, int, int]:
+        """`(cx, cy, ox, oy)`: the chunk holding tile (x, y) and its offset in it."""
+        cx, ox = divmod(x, self.chunk_size)
+        cy, oy = divmod(y, self.chunk_size)
+        return cx, cy, ox, oy
+
+    def chunk(self, cx: int, cy: int, create: bool = False) -> Optional[TileChunk]:
+        """The mapped chunk, or None when it has no file and `create` is false."""
+        with self._lock:
+            return self._chunk(cx, cy, create)
+
+    def _chunk(self, cx: int, cy: int, create: bool) -> Optional[TileChunk]:
+        key = (cx, cy)
+        chunk = self._open.get(key)
+        if chunk is not None:
+            self._open.move_to_end(key)
+            return chunk
+
+        path = self.path(cx, cy)
+        if path.exists():
+            if os.path.getsize(path) != self.chunk_bytes:
+                raise RuntimeError(f"{path} does not hold a {self.chunk_size}x{self.chunk_size} chunk")
+            buffer = np.memmap(path, dtype=np.uint8, mode="r+", shape=(self.chunk_bytes,))
+        elif create:
+            self.root.mkdir(parents=True, exist_ok=True)
+            buffer = np.memmap(path, dtype=np.uint8, mode="w+", shape=(self.chunk_bytes,))
+        else:
+            return None
+
+        chunk = self._open[key] = TileChunk(cx, cy, self.chunk_size, buffer)
+        while len(self._open) > self.max_open:
+            _, evicted = self._open.popitem(last=False)
+            evicted.flush()
+        return chunk
+
+    def read(self, cx: int, cy: int) -> TileChunk:
+        """The chunk at (cx, cy); an unwritten one reads as a read-only zero chunk."""
+        chunk = self.chunk(cx, cy)
+        if chunk is None:
+            buffer = np.zeros(self.chunk_bytes, dtype=np.uint8)
+            buffer.flags.writeable = False
+            chunk = TileChunk(cx, cy, self.chunk_size, buffer)
+        return chunk
+
+    def tile(self, x: int, y: int) -> dict[str, int]:
+        cx, cy, ox, oy = self.locate(x, y)
+        chunk = self.read(cx, cy)
+        return {name: int(getattr(chunk, name)[oy, ox]) for name, _ in PLANES}
+
+    def set_tile(self, x: int, y: int, **values: int) -> None:
+        """Set some planes (`terrain=`, `occupancy=`, `resource=`) of one tile."""
+        unknown = values.keys() - {name for name, _ in PLANES}
+        if unknown:
+            raise ValueError(f"Unknown tile planes: {sorted(unknown)}")
+        cx, cy, ox, oy = self.locate(x, y)
+        chunk = self.chunk(cx, cy, create=True)
+        for name, value in values.items():
+            getattr(chunk, name)[oy, ox] = value
+
+    def flush(self) -> None:
+        with self._lock:
+            for chunk in self._open.values():
+                chunk.flush()
+
+    def stats(self) -> dict:
+        return {"open_chunks": len(self._open), "max_open_chunks": self.max_open}
+
+
+_store: Optional[TileStore] = None
+
+def get_tile_store() -> TileStore:
+    global _store
+    if _store is None:
+        settings = get_settings()
+        _store = TileStore(Path(settings.tile_data_dir), settings.tile_chunk_size, settings.tile_max_open_chunks)
+    return _store
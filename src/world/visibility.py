@@ -0,0 +1,232 @@
+# src/world/visibility.py
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional
+from uuid import UUID
+
+from src.config import get_settings
+from src.database.catalog import current_catalog
+from .spatial import BotEntry, Changes, SpatialGrid, on_spatial_commit
+
+Tile = tuple[int, int]
+# (x, y, vision radius) of one bot
+Sight = tuple[int, int, int]
+
+
+@lru_cache(maxsize=None)
+def vision_disc(radius: int) -> frozenset[Tile]:
+    """Offsets of the tiles within `radius` of a bot (Euclidean)."""
+    return frozenset(
+        (dx, dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-radius, radius + 1)
+        if dx * dx + dy * dy <= radius * radius
+    )
+
+
+@lru_cache(maxsize=4096)
+def _disc_shift(radius: int, dx: int, dy: int) -> tuple[tuple[Tile, ...], tuple[Tile, ...]]:
+    """Offsets, from the old centre, of the tiles leaving and entering the disc when it moves by (dx, dy)."""
+    old = vision_disc(radius)
+    new = {(a + dx, b + dy) for a, b in old}
+    return tuple(old - new), tuple(new - old)
+
+
+class TileBitset:
+    """A set of tiles kept as one int bitmask per `chunk_size` x `chunk_size` chunk."""
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self._chunks: dict[Tile, int] = {}
+
+    def _locate(self, tile: Tile) -> tuple[Tile, int]:
+        cx, ox = divmod(tile[0], self.chunk_size)
+        cy, oy = divmod(tile[1], self.chunk_size)
+        return (cx, cy), oy * self.chunk_size + ox
+
+    def __contains__(self, tile: Tile) -> bool:
+        chunk, bit = self._locate(tile)
+        return bool(self._chunks.get(chunk, 0) >> bit & 1)
+
+    def add(self, tile: Tile) -> None:
+        chunk, bit = self._locate(tile)
+        self._chunks[chunk] = self._chunks.get(chunk, 0) | 1 << bit
+
+    def discard(self, tile: Tile) -> None:
+        chunk, bit = self._locate(tile)
+        mask = self._chunks.get(chunk, 0) & ~(1 << bit)
+        if mask:
+            self._chunks[chunk] = mask
+        else:
+            self._chunks.pop(chunk, None)
+
+    def __len__(self) -> int:
+        return sum(mask.bit_count() for mask in self._chunks.values())
+
+    def __iter__(self) -> Iterator[Tile]:
+        size = self.chunk_size
+        for (cx, cy), mask in self._chunks.items():
+            while mask:
+                low = mask & -mask
+                oy, ox = divmod(low.bit_length() - 1, size)
+                yield cx * size + ox, cy * size + oy
+                mask ^= low
+
+
+class ClientVisibility:
+    """
+    What one client sees (`visible`) and has ever seen (`explored`).
+    Every visible tile counts the bots seeing it, so a move only touches the
+    tiles entering and leaving that bot's disc. Each batch of moves that flips
+    some tiles bumps `version` and logs those tiles.
+    """
+    def __init__(self, chunk_size: int, log_size: int):
+        self.version = 0
+        self.visible = TileBitset(chunk_size)
+        self.explored = TileBitset(chunk_size)
+        self.log_size = log_size
+        self._coverage: dict[Tile, int] = {}
+        self._log: list[tuple[int, Tile]] = []
+        # changes up to this version have been dropped from the log
+        self._floor = 0
+
+    def _cover(self, tiles: Iterable[Tile], changed: set[Tile]) -> None:
+        for tile in tiles:
+            seen_by = self._coverage.get(tile, 0)
+            self._coverage[tile] = seen_by + 1
+            if not seen_by:
+                self.visible.add(tile)
+                self.explored.add(tile)
+                changed.add(tile)
+
+    def _uncover(self, tiles: Iterable[Tile], changed: set[Tile]) -> None:
+        for tile in tiles:
+            seen_by = self._coverage[tile] - 1
+            if seen_by:
+                self._coverage[tile] = seen_by
+            else:
+                del self._coverage[tile]
+                self.visible.discard(tile)
+                changed.add(tile)
+
+    def apply(self, moves: Iterable[tuple[Optional[Sight], Optional[Sight]]]) -> None:
+        """Apply `(before, after)` sights of bots; None means the bot was absent."""
+        changed: set[Tile] = set()
+        for old, new in moves:
+            if old is not None and new is not None and old[2] == new[2]:
+                x, y, radius = old
+                leaving, entering = _disc_shift(radius, new[0] - x, new[1] - y)
+                self._cover(((x + dx, y + dy) for dx, dy in entering), changed)
+                self._uncover(((x + dx, y + dy) for dx, dy in leaving), changed)
+                continue
+            # cover before uncovering, so tiles seen from both positions never flicker
+            if new is not None:
+                x, y, radius = new
+                self._cover(((x + dx, y + dy) for dx, dy in vision_disc(radius)), changed)
+            if old is not None:
+                x, y, radius = old
+                self._uncover(((x + dx, y + dy) for dx, dy in vision_disc(radius)), changed)
+
+        if changed:
+            self.version += 1
+            self._log.extend((self.version, tile) for tile in changed)
+            if len(self._log) > self.log_size:
+                self._trim()
+
+    def _trim(self) -> None:
+        """Drop the older half of the log, never splitting one version."""
+        cut = len(self._log) // 2
+        self._floor = self._log[cut - 1][0]
+        while cut < len(self._log) and self._log[cut][0] <= self._floor:
+            cut += 1
+        del self._log[:cut]
+
+    def changes_since(self, since: int) -> tuple[bool, list[tuple[Tile, bool, bool]]]:
+        """
+        `(reset, [(tile, visible, explored), ...])` for the tiles that changed
+        after version `since`. When the log no longer reaches back that far,
+        `reset` is True and every explored tile is returned instead.
+        """
+        if since < self._floor or since > self.version:
+            return True, [(tile, tile in self.visible, True) for tile in self.explored]
+        start = bisect_right(self._log, since, key=lambda change: change[0])
+        tiles = dict.fromkeys(tile for _, tile in self._log[start:])
+        return False, [(tile, tile in self.visible, tile in self.explored) for tile in tiles]
+
+
+class VisibilityEngine:
+    """
+    Fog of war of every client, driven by the bots of the spatial grid.
+    `epoch` identifies this engine, so versions handed out before a restart
+    are not mistaken for current ones.
+    """
+    def __init__(self, chunk_size: int, log_size: int):
+        self.chunk_size = chunk_size
+        self.log_size = log_size
+        self.epoch = uuid.uuid4().hex
+        self._clients: dict[UUID, ClientVisibility] = {}
+        # bot id -> (owner, sight)
+        self._bots: dict[UUID, tuple[UUID, Sight]] = {}
+
+    def client(self, client_id: UUID) -> ClientVisibility:
+        visibility = self._clients.get(client_id)
+        if visibility is None:
+            visibility = self._clients[client_id] = ClientVisibility(self.chunk_size, self.log_size)
+        return visibility
+
+    def apply(self, changes: Changes, vision: Callable[[UUID], int]) -> None:
+        """Update the clients owning the bots in `changes`, one version per client."""
+        moves: dict[UUID, list[tuple[Optional[Sight], Optional[Sight]]]] = {}
+        for id, entry in changes.items():
+            if entry is not None and not isinstance(entry, BotEntry):
+                continue
+            old = self._bots.pop(id, None)
+            new = None
+            if entry is not None:
+                new = self._bots[id] = (entry.client_id, (entry.x, entry.y, vision(entry.type_id)))
+            if old == new:
+                continue
+            if old is not None and new is not None and old[0] == new[0]:
+                moves.setdefault(old[0], []).append((old[1], new[1]))
+                continue
+            if old is not None:
+                moves.setdefault(old[0], []).append((old[1], None))
+            if new is not None:
+                moves.setdefault(new[0], []).append((None, new[1]))
+
+        for client_id, client_moves in moves.items():
+            self.client(client_id).apply(client_moves)
+
+
+def _vision(type_id: UUID) -> int:
+    catalog = current_catalog()
+    bot_type = catalog.bot_types.by_id.get(type_id) if catalog is not None else None
+    return bot_type.vision if bot_type is not None else 0
+
+
+_engine: Optional[VisibilityEngine] = None
+
+def get_visibility() -> VisibilityEngine:
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = VisibilityEngine(settings.visibility_chunk_size, settings.visibility_log_size)
+    return _engine
+
+def load_visibility(grid: SpatialGrid) -> VisibilityEngine:
+    """Build the fog of war from the bots in `grid` and swap it in."""
+    global _engine
+    settings = get_settings()
+    engine = VisibilityEngine(settings.visibility_chunk_size, settings.visibility_log_size)
+    engine.apply({entry.id: entry for entry in grid if isinstance(entry, BotEntry)}, _vision)
+    _engine = engine
+    return engine
+
+def _on_commit(changes: Changes) -> None:
+    get_visibility().apply(changes, _vision)
+
+def track_visibility() -> None:
+    """Update the fog of war whenever committed bot writes reach the spatial grid."""
+    on_spatial_commit(_on_commit)
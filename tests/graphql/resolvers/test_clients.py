@@ -90,6 +90,28 @@ async def test_update_client(test_client):
     assert data["data"]["client"]["update"]["name"] == rename_variables["name"]
 
 
+@pytest.mark.asyncio
+async def test_update_client_refreshes_cached_identity(test_client):
+    response = await test_client.post(
+        "/graphql",
+        json={"query": CLIENT_REGISTER_MUTATION, "variables": {"name": generate_unique_name("TestUserCache")}}
+    )
+    data = response.json()["data"]["client"]["create"]
+    headers = {"Authorization": f"Bearer {data['Token']}"}
+
+    # warm the token cache, then rename
+    await test_client.post("/graphql", json={"query": CLIENT_GET_ME_QUERY}, headers=headers)
+    new_name = generate_unique_name("TestUserCacheRenamed")
+    await test_client.post(
+        "/graphql",
+        json={"query": CLIENT_RENAME_MUTATUION, "variables": {"name": new_name, "id": data["id"]}},
+        headers=headers
+    )
+
+    response = await test_client.post("/graphql", json={"query": CLIENT_GET_ME_QUERY}, headers=headers)
+    assert response.json()["data"]["client"]["me"]["name"] == new_name
+
+
 @pytest.mark.asyncio
 async def test_get_client(test_client):
     variables = {"name": generate_unique_name("TestUserGetMe")}
@@ -1,7 +1,8 @@
+import json
 import uuid
 import pytest
 
-from ...utils import generate_unique_name, graphql_post, assert_error_contains
+from ...utils import generate_unique_name, get_auth_headers, graphql_post, assert_error_contains
 
 ITEMTYPE_CREATE_MUTATION = r"""
 mutation CreateItemType($input: ItemTypeInput!) {
@@ -15,6 +16,18 @@ mutation CreateItemType($input: ItemTypeInput!) {
 }
 """
 
+ITEMTYPE_CREATE_MANY_MUTATION = r"""
+mutation CreateItemTypes($input: [ItemTypeInput!]!) {
+  itemType {
+    createMany(input: $input) {
+      id
+      name
+      durability
+    }
+  }
+}
+"""
+
 ITEMTYPE_UPDATE_MUTATION = r"""
 mutation UpdateItemType($id: UUID!, $input: ItemTypeInput!) {
   itemType {
@@ -47,6 +60,26 @@ query GetItemTypeById($id: UUID!) {
 }
 """
 
+ITEMTYPE_PAGE_QUERY = r"""
+query PageItemTypes($first: Int, $after: String) {
+  itemType {
+    page(first: $first, after: $after) {
+      edges {
+        cursor
+        node {
+          id
+          name
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+    }
+  }
+}
+"""
+
 ITEMTYPE_GET_ALL_QUERY = r"""
 query GetAllItemTypes {
   itemType {
@@ -70,6 +103,18 @@ async def test_create_itemtype(test_client, auth_headers):
     assert result["name"] == variables["input"]["name"]
     assert result["durability"] == variables["input"]["durability"]
 
+@pytest.mark.asyncio
+async def test_create_many_itemtypes(test_client, auth_headers):
+    inputs = [{"name": generate_unique_name("ItemTypeBulk"), "durability": i} for i in range(5)]
+
+    data = await graphql_post(test_client, ITEMTYPE_CREATE_MANY_MUTATION, {"input": inputs}, auth_headers)
+
+    created = data["data"]["itemType"]["createMany"]
+    assert [{"name": i["name"], "durability": i["durability"]} for i in created] == inputs
+
+    data = await graphql_post(test_client, ITEMTYPE_CREATE_MANY_MUTATION, {"input": inputs[:1]}, auth_headers)
+    assert_error_contains(data, "already exists")
+
 @pytest.mark.asyncio
 async def test_update_itemtype(test_client, auth_headers):
     create_vars = {"input": {"name": generate_unique_name("ItemTypeUpdate"), "durability": 50}}
@@ -111,6 +156,51 @@ async def test_get_all_itemtype(test_client, auth_headers):
 
     assert isinstance(data, list)
 
+@pytest.mark.asyncio
+async def test_page_itemtypes(test_client, auth_headers):
+    data = await graphql_post(test_client, ITEMTYPE_GET_ALL_QUERY, headers=auth_headers)
+    expected = [item["id"] for item in data["data"]["itemType"]["all"]]
+
+    seen, after = [], None
+    while True:
+        data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, {"first": 3, "after": after}, auth_headers)
+        page = data["data"]["itemType"]["page"]
+        assert len(page["edges"]) <= 3
+        seen += [edge["node"]["id"] for edge in page["edges"]]
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        after = page["pageInfo"]["endCursor"]
+        assert after == page["edges"][-1]["cursor"]
+
+    assert seen == expected
+
+@pytest.mark.asyncio
+async def test_page_itemtypes_invalid_arguments(test_client, auth_headers):
+    data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, {"first": 101}, auth_headers)
+    assert_error_contains(data, "first must be between")
+
+    data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, {"after": "not-a-cursor"}, auth_headers)
+    assert_error_contains(data, "invalid cursor")
+
+@pytest.mark.asyncio
+async def test_stream_all_itemtypes(test_client, auth_headers):
+    query = "query { itemType { all @stream(initialCount: 1) { name ... @defer { durability } } } }"
+    response = await test_client.post(
+        "/graphql",
+        json={"query": query},
+        headers={**auth_headers, "Accept": "multipart/mixed;incrementalSpec=v0.2, application/json"}
+    )
+
+    assert response.headers["content-type"].startswith("multipart/mixed")
+    parts = [
+        json.loads(part.split("\r\n\r\n", 1)[1])
+        for part in response.text.split("\r\n---")
+        if "\r\n\r\n" in part
+    ]
+    assert len(parts[0]["data"]["itemType"]["all"]) == 1
+    assert parts[0]["hasNext"] is True
+    assert parts[-1]["hasNext"] is False
+
 @pytest.mark.asyncio
 async def test_delete_itemtype(test_client, auth_headers):
     create_vars = {"input": {"name": generate_unique_name("ItemTypeDelete"), "durability": 10}}
@@ -164,4 +254,60 @@ async def test_get_itemtype_by_id_malformed_uuid(test_client, auth_headers):
 async def test_get_all_itemtype_unauthenticated(test_client):
     data = await graphql_post(test_client, ITEMTYPE_GET_ALL_QUERY)
 
-    assert_error_contains(data, "authorization required")
\ No newline at end of file
+    assert_error_contains(data, "authorization required")
+
+
+@pytest.mark.asyncio
+async def test_get_all_itemtype_not_modified(test_client, auth_headers):
+    params = {"query": ITEMTYPE_GET_ALL_QUERY}
+    response = await test_client.get("/graphql", params=params, headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = await test_client.get("/graphql", params=params, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    variables = {"input": {"name": generate_unique_name("ItemTypeETag"), "durability": 5}}
+    await graphql_post(test_client, ITEMTYPE_CREATE_MUTATION, variables, auth_headers)
+
+    response = await test_client.get("/graphql", params=params, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert variables["input"]["name"] in [item["name"] for item in response.json()["data"]["itemType"]["all"]]
+
+
+@pytest.mark.asyncio
+async def test_get_all_itemtype_post_is_never_not_modified(test_client, auth_headers):
+    response = await test_client.get("/graphql", params={"query": ITEMTYPE_GET_ALL_QUERY}, headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = await test_client.post(
+        "/graphql",
+        json={"query": ITEMTYPE_GET_ALL_QUERY},
+        headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert "ETag" not in response.headers and "Cache-Control" not in response.headers
+    assert response.json()["data"]["itemType"]["all"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_responses_are_shared_across_clients(test_client, auth_headers):
+    params = {"query": ITEMTYPE_GET_ALL_QUERY}
+    response = await test_client.get("/graphql", params=params, headers=auth_headers)
+    assert response.headers["Cache-Control"] == "public, max-age=0, must-revalidate"
+    assert "authorization" not in response.headers["Vary"].lower()
+    etag = response.headers["ETag"]
+
+    register = await graphql_post(
+        test_client,
+        "mutation($name: String!) { client { create(input: {name: $name}) { Token } } }",
+        {"name": generate_unique_name("ETagClient")},
+    )
+    other_headers = get_auth_headers(register["data"]["client"]["create"]["Token"])
+    response = await test_client.get("/graphql", params=params, headers={**other_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = await test_client.get("/graphql", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert_error_contains(response.json(), "authorization required")
@@ -71,6 +71,27 @@ query GetRecipeById($id: UUID!) {
 }
 """
 
+RECIPE_GET_NESTED_QUERY = r"""
+query GetRecipeNested($id: UUID!) {
+  recipe {
+    byId(id: $id) {
+      id
+      outputItemType {
+        id
+        name
+      }
+      ingredients {
+        amount
+        itemType {
+          id
+          name
+        }
+      }
+    }
+  }
+}
+"""
+
 RECIPE_GET_ALL_QUERY = r"""
 query GetAllRecipes {
   recipe {
@@ -83,6 +104,56 @@ query GetAllRecipes {
 }
 """
 
+RECIPE_CREATE_MANY_MUTATION = r"""
+mutation CreateRecipes($input: [RecipeInput!]!) {
+  recipe {
+    createMany(input: $input) {
+      id
+      name
+      outputAmount
+      ingredients {
+        amount
+        itemType { id }
+      }
+    }
+  }
+}
+"""
+
+RECIPE_UPSERT_MANY_MUTATION = r"""
+mutation UpsertRecipes($input: [RecipeInput!]!) {
+  recipe {
+    upsertMany(input: $input) {
+      id
+      name
+      outputAmount
+      ingredients {
+        amount
+      }
+    }
+  }
+}
+"""
+
+RECIPE_PAGE_QUERY = r"""
+query PageRecipes($first: Int, $after: String, $filter: RecipeFilterInput, $orderBy: OrderByInput) {
+  recipe {
+    page(first: $first, after: $after, filter: $filter, orderBy: $orderBy) {
+      edges {
+        node {
+          name
+          buildingTypeId
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+    }
+  }
+}
+"""
+
 async def create_item_type(test_client, auth_headers):
     variables = {
         "input": {
@@ -175,6 +246,18 @@ async def test_get_recipe_by_id(test_client, auth_headers):
 
     assert fetched["id"] == recipe["id"]
 
+@pytest.mark.asyncio
+async def test_get_recipe_nested_relationships(test_client, auth_headers):
+    recipe = await create_recipe(test_client, auth_headers)
+
+    data = await graphql_post(test_client, RECIPE_GET_NESTED_QUERY, {"id": recipe["id"]}, auth_headers)
+    fetched = data["data"]["recipe"]["byId"]
+
+    assert fetched["outputItemType"]["name"].startswith("Item_")
+    assert len(fetched["ingredients"]) == 1
+    assert fetched["ingredients"][0]["amount"] == 2
+    assert fetched["ingredients"][0]["itemType"]["id"] == fetched["outputItemType"]["id"]
+
 @pytest.mark.asyncio
 async def test_get_all_recipes(test_client, auth_headers):
     data = await graphql_post(test_client, RECIPE_GET_ALL_QUERY, headers=auth_headers)
@@ -235,4 +318,111 @@ async def test_get_recipe_by_id_malformed_uuid(test_client, auth_headers):
 async def test_get_all_recipes_unauthenticated(test_client):
     data = await graphql_post(test_client, RECIPE_GET_ALL_QUERY)
     
-    assert_error_contains(data, "authorization required")
\ No newline at end of file
+    assert_error_contains(data, "authorization required")
+
+
+def recipe_inputs(building_type_id, item_type_id, count, amount=1):
+    return [
+        {
+            "name": generate_unique_name("BulkRecipe"),
+            "buildingTypeId": building_type_id,
+            "outputItemTypeId": item_type_id,
+            "outputAmount": amount,
+            "ingredients": [{"itemTypeId": item_type_id, "amount": amount}]
+        }
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_many_recipes(test_client, auth_headers):
+    item_type_id = await create_item_type(test_client, auth_headers)
+    building_type_id = await create_building_type(test_client, auth_headers)
+    inputs = recipe_inputs(building_type_id, item_type_id, 3)
+
+    data = await graphql_post(test_client, RECIPE_CREATE_MANY_MUTATION, {"input": inputs}, auth_headers)
+    created = data["data"]["recipe"]["createMany"]
+
+    assert [recipe["name"] for recipe in created] == [recipe["name"] for recipe in inputs]
+    for recipe in created:
+        assert recipe["ingredients"] == [{"amount": 1, "itemType": {"id": item_type_id}}]
+
+    data = await graphql_post(test_client, RECIPE_GET_ALL_QUERY, headers=auth_headers)
+    names = {recipe["name"] for recipe in data["data"]["recipe"]["all"]}
+    assert names >= {recipe["name"] for recipe in inputs}
+
+@pytest.mark.asyncio
+async def test_create_many_recipes_is_atomic(test_client, auth_headers):
+    item_type_id = await create_item_type(test_client, auth_headers)
+    building_type_id = await create_building_type(test_client, auth_headers)
+    inputs = recipe_inputs(building_type_id, item_type_id, 2)
+    inputs[1]["ingredients"][0]["itemTypeId"] = str(uuid.uuid4())
+
+    data = await graphql_post(test_client, RECIPE_CREATE_MANY_MUTATION, {"input": inputs}, auth_headers)
+    assert_error_contains(data, "ItemType not found")
+
+    data = await graphql_post(test_client, RECIPE_GET_ALL_QUERY, headers=auth_headers)
+    assert inputs[0]["name"] not in {recipe["name"] for recipe in data["data"]["recipe"]["all"]}
+
+@pytest.mark.asyncio
+async def test_upsert_many_recipes(test_client, auth_headers):
+    item_type_id = await create_item_type(test_client, auth_headers)
+    building_type_id = await create_building_type(test_client, auth_headers)
+    existing = recipe_inputs(building_type_id, item_type_id, 1)
+    data = await graphql_post(test_client, RECIPE_CREATE_MANY_MUTATION, {"input": existing}, auth_headers)
+    existing_id = data["data"]["recipe"]["createMany"][0]["id"]
+
+    inputs = recipe_inputs(building_type_id, item_type_id, 1, amount=7)
+    inputs[0]["name"] = existing[0]["name"]
+    inputs += recipe_inputs(building_type_id, item_type_id, 1, amount=7)
+
+    data = await graphql_post(test_client, RECIPE_UPSERT_MANY_MUTATION, {"input": inputs}, auth_headers)
+    upserted = data["data"]["recipe"]["upsertMany"]
+
+    assert upserted[0]["id"] == existing_id
+    assert [recipe["outputAmount"] for recipe in upserted] == [7, 7]
+    assert [recipe["ingredients"] for recipe in upserted] == [[{"amount": 7}], [{"amount": 7}]]
+
+@pytest.mark.asyncio
+async def test_create_many_recipes_duplicate_name(test_client, auth_headers):
+    item_type_id = await create_item_type(test_client, auth_headers)
+    building_type_id = await create_building_type(test_client, auth_headers)
+    inputs = recipe_inputs(building_type_id, item_type_id, 2)
+    inputs[1]["name"] = inputs[0]["name"]
+
+    data = await graphql_post(test_client, RECIPE_CREATE_MANY_MUTATION, {"input": inputs}, auth_headers)
+    assert_error_contains(data, "more than once")
+
+@pytest.mark.asyncio
+async def test_page_recipes_filtered_and_ordered(test_client, auth_headers):
+    item_type_id = await create_item_type(test_client, auth_headers)
+    building_type_id = await create_building_type(test_client, auth_headers)
+    inputs = recipe_inputs(building_type_id, item_type_id, 5)
+    await graphql_post(test_client, RECIPE_CREATE_MANY_MUTATION, {"input": inputs}, auth_headers)
+    other_building_type_id = await create_building_type(test_client, auth_headers)
+    await graphql_post(
+        test_client, RECIPE_CREATE_MANY_MUTATION,
+        {"input": recipe_inputs(other_building_type_id, item_type_id, 2)}, auth_headers
+    )
+
+    variables = {
+        "first": 2,
+        "filter": {"buildingTypeId": building_type_id},
+        "orderBy": {"field": "NAME", "direction": "DESC"},
+    }
+    names = []
+    while True:
+        data = await graphql_post(test_client, RECIPE_PAGE_QUERY, variables, auth_headers)
+        page = data["data"]["recipe"]["page"]
+        assert all(edge["node"]["buildingTypeId"] == building_type_id for edge in page["edges"])
+        names += [edge["node"]["name"] for edge in page["edges"]]
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        variables["after"] = page["pageInfo"]["endCursor"]
+
+    assert names == sorted((recipe["name"] for recipe in inputs), reverse=True)
+
+    # cursors only continue the order they were issued for
+    del variables["orderBy"]
+    data = await graphql_post(test_client, RECIPE_PAGE_QUERY, variables, auth_headers)
+    assert_error_contains(data, "invalid cursor")
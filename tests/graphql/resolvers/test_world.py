@@ -0,0 +1,167 @@
+import base64
+import threading
+
+import numpy as np
+import pytest
+
+from src.database.catalog import get_catalog
+from src.database.models import Bot, Structure
+from src.database.services import ClientService
+from src.world import TileStore, tiles
+
+from ...utils import graphql_post, assert_error_contains
+
+ENTITIES_IN_RECT_QUERY = r"""
+query EntitiesInRect($x0: Int!, $y0: Int!, $x1: Int!, $y1: Int!) {
+  world {
+    entitiesInRect(x0: $x0, y0: $y0, x1: $x1, y1: $y1) {
+      bots { id name x y type { name } }
+      buildings { id }
+      structures { id x y type { name } }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_entities_in_rect_follows_commits(test_client, auth_headers, db_session):
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    client = await ClientService.get_identity_by_token(db_session, token)
+    catalog = await get_catalog()
+    bot_type = catalog.bot_types.all[0]
+    structure_type = catalog.structure_types.all[0]
+
+    bot = Bot(name="Scout", type_id=bot_type.id, client_id=client.id, x=-5000, y=-5000)
+    far = Bot(name="Far", type_id=bot_type.id, client_id=client.id, x=-4000, y=-5000)
+    tree = Structure(type_id=structure_type.id, x=-4990, y=-4990)
+    db_session.add_all([bot, far, tree])
+    await db_session.commit()
+
+    variables = {"x0": -4990, "y0": -4990, "x1": -5000, "y1": -5000}
+    data = await graphql_post(test_client, ENTITIES_IN_RECT_QUERY, variables, auth_headers)
+    entities = data["data"]["world"]["entitiesInRect"]
+    assert entities["bots"] == [
+        {"id": str(bot.id), "name": "Scout", "x": -5000, "y": -5000, "type": {"name": bot_type.name}}
+    ]
+    assert entities["structures"] == [
+        {"id": str(tree.id), "x": -4990, "y": -4990, "type": {"name": structure_type.name}}
+    ]
+    assert entities["buildings"] == []
+
+    bot.x = -3000
+    await db_session.delete(tree)
+    await db_session.commit()
+
+    data = await graphql_post(test_client, ENTITIES_IN_RECT_QUERY, variables, auth_headers)
+    assert data["data"]["world"]["entitiesInRect"] == {"bots": [], "buildings": [], "structures": []}
+
+
+@pytest.mark.asyncio
+async def test_entities_in_rect_limits_area(test_client, auth_headers):
+    variables = {"x0": 0, "y0": 0, "x1": 10**6, "y1": 10**6}
+    data = await graphql_post(test_client, ENTITIES_IN_RECT_QUERY, variables, auth_headers)
+    assert_error_contains(data, "too large")
+
+
+VISIBILITY_QUERY = r"""
+query Visibility($since: Int!, $epoch: String) {
+  world {
+    visibility(since: $since, epoch: $epoch) {
+      epoch
+      version
+      reset
+      tiles { x y visible explored }
+    }
+  }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_visibility_returns_changes_since_version(test_client, auth_headers, db_session):
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    client = await ClientService.get_identity_by_token(db_session, token)
+    bot_type = (await get_catalog()).bot_types.all[0]
+    vision = bot_type.vision
+
+    data = await graphql_post(test_client, VISIBILITY_QUERY, {"since": 0}, auth_headers)
+    before = data["data"]["world"]["visibility"]
+
+    bot = Bot(name="Lookout", type_id=bot_type.id, client_id=client.id, x=9000, y=9000)
+    db_session.add(bot)
+    await db_session.commit()
+
+    variables = {"since": before["version"], "epoch": before["epoch"]}
+    data = await graphql_post(test_client, VISIBILITY_QUERY, variables, auth_headers)
+    seen = data["data"]["world"]["visibility"]
+    assert seen["version"] == before["version"] + 1 and not seen["reset"]
+    assert {"x": 9000 + vision, "y": 9000, "visible": True, "explored": True} in seen["tiles"]
+
+    bot.x += 1
+    await db_session.commit()
+
+    variables = {"since": seen["version"], "epoch": seen["epoch"]}
+    data = await graphql_post(test_client, VISIBILITY_QUERY, variables, auth_headers)
+    moved = data["data"]["world"]["visibility"]["tiles"]
+    assert {"x": 9001 + vision, "y": 9000, "visible": True, "explored": True} in moved
+    assert {"x": 9000 - vision, "y": 9000, "visible": False, "explored": True} in moved
+    assert len(moved) < len(seen["tiles"])
+
+    variables = {"since": seen["version"], "epoch": "stale"}
+    data = await graphql_post(test_client, VISIBILITY_QUERY, variables, auth_headers)
+    assert data["data"]["world"]["visibility"]["reset"]
+
+
+TILE_CHUNKS_QUERY = r"""
+query TileChunks($cx0: Int!, $cy0: Int!, $cx1: Int!, $cy1: Int!) {
+  world {
+    tileChunks(cx0: $cx0, cy0: $cy0, cx1: $cx1, cy1: $cy1) {
+      cx
+      cy
+      size
+      planes { name dtype offset length }
+      data
+    }
+  }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_tile_chunks_are_packed_planes(test_client, auth_headers, tmp_path, monkeypatch):
+    store = TileStore(tmp_path, chunk_size=4, max_open=4)
+    monkeypatch.setattr(tiles, "_store", store)
+    store.set_tile(5, 2, terrain=3, occupancy=1, resource=9)
+
+    variables = {"cx0": 1, "cy0": 0, "cx1": 0, "cy1": 0}
+    data = await graphql_post(test_client, TILE_CHUNKS_QUERY, variables, auth_headers)
+    empty, chunk = data["data"]["world"]["tileChunks"]
+    assert (empty["cx"], chunk["cx"], chunk["size"]) == (0, 1, 4)
+    assert base64.b64decode(empty["data"]) == bytes(store.chunk_bytes)
+
+    raw = base64.b64decode(chunk["data"])
+    planes = {
+        plane["name"]: np.frombuffer(raw[plane["offset"]:plane["offset"] + plane["length"]], plane["dtype"]).reshape(4, 4)
+        for plane in chunk["planes"]
+    }
+    assert (planes["terrain"][2, 1], planes["occupancy"][2, 1], planes["resource"][2, 1]) == (3, 1, 9)
+    assert int(planes["terrain"].sum()) == 3
+
+    variables = {"cx0": 0, "cy0": 0, "cx1": 10, "cy1": 10}
+    data = await graphql_post(test_client, TILE_CHUNKS_QUERY, variables, auth_headers)
+    assert_error_contains(data, "too many chunks")
+
+
+@pytest.mark.asyncio
+async def test_tile_chunks_are_read_off_the_event_loop(test_client, auth_headers, tmp_path, monkeypatch):
+    store = TileStore(tmp_path, chunk_size=4, max_open=4)
+    monkeypatch.setattr(tiles, "_store", store)
+    threads = []
+    read = store.read
+    monkeypatch.setattr(store, "read", lambda cx, cy: threads.append(threading.current_thread()) or read(cx, cy))
+
+    variables = {"cx0": 0, "cy0": 0, "cx1": 1, "cy1": 0}
+    data = await graphql_post(test_client, TILE_CHUNKS_QUERY, variables, auth_headers)
+    assert len(data["data"]["world"]["tileChunks"]) == 2
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,37 @@
+import uuid
+import pytest
+
+from ..utils import graphql_post, assert_error_contains
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_hits_document_cache(test_client, auth_headers):
+    query = f"query {{ itemType {{ items_{uuid.uuid4().hex[:8]}: all {{ id name }} }} }}"
+
+    before = (await test_client.get("/stats/caches", headers=auth_headers)).json()["documents"]
+    first = await graphql_post(test_client, query, headers=auth_headers)
+    second = await graphql_post(test_client, query, headers=auth_headers)
+    after = (await test_client.get("/stats/caches", headers=auth_headers)).json()["documents"]
+
+    assert first == second
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+    assert 0 < after["hit_ratio"] <= 1
+
+
+@pytest.mark.asyncio
+async def test_cached_document_keeps_validation_errors(test_client, auth_headers):
+    query = f"query {{ itemType {{ missing_{uuid.uuid4().hex[:8]} }} }}"
+
+    for _ in range(2):
+        data = await graphql_post(test_client, query, headers=auth_headers)
+        assert_error_contains(data, "cannot query field")
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_require_authentication(test_client):
+    response = await test_client.get("/stats/caches")
+    assert response.status_code == 401
+
+    response = await test_client.get("/stats/caches", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
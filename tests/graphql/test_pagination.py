@@ -0,0 +1,12 @@
+import dataclasses
+
+from src.database import models
+from src.graphql import inputs
+
+
+def test_list_filters_use_indexed_columns():
+    for name in ("ItemType", "StructureType", "BotType", "BuildingType", "Recipe"):
+        table = getattr(models, name).__table__
+        for field in dataclasses.fields(getattr(inputs, f"{name}FilterInput")):
+            column = table.c[field.name]
+            assert column.index or column.unique or column.primary_key, f"{table.name}.{column.name}"
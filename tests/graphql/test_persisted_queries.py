@@ -0,0 +1,43 @@
+import hashlib
+import uuid
+import pytest
+
+from ..utils import assert_error_contains
+
+
+def persisted_query() -> tuple[str, dict]:
+    # unique alias so every test starts from an unknown hash
+    query = f"query {{ itemType {{ items_{uuid.uuid4().hex[:8]}: all {{ id name }} }} }}"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode()).hexdigest()}}
+    return query, extensions
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_negotiation(test_client, auth_headers):
+    query, extensions = persisted_query()
+
+    response = await test_client.post("/graphql", json={"extensions": extensions}, headers=auth_headers)
+    data = response.json()
+    assert_error_contains(data, "PersistedQueryNotFound")
+    assert data["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    response = await test_client.post(
+        "/graphql", json={"query": query, "extensions": extensions}, headers=auth_headers
+    )
+    registered = response.json()["data"]
+
+    response = await test_client.post("/graphql", json={"extensions": extensions}, headers=auth_headers)
+    assert response.json()["data"] == registered
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_hash_mismatch(test_client, auth_headers):
+    query, extensions = persisted_query()
+
+    response = await test_client.post(
+        "/graphql", json={"query": query + " ", "extensions": extensions}, headers=auth_headers
+    )
+    assert_error_contains(response.json(), "does not match")
+
+    response = await test_client.post("/graphql", json={"extensions": extensions}, headers=auth_headers)
+    assert_error_contains(response.json(), "PersistedQueryNotFound")
@@ -0,0 +1,96 @@
+import pytest
+
+from src.graphql import pagination, planner
+
+from ..utils import graphql_post
+
+RECIPE_PAGE_QUERY = r"""
+query RecipePlan {
+  recipe {
+    page(first: 5) {
+      edges {
+        node {
+          name
+          ingredients { amount }
+          outputItemType { name }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _describe(opts) -> set[tuple[str, str]]:
+    """(attribute path, how it is loaded) for every option of a plan."""
+    described = set()
+    for opt in opts:
+        for element in opt.context:
+            path = ".".join(str(getattr(step, "key", step)) for step in element.path.natural_path[1::2])
+            strategy = dict(element.strategy)
+            if "lazy" in strategy:
+                described.add((path, strategy["lazy"]))
+            elif not strategy.get("deferred"):
+                described.add((path, "column"))
+    return described
+
+
+@pytest.fixture
+def plans(monkeypatch):
+    """Plans returned to the `page` resolvers, and how many were built rather than cached."""
+    recorded = {"plans": [], "built": 0}
+    plan_options, build = planner.plan_options, planner._build
+
+    def recording_plan_options(*args, **kwargs):
+        recorded["plans"].append(plan_options(*args, **kwargs))
+        return recorded["plans"][-1]
+
+    def counting_build(*args, **kwargs):
+        recorded["built"] += 1
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(pagination, "plan_options", recording_plan_options)
+    monkeypatch.setattr(planner, "_build", counting_build)
+    monkeypatch.setattr(planner, "_plan_cache", type(planner._plan_cache)())
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_plan_loads_selected_relations(test_client, auth_headers, plans):
+    data = await graphql_post(test_client, RECIPE_PAGE_QUERY, headers=auth_headers)
+    assert "errors" not in data
+
+    plan, = plans["plans"]
+    assert _describe(plan) == {
+        # primary/foreign keys, selected columns and the sort keys
+        ("id", "column"),
+        ("building_type_id", "column"),
+        ("output_item_type_id", "column"),
+        ("created_at", "column"),
+        ("name", "column"),
+        # collections in one IN (...) query, many-to-one joined
+        ("ingredients", "selectin"),
+        ("ingredients.id", "column"),
+        ("ingredients.recipe_id", "column"),
+        ("ingredients.item_type_id", "column"),
+        ("ingredients.amount", "column"),
+        ("output_item_type", "joined"),
+        ("output_item_type.id", "column"),
+        ("output_item_type.name", "column"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_reuses_plan(test_client, auth_headers, plans):
+    await graphql_post(test_client, RECIPE_PAGE_QUERY, headers=auth_headers)
+    await graphql_post(test_client, RECIPE_PAGE_QUERY, headers=auth_headers)
+
+    first, second = plans["plans"]
+    assert second is first
+    # `_build` recurses once per relation: one top-level plan plus two nested ones
+    assert plans["built"] == 3
+
+    # other query text, other plan
+    await graphql_post(test_client, RECIPE_PAGE_QUERY.replace("name\n", "outputAmount\n", 1), headers=auth_headers)
+    assert plans["plans"][-1] is not first
+    assert plans["built"] == 6
@@ -0,0 +1,105 @@
+import pytest
+from graphql import get_introspection_query
+
+from src.config import get_settings
+from src.graphql.extensions import get_cost_budget
+
+from ..utils import graphql_post, assert_error_contains
+
+NESTED_QUERY = r"""
+query Nested {
+  buildingType {
+    all {
+      recipes {
+        ingredients {
+          itemType { id }
+        }
+      }
+    }
+  }
+}
+"""
+
+ITEMTYPE_ID_QUERY = r"""
+query ItemTypeIds {
+  itemType { all { id } }
+}
+"""
+
+ITEMTYPE_DEFAULT_PAGE_QUERY = r"""
+query ItemTypeDefaultPage {
+  itemType { page { edges { node { id } } } }
+}
+"""
+
+ITEMTYPE_PAGE_QUERY = r"""
+query ItemTypePage($first: Int) {
+  itemType { page(first: $first) { edges { node { id } } } }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_query_too_deep(test_client, auth_headers, monkeypatch):
+    monkeypatch.setattr(get_settings(), "query_max_depth", 3)
+
+    data = await graphql_post(test_client, NESTED_QUERY, headers=auth_headers)
+    assert_error_contains(data, "depth 5 exceeds")
+    assert data["errors"][0]["extensions"]["code"] == "QUERY_TOO_DEEP"
+
+
+@pytest.mark.asyncio
+async def test_query_too_costly(test_client, auth_headers, monkeypatch):
+    monkeypatch.setattr(get_settings(), "query_max_cost", 1)
+
+    data = await graphql_post(test_client, ITEMTYPE_ID_QUERY, headers=auth_headers)
+    assert_error_contains(data, "exceeds the maximum of 1")
+
+
+@pytest.mark.asyncio
+async def test_query_cost_budget(test_client, auth_headers, monkeypatch):
+    budget = get_cost_budget()
+    monkeypatch.setattr(budget, "limit", 0)
+
+    data = await graphql_post(test_client, ITEMTYPE_ID_QUERY, headers=auth_headers)
+    assert data["errors"][0]["extensions"]["code"] == "QUERY_BUDGET_EXCEEDED"
+
+    monkeypatch.undo()
+    data = await graphql_post(test_client, ITEMTYPE_ID_QUERY, headers=auth_headers)
+    assert data["data"]["itemType"]["all"]
+
+
+@pytest.mark.asyncio
+async def test_connection_cost_counts_first(test_client, auth_headers, monkeypatch):
+    # itemType (1) + page (1) + edges (1 + node 1) * first
+    monkeypatch.setattr(get_settings(), "query_max_cost", 22)
+
+    data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, {"first": 10}, auth_headers)
+    assert "errors" not in data
+
+    data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, {"first": 11}, auth_headers)
+    assert_error_contains(data, "cost 24 exceeds")
+
+
+@pytest.mark.asyncio
+async def test_connection_cost_without_first_counts_default_page(test_client, auth_headers, monkeypatch):
+    # itemType (1) + page (1) + edges (1 + node 1) * page_default_size
+    monkeypatch.setattr(get_settings(), "page_default_size", 50)
+    monkeypatch.setattr(get_settings(), "query_max_cost", 101)
+
+    data = await graphql_post(test_client, ITEMTYPE_DEFAULT_PAGE_QUERY, headers=auth_headers)
+    assert_error_contains(data, "cost 102 exceeds")
+
+
+@pytest.mark.asyncio
+async def test_introspection_counts_toward_limits(test_client, auth_headers, monkeypatch):
+    data = await graphql_post(test_client, get_introspection_query(), headers=auth_headers)
+    assert "errors" not in data and data["data"]["__schema"]["types"]
+
+    monkeypatch.setattr(get_settings(), "query_max_cost", 1_000)
+    data = await graphql_post(test_client, get_introspection_query(), headers=auth_headers)
+    assert data["errors"][0]["extensions"]["code"] == "QUERY_TOO_COSTLY"
+
+    monkeypatch.setattr(get_settings(), "query_max_introspection_depth", 3)
+    data = await graphql_post(test_client, get_introspection_query(), headers=auth_headers)
+    assert_error_contains(data, "introspection depth 14 exceeds")
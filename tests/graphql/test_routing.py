@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from src import database
+from src.cache import LRUCache
+from src.config import get_settings
+from src.graphql.extensions import routing
+
+from ..utils import generate_unique_name, graphql_post
+
+ITEMTYPE_PAGE_QUERY = r"""
+query ItemTypePage {
+  itemType { page(first: 1) { edges { node { id } } } }
+}
+"""
+
+ITEMTYPE_CREATE_MUTATION = r"""
+mutation CreateItemType($input: ItemTypeInput!) {
+  itemType {
+    create(input: $input) { id }
+  }
+}
+"""
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Records which sessionmaker each request's lazy session was opened from."""
+    opened = []
+    primary = database.get_sessionmaker()
+
+    def recording(label):
+        def factory():
+            opened.append(label)
+            return primary()
+        return factory
+
+    monkeypatch.setattr(database, "get_sessionmaker", lambda: recording("primary"))
+    monkeypatch.setattr(database, "get_read_sessionmaker", lambda: recording("read"))
+    monkeypatch.setattr(routing, "_recent_writers", LRUCache(maxsize=100, ttl=0.2))
+    return opened
+
+
+@pytest.mark.asyncio
+async def test_queries_use_read_sessionmaker(test_client, auth_headers, sessions):
+    data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, headers=auth_headers)
+    assert "errors" not in data
+    assert sessions == ["read"]
+
+
+@pytest.mark.asyncio
+async def test_mutations_use_primary_and_pin_the_client(test_client, auth_headers, sessions):
+    variables = {"input": {"name": generate_unique_name("RoutedItem"), "durability": 1}}
+    data = await graphql_post(test_client, ITEMTYPE_CREATE_MUTATION, variables, auth_headers)
+    assert "errors" not in data
+    assert sessions == ["primary"]
+
+    # read-your-writes: the next query stays on the primary
+    await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, headers=auth_headers)
+    assert sessions == ["primary", "primary"]
+
+    await asyncio.sleep(0.3)
+    await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, headers=auth_headers)
+    assert sessions == ["primary", "primary", "read"]
+
+
+def test_read_sessionmaker_defaults_to_primary(monkeypatch):
+    monkeypatch.setattr(get_settings(), "db_read_url", None)
+    monkeypatch.setattr(database, "_read_engine", None)
+    monkeypatch.setattr(database, "_read_session", None)
+
+    assert database.get_read_sessionmaker() is database.get_sessionmaker()
+
+
+@pytest.mark.asyncio
+async def test_read_sessionmaker_uses_db_read_url(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "db_read_url", f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.setattr(database, "_read_engine", None)
+    monkeypatch.setattr(database, "_read_session", None)
+
+    try:
+        read_sessionmaker = database.get_read_sessionmaker()
+        assert read_sessionmaker is not database.get_sessionmaker()
+        assert read_sessionmaker.kw["bind"] is database.get_read_engine() is not database.get_engine()
+    finally:
+        await database.get_read_engine().dispose()
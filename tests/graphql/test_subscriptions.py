@@ -0,0 +1,252 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from src.database.catalog import get_catalog
+from src.database.services import ClientService
+from src.graphql.graphql import graphql_app
+from src.main import app
+
+from ..utils import generate_unique_name, graphql_post
+
+ITEMTYPE_SUBSCRIPTION = r"""
+subscription {
+  itemType {
+    kind
+    id
+    node {
+      name
+      durability
+    }
+  }
+}
+"""
+
+BUILDINGTYPE_SUBSCRIPTION = r"""
+subscription {
+  buildingType {
+    kind
+    id
+    node {
+      buildingRecipes { amount }
+      recipes { outputAmount }
+    }
+  }
+}
+"""
+
+BUILDINGTYPE_CREATE_MUTATION = r"""
+mutation CreateBuildingType($input: BuildingTypeInput!) {
+  buildingType {
+    create(input: $input) { id }
+  }
+}
+"""
+
+RECIPE_CREATE_MUTATION = r"""
+mutation CreateRecipe($input: RecipeInput!) {
+  recipe {
+    create(input: $input) { id }
+  }
+}
+"""
+
+RECIPE_UPDATE_MUTATION = r"""
+mutation UpdateRecipe($id: UUID!, $input: RecipeInput!) {
+  recipe {
+    update(id: $id, input: $input) { id }
+  }
+}
+"""
+
+RECIPE_DELETE_MUTATION = r"""
+mutation DeleteRecipe($id: UUID!) {
+  recipe {
+    delete(id: $id)
+  }
+}
+"""
+
+ITEMTYPE_CREATE_MUTATION = r"""
+mutation CreateItemType($input: ItemTypeInput!) {
+  itemType {
+    create(input: $input) { id }
+  }
+}
+"""
+
+ITEMTYPE_DELETE_MUTATION = r"""
+mutation DeleteItemType($id: UUID!) {
+  itemType {
+    delete(id: $id)
+  }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_item_type_subscription(test_client, auth_headers, db_session):
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    client = await ClientService.get_identity_by_token(db_session, token)
+    results = await graphql_app.schema.subscribe(
+        ITEMTYPE_SUBSCRIPTION, context_value={"current_client": client, "request": None}
+    )
+
+    async def collect(count):
+        events = []
+        async for result in results:
+            assert result.errors is None
+            events.append(result.data["itemType"])
+            if len(events) == count:
+                return events
+
+    events = asyncio.create_task(collect(2))
+    await asyncio.sleep(0)
+
+    name = generate_unique_name("ItemTypeSub")
+    data = await graphql_post(
+        test_client, ITEMTYPE_CREATE_MUTATION, {"input": {"name": name, "durability": 3}}, auth_headers
+    )
+    item_id = data["data"]["itemType"]["create"]["id"]
+    await graphql_post(test_client, ITEMTYPE_DELETE_MUTATION, {"id": item_id}, auth_headers)
+
+    created, deleted = await asyncio.wait_for(events, timeout=5)
+    await results.aclose()
+
+    assert created == {"kind": "CREATED", "id": item_id, "node": {"name": name, "durability": 3}}
+    assert deleted == {"kind": "DELETED", "id": item_id, "node": None}
+
+
+@pytest.mark.asyncio
+async def test_subscription_requires_authentication(test_client):
+    results = await graphql_app.schema.subscribe(
+        ITEMTYPE_SUBSCRIPTION, context_value={"current_client": None, "request": None}
+    )
+    result = await results.__anext__()
+    assert "authorization required" in result.errors[0].message.lower()
+
+
+@pytest.mark.asyncio
+async def test_building_type_subscription_follows_recipes(test_client, auth_headers, db_session):
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    client = await ClientService.get_identity_by_token(db_session, token)
+    results = await graphql_app.schema.subscribe(
+        BUILDINGTYPE_SUBSCRIPTION, context_value={"current_client": client, "request": None}
+    )
+
+    async def collect(count):
+        events = []
+        async for result in results:
+            assert result.errors is None
+            events.append(result.data["buildingType"])
+            if len(events) == count:
+                return events
+
+    events = asyncio.create_task(collect(4))
+    await asyncio.sleep(0)
+
+    item_id = str((await get_catalog()).item_types.all[0].id)
+    data = await graphql_post(test_client, BUILDINGTYPE_CREATE_MUTATION, {"input": {
+        "name": generate_unique_name("BuildingTypeSub"),
+        "health": 10,
+        "buildingRecipes": [{"buildingTypeId": str(uuid.uuid4()), "itemTypeId": item_id, "amount": 2}],
+    }}, auth_headers)
+    building_type_id = data["data"]["buildingType"]["create"]["id"]
+
+    recipe = {
+        "name": generate_unique_name("RecipeSub"),
+        "buildingTypeId": building_type_id,
+        "outputItemTypeId": item_id,
+        "outputAmount": 1,
+        "ingredients": [],
+    }
+    data = await graphql_post(test_client, RECIPE_CREATE_MUTATION, {"input": recipe}, auth_headers)
+    recipe_id = data["data"]["recipe"]["create"]["id"]
+    await graphql_post(
+        test_client, RECIPE_UPDATE_MUTATION, {"id": recipe_id, "input": {**recipe, "outputAmount": 3}}, auth_headers
+    )
+    await graphql_post(test_client, RECIPE_DELETE_MUTATION, {"id": recipe_id}, auth_headers)
+
+    created, *updated = await asyncio.wait_for(events, timeout=5)
+    await results.aclose()
+
+    assert created["kind"] == "CREATED" and created["id"] == building_type_id
+    assert created["node"]["buildingRecipes"] == [{"amount": 2}] and created["node"]["recipes"] == []
+    assert [(event["kind"], event["id"]) for event in updated] == [("UPDATED", building_type_id)] * 3
+    assert [event["node"]["recipes"] for event in updated] == [[{"outputAmount": 1}], [{"outputAmount": 3}], []]
+
+
+async def _websocket(path: str = "/graphql"):
+    """A graphql-transport-ws connection to the app, driven over its ASGI interface."""
+    incoming, outgoing = asyncio.Queue(), asyncio.Queue()
+    scope = {
+        "type": "websocket",
+        "asgi": {"version": "3.0"},
+        "scheme": "ws",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"sec-websocket-protocol", b"graphql-transport-ws")],
+        "subprotocols": ["graphql-transport-ws"],
+        "client": ("127.0.0.1", 5000),
+        "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, incoming.get, outgoing.put))
+    await incoming.put({"type": "websocket.connect"})
+    assert (await asyncio.wait_for(outgoing.get(), timeout=5))["type"] == "websocket.accept"
+
+    async def send(message: dict) -> None:
+        await incoming.put({"type": "websocket.receive", "text": json.dumps(message)})
+
+    async def receive() -> dict:
+        message = await asyncio.wait_for(outgoing.get(), timeout=5)
+        assert message["type"] == "websocket.send", message
+        return json.loads(message["text"])
+
+    async def close() -> None:
+        await incoming.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(task, timeout=5)
+
+    return send, receive, close
+
+
+@pytest.mark.asyncio
+async def test_websocket_authenticates_through_connection_init(test_client, auth_headers):
+    send, receive, close = await _websocket()
+    try:
+        await send({"type": "connection_init", "payload": {"Authorization": auth_headers["Authorization"]}})
+        assert (await receive())["type"] == "connection_ack"
+        await send({"id": "1", "type": "subscribe", "payload": {"query": ITEMTYPE_SUBSCRIPTION}})
+        await asyncio.sleep(0.05)
+
+        name = generate_unique_name("ItemTypeWs")
+        data = await graphql_post(
+            test_client, ITEMTYPE_CREATE_MUTATION, {"input": {"name": name, "durability": 1}}, auth_headers
+        )
+        message = await receive()
+        assert message["type"] == "next" and message["id"] == "1"
+        assert message["payload"]["data"]["itemType"] == {
+            "kind": "CREATED",
+            "id": data["data"]["itemType"]["create"]["id"],
+            "node": {"name": name, "durability": 1},
+        }
+    finally:
+        await close()
+
+
+@pytest.mark.asyncio
+async def test_websocket_without_token_is_rejected(test_client):
+    send, receive, close = await _websocket()
+    try:
+        await send({"type": "connection_init", "payload": {}})
+        assert (await receive())["type"] == "connection_ack"
+        await send({"id": "1", "type": "subscribe", "payload": {"query": ITEMTYPE_SUBSCRIPTION}})
+        message = await receive()
+        assert message["type"] in ("error", "next")
+        errors = message["payload"] if message["type"] == "error" else message["payload"]["errors"]
+        assert "authorization required" in errors[0]["message"].lower()
+    finally:
+        await close()
@@ -0,0 +1,36 @@
+import pytest
+
+from src.broker import Broker, SlowConsumer
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_per_topic():
+    broker = Broker(queue_size=10)
+    first = broker.subscribe("a")
+    second = broker.subscribe("a", "b")
+
+    assert broker.publish("a", 1) == 2
+    assert broker.publish("b", 2) == 1
+    assert broker.publish("c", 3) == 0
+
+    assert await first.__anext__() == 1
+    assert [await second.__anext__(), await second.__anext__()] == [1, 2]
+
+    second.close()
+    assert broker.publish("b", 4) == 0
+    assert broker.stats()["subscribers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped():
+    broker = Broker(queue_size=2)
+    slow = broker.subscribe("a")
+    fast = broker.subscribe("a", queue_size=10)
+
+    for message in range(3):
+        broker.publish("a", message)
+
+    with pytest.raises(SlowConsumer):
+        await slow.__anext__()
+    assert [await fast.__anext__() for _ in range(3)] == [0, 1, 2]
+    assert broker.stats() == {"topics": 1, "subscribers": 1, "published": 3, "dropped": 1}
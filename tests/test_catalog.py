@@ -0,0 +1,107 @@
+import time
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import delete, event
+
+from src.config import get_settings
+from src.database import catalog as catalog_module, get_engine
+from src.database.catalog import bump_revisions, get_catalog, load_catalog
+from src.database.models import ItemType, StructureType
+from src.database.services import ItemTypeService
+from src.graphql.inputs import ItemTypeInput
+
+from .utils import generate_unique_name
+
+
+@contextmanager
+def _queries():
+    statements = []
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_reads_only_changed_tables(test_client):
+    before = await get_catalog()
+    with _queries() as statements:
+        after = await load_catalog("BotType")
+
+    reads = [statement for statement in statements if "catalog_meta" not in statement]
+    assert len(reads) == 2
+    assert all("bot_" in statement for statement in reads)
+    assert after.version == before.version + 1
+    assert after.item_types is before.item_types
+    assert after.structure_types is before.structure_types and after.recipes is before.recipes
+
+
+@pytest.mark.asyncio
+async def test_item_change_relinks_dependents_in_memory(test_client, db_session):
+    catalog = await get_catalog()
+    structure_type = catalog.structure_types.all[0]
+    item = structure_type.item_type
+
+    renamed = generate_unique_name("CatalogItem")
+    with _queries() as statements:
+        await ItemTypeService.update(db_session, item.id, ItemTypeInput(name=renamed, durability=item.durability))
+    assert not any("structure_types" in statement for statement in statements)
+    assert (await get_catalog()).structure_types.get(structure_type.id).item_type.name == renamed
+
+    await ItemTypeService.update(db_session, item.id, ItemTypeInput(name=item.name, durability=item.durability))
+
+
+@pytest.mark.asyncio
+async def test_orphaned_rows_are_skipped(test_client, db_session):
+    orphan = StructureType(name=generate_unique_name("Orphan"), health=1, item_type_id=uuid.uuid4(), max_items=1)
+    db_session.add(orphan)
+    await db_session.commit()
+    try:
+        catalog = await load_catalog("StructureType")
+        assert orphan.id not in catalog.structure_types.by_id
+        assert catalog.structure_types.all
+    finally:
+        await db_session.execute(delete(StructureType).where(StructureType.id == orphan.id))
+        await db_session.commit()
+        await load_catalog("StructureType")
+
+    with pytest.raises(ValueError):
+        await load_catalog("Bot")
+
+
+@pytest.mark.asyncio
+async def test_writes_by_other_workers_are_picked_up(test_client, db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "catalog_refresh_interval", 60.0)
+    before = await get_catalog()
+
+    # another worker: commits a row and a new revision, but rebuilds only its own snapshot
+    item = ItemType(name=generate_unique_name("OtherWorker"), durability=None)
+    db_session.add(item)
+    await bump_revisions(db_session, ["ItemType"])
+    await db_session.commit()
+    try:
+        monkeypatch.setattr(catalog_module, "_checked_at", time.monotonic())
+        assert await get_catalog() is before
+
+        monkeypatch.setattr(catalog_module, "_checked_at", 0.0)
+        with _queries() as statements:
+            after = await get_catalog()
+        assert item.id in after.item_types.by_id
+        assert after.version == before.version + 1
+        assert not any("structure_types" in statement for statement in statements)
+
+        # nothing changed since: only the revisions are read
+        monkeypatch.setattr(catalog_module, "_checked_at", 0.0)
+        with _queries() as statements:
+            assert await get_catalog() is after
+        assert len(statements) == 1 and "catalog_meta" in statements[0]
+    finally:
+        await db_session.delete(item)
+        await db_session.commit()
+        await load_catalog("ItemType")
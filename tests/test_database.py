@@ -0,0 +1,127 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src import database
+from src.config import Settings, get_settings
+from src.database import LazySession, _engine_kwargs, build_engine, get_engine, get_lazy_db
+
+from .utils import graphql_post
+
+ITEMTYPE_ALL_QUERY = r"""
+query ItemTypes {
+  itemType { all { id } }
+}
+"""
+
+ITEMTYPE_PAGE_QUERY = r"""
+query ItemTypePage {
+  itemType { page(first: 1) { edges { node { id } } } }
+}
+"""
+
+
+class TrackedSession(AsyncSession):
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+        await super().close()
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Every session the request-scoped lazy sessions open."""
+    opened = []
+    maker = async_sessionmaker(get_engine(), class_=TrackedSession, expire_on_commit=False)
+
+    def factory():
+        opened.append(maker())
+        return opened[-1]
+
+    monkeypatch.setattr(database, "get_sessionmaker", lambda: factory)
+    monkeypatch.setattr(database, "get_read_sessionmaker", lambda: factory)
+    return opened
+
+
+@pytest.mark.asyncio
+async def test_lazy_session_opens_on_first_use(test_client, sessions):
+    db = LazySession(database.get_sessionmaker())
+    assert not db.started and sessions == []
+
+    assert (await db.execute(text("SELECT 1"))).scalar_one() == 1
+    await db.execute(text("SELECT 2"))
+    assert db.started and len(sessions) == 1
+
+    await db.close()
+    assert not db.started and sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_get_lazy_db_closes_session_at_teardown(test_client, sessions):
+    dependency = get_lazy_db()
+    db = await anext(dependency)
+    await db.execute(text("SELECT 1"))
+    await dependency.aclose()
+
+    assert [session.closed for session in sessions] == [True]
+
+
+@pytest.mark.asyncio
+async def test_request_without_db_opens_no_session(test_client, auth_headers, sessions, monkeypatch):
+    # no periodic catalog revision check in the middle of the request
+    monkeypatch.setattr(get_settings(), "catalog_refresh_interval", 0)
+    # warm the token cache, so identifying the client needs no connection either
+    await graphql_post(test_client, ITEMTYPE_ALL_QUERY, headers=auth_headers)
+    checkouts = []
+    listener = lambda *args: checkouts.append(args)
+    event.listen(get_engine().sync_engine, "checkout", listener)
+    try:
+        # catalog reads are served from the in-memory snapshot
+        data = await graphql_post(test_client, ITEMTYPE_ALL_QUERY, headers=auth_headers)
+    finally:
+        event.remove(get_engine().sync_engine, "checkout", listener)
+
+    assert "errors" not in data
+    assert sessions == [] and checkouts == []
+
+
+@pytest.mark.asyncio
+async def test_request_session_is_closed_after_the_request(test_client, auth_headers, sessions):
+    data = await graphql_post(test_client, ITEMTYPE_PAGE_QUERY, headers=auth_headers)
+    assert "errors" not in data
+    assert [session.closed for session in sessions] == [True]
+
+
+def test_engine_kwargs_skip_pool_for_in_memory_sqlite():
+    settings = Settings(db_pool_size=7, db_max_overflow=3, db_pool_recycle=60, db_pool_pre_ping=True)
+
+    assert _engine_kwargs("sqlite+aiosqlite:///:memory:", settings) == {
+        "query_cache_size": settings.db_statement_cache_size,
+    }
+    assert _engine_kwargs("sqlite+aiosqlite:///./game.db", settings) == {
+        "query_cache_size": settings.db_statement_cache_size,
+        "pool_size": 7,
+        "max_overflow": 3,
+        "pool_recycle": 60,
+        "pool_pre_ping": True,
+    }
+    kwargs = _engine_kwargs("postgresql+asyncpg://game@db/game", settings)
+    assert kwargs["pool_size"] == 7
+    assert kwargs["connect_args"] == {"prepared_statement_cache_size": settings.db_statement_cache_size}
+
+
+@pytest.mark.asyncio
+async def test_file_sqlite_connections_get_pragmas(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "sqlite_busy_timeout", 1234)
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'pragmas.db'}")
+    try:
+        async with engine.connect() as conn:
+            pragmas = {
+                name: (await conn.execute(text(f"PRAGMA {name}"))).scalar_one()
+                for name in ("journal_mode", "synchronous", "busy_timeout")
+            }
+    finally:
+        await engine.dispose()
+
+    assert pragmas == {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 1234}
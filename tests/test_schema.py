@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import Column, Index, Integer, MetaData, inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import get_engine
+from src.database.models import Base
+from src.database.schema import ensure_schema, schema_fingerprint
+
+
+@pytest.mark.asyncio
+async def test_ensure_schema_skips_applied_schema(test_client):
+    # lifespan already applied and recorded the current schema
+    assert await ensure_schema(get_engine()) is False
+
+
+def test_schema_fingerprint_tracks_model_changes():
+    dialect = get_engine().dialect
+    changed = MetaData()
+    for table in Base.metadata.tables.values():
+        table.to_metadata(changed)
+    changed.tables["item_types"].append_column(Column("weight", Integer))
+
+    assert schema_fingerprint(Base.metadata, dialect) == schema_fingerprint(Base.metadata, dialect)
+    assert schema_fingerprint(changed, dialect) != schema_fingerprint(Base.metadata, dialect)
+
+
+@pytest.mark.asyncio
+async def test_ensure_schema_adds_indexes_to_existing_tables(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+    try:
+        assert await ensure_schema(engine) is True
+
+        changed = MetaData()
+        for table in Base.metadata.tables.values():
+            table.to_metadata(changed)
+        Index("ix_item_types_durability", changed.tables["item_types"].c.durability)
+
+        assert await ensure_schema(engine, changed) is True
+        assert await ensure_schema(engine, changed) is False
+        async with engine.connect() as conn:
+            indexes = await conn.run_sync(lambda sync: inspect(sync).get_indexes("item_types"))
+        assert "ix_item_types_durability" in {index["name"] for index in indexes}
+    finally:
+        await engine.dispose()
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.database import build_engine
+from src.database.models import BotRecipe, BotType, ItemType, SeedEntry, SeedMeta, StructureType
+from src.database.schema import ensure_schema
+from src.workers.seed import (
+    SEEDS,
+    Seed,
+    _apply,
+    _bot_type_row,
+    _check_graph,
+    _item_type_row,
+    _structure_type_row,
+    run_all_seeds,
+)
+
+from .utils import generate_unique_name
+
+ITEMS = Seed("items.yaml", "items", "TestItemType", ItemType, (), _item_type_row)
+STRUCTURES = Seed(
+    "structures.yaml", "structures", "TestStructureType", StructureType, (ItemType,), _structure_type_row
+)
+
+
+def _write_items(path, names):
+    path.write_text("items:\n" + "".join(f"  - name: {name}\n    durability: 1\n" for name in names))
+
+
+@pytest.mark.asyncio
+async def test_removed_entry_still_referenced_is_kept(test_client, db_session, tmp_path):
+    used, unused = generate_unique_name("SeedOre"), generate_unique_name("SeedDust")
+    _write_items(tmp_path / "items.yaml", [used, unused])
+    await run_all_seeds(tmp_path, (ITEMS,))
+
+    ore = (await db_session.execute(select(ItemType).where(ItemType.name == used))).scalar_one()
+    db_session.add(StructureType(name=generate_unique_name("SeedRock"), health=1, item_type_id=ore.id, max_items=1))
+    await db_session.commit()
+
+    _write_items(tmp_path / "items.yaml", [])
+    await run_all_seeds(tmp_path, (ITEMS,))
+
+    names = set((await db_session.execute(select(ItemType.name).where(ItemType.name.in_([used, unused])))).scalars())
+    assert names == {used}
+
+
+@pytest.mark.asyncio
+async def test_same_file_applied_from_two_sessions(tmp_path, monkeypatch):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'seed.db'}")
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr("src.workers.seed.get_sessionmaker", lambda: sessionmaker)
+    try:
+        await ensure_schema(engine)
+        await _apply(ITEMS, tmp_path / "items.yaml", "items-sha", [{"name": "Ore"}])
+
+        bots = next(seed for seed in SEEDS if seed.table is BotType)
+        entries = [{
+            "name": "Digger", "health": 1, "strength": 1, "speed": 1, "vision": 1,
+            "recipes": [{"item_type": "Ore", "amount": 2}],
+        }]
+        await asyncio.gather(*(_apply(bots, tmp_path / "bots.yaml", "bots-sha", entries) for _ in range(2)))
+
+        async with sessionmaker() as db:
+            assert (await db.execute(select(func.count()).select_from(BotRecipe))).scalar_one() == 1
+            entries = await db.execute(select(func.count()).select_from(SeedEntry).where(SeedEntry.seed == "BotType"))
+            assert entries.scalar_one() == 1
+            metas = await db.execute(select(func.count()).select_from(SeedMeta).where(SeedMeta.file_sha == "bots-sha"))
+            assert metas.scalar_one() == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_check_graph_rejects_missing_producer(tmp_path):
+    with pytest.raises(RuntimeError, match="no seed fills ItemType"):
+        _check_graph((STRUCTURES,))
+    # rejected before any file is read
+    with pytest.raises(RuntimeError, match="no seed fills ItemType"):
+        await run_all_seeds(tmp_path / "missing", (STRUCTURES,))
+
+
+def test_check_graph_rejects_cycles():
+    items = Seed("items.yaml", "items", "TestItemType", ItemType, (BotType,), _item_type_row)
+    bots = Seed("bots.yaml", "bots", "TestBotType", BotType, (ItemType,), _bot_type_row)
+
+    with pytest.raises(RuntimeError, match="cycle"):
+        _check_graph((items, bots))
+
+
+@pytest.mark.asyncio
+async def test_seeds_run_after_their_dependencies(test_client, tmp_path, monkeypatch):
+    events = []
+
+    async def apply(seed, file, sha, entries):
+        events.append(("start", seed.label))
+        await asyncio.sleep(0.05)
+        events.append(("end", seed.label))
+
+    monkeypatch.setattr("src.workers.seed._apply", apply)
+    _write_items(tmp_path / "items.yaml", [generate_unique_name("SeedOrder")])
+    (tmp_path / "structures.yaml").write_text(f"structures: []  # {generate_unique_name('SeedOrder')}\n")
+
+    # listed dependent-first, so only the scheduler can put it second
+    await run_all_seeds(tmp_path, (STRUCTURES, ITEMS))
+
+    assert events == [
+        ("start", "TestItemType"), ("end", "TestItemType"),
+        ("start", "TestStructureType"), ("end", "TestStructureType"),
+    ]
@@ -0,0 +1,71 @@
+import datetime
+
+import pytest
+
+from src.config import get_settings
+from src.workers import seed_cache
+from src.workers.seed import _parse
+from src.workers.seed_cache import file_sha256, load_seed_file
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Counts the YAML parses `load_seed_file` falls back to."""
+    calls = []
+    load = seed_cache.yaml.load
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(seed_cache.yaml, "load", counting)
+    return calls
+
+
+def test_cache_hit_skips_parsing(tmp_path, parses):
+    path = tmp_path / "items.yaml"
+    path.write_text("items:\n  - name: Ore\n")
+
+    first = load_seed_file(path)
+    second = load_seed_file(path)
+
+    assert first == second == {"items": [{"name": "Ore"}]}
+    assert len(parses) == 1
+    assert len(list((tmp_path / ".cache").glob("items.*.marshal"))) == 1
+
+
+def test_cache_misses_on_new_loader_version_or_file(tmp_path, parses, monkeypatch):
+    path = tmp_path / "items.yaml"
+    path.write_text("items:\n  - name: Ore\n")
+    load_seed_file(path)
+
+    monkeypatch.setattr(seed_cache, "LOADER_VERSION", "other")
+    load_seed_file(path)
+    assert len(parses) == 2
+
+    path.write_text("items:\n  - name: Dust\n")
+    assert load_seed_file(path) == {"items": [{"name": "Dust"}]}
+    assert len(parses) == 3
+    # older blobs of the file are dropped
+    assert len(list((tmp_path / ".cache").glob("items.*.marshal"))) == 1
+
+
+def test_seed_cache_dir_setting_is_used(tmp_path, monkeypatch):
+    path = tmp_path / "items.yaml"
+    path.write_text("items:\n  - name: Ore\n")
+    monkeypatch.setattr(get_settings(), "seed_cache_dir", str(tmp_path / "cache"))
+
+    assert _parse(path, file_sha256(path), "items") == [{"name": "Ore"}]
+    assert len(list((tmp_path / "cache").glob("items.*.marshal"))) == 1
+    assert not (tmp_path / ".cache").exists()
+
+
+def test_unmarshallable_payload_is_not_cached(tmp_path, parses):
+    path = tmp_path / "events.yaml"
+    path.write_text("events:\n  - name: Launch\n    date: 2024-01-01\n")
+
+    expected = {"events": [{"name": "Launch", "date": datetime.date(2024, 1, 1)}]}
+    assert load_seed_file(path) == expected
+    assert load_seed_file(path) == expected
+    assert len(parses) == 2
+    assert not list((tmp_path / ".cache").glob("*.marshal"))
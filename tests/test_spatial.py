@@ -0,0 +1,95 @@
+import dataclasses
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, insert, update
+
+from src.database.catalog import get_catalog
+from src.database.models import Structure
+from src.world import SpatialGrid, StructureEntry, get_spatial_grid, reconcile_spatial_grid, spatial
+
+
+def _structure(x, y):
+    return StructureEntry(id=uuid.uuid4(), type_id=uuid.uuid4(), items=0, x=x, y=y, created_at=datetime.now())
+
+
+def test_query_matches_exact_bounds_across_cells():
+    grid = SpatialGrid(cell_size=4)
+    inside = [_structure(0, 0), _structure(3, 4), _structure(-2, 7), _structure(5, 5)]
+    outside = [_structure(6, 0), _structure(0, 8), _structure(-3, 3), _structure(100, -100)]
+    for entry in inside + outside:
+        grid.put(entry)
+
+    assert {e.id for e in grid.query(-2, 0, 5, 7)} == {e.id for e in inside}
+    assert {e.id for e in grid.query(5, 7, -2, 0)} == {e.id for e in inside}
+    # a rectangle covering more cells than are occupied scans the occupied ones
+    assert len(grid.query(-10**6, -10**6, 10**6, 10**6)) == len(grid) == 8
+
+
+def test_put_moves_and_remove_forgets():
+    grid = SpatialGrid(cell_size=4)
+    entry = _structure(1, 1)
+    grid.put(entry)
+
+    moved = dataclasses.replace(entry, x=50, y=50)
+    grid.put(moved)
+    assert grid.query(0, 0, 3, 3) == []
+    assert grid.query(50, 50, 50, 50) == [moved]
+
+    grid.remove(entry.id)
+    grid.remove(entry.id)
+    assert len(grid) == 0 and grid.query(0, 0, 100, 100) == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile_picks_up_writes_from_other_workers(test_client, db_session, monkeypatch):
+    seen = []
+    monkeypatch.setattr(spatial, "_hooks", [seen.append])
+    await reconcile_spatial_grid()
+    type_id = (await get_catalog()).structure_types.all[0].id
+
+    # Core statements, like another worker's writes, bypass this process's commit events
+    rock = uuid.uuid4()
+    await db_session.execute(insert(Structure).values(id=rock, type_id=type_id, x=-9000, y=-9000))
+    await db_session.commit()
+    assert get_spatial_grid().get(rock) is None
+
+    changes = await reconcile_spatial_grid()
+    assert list(changes) == [rock] and seen == [changes]
+    assert [entry.id for entry in get_spatial_grid().query(-9000, -9000, -9000, -9000)] == [rock]
+    assert await reconcile_spatial_grid() == {}
+
+    await db_session.execute(update(Structure).where(Structure.id == rock).values(x=-8000))
+    await db_session.commit()
+    assert await reconcile_spatial_grid() == {rock: get_spatial_grid().get(rock)}
+    assert get_spatial_grid().get(rock).x == -8000
+
+    await db_session.execute(delete(Structure).where(Structure.id == rock))
+    await db_session.commit()
+    assert await reconcile_spatial_grid() == {rock: None}
+    assert get_spatial_grid().get(rock) is None
+
+
+@pytest.mark.asyncio
+async def test_reconcile_keeps_local_commits_made_while_reading(test_client, db_session, monkeypatch):
+    await reconcile_spatial_grid()
+    type_id = (await get_catalog()).structure_types.all[0].id
+    committed_entries = spatial._committed_entries
+
+    async def read_then_commit():
+        # the rows are read before this process commits a new structure
+        entries = await committed_entries()
+        db_session.add(Structure(id=local_id, type_id=type_id, x=-7000, y=-7000))
+        await db_session.commit()
+        return entries
+
+    local_id = uuid.uuid4()
+    monkeypatch.setattr(spatial, "_committed_entries", read_then_commit)
+    assert await reconcile_spatial_grid() == {}
+    assert get_spatial_grid().get(local_id) is not None
+
+    await db_session.execute(delete(Structure).where(Structure.id == local_id))
+    await db_session.commit()
+    monkeypatch.undo()
+    await reconcile_spatial_grid()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from src.world import TileStore
+
+
+def test_tiles_persist_across_stores(tmp_path):
+    store = TileStore(tmp_path, chunk_size=8, max_open=2)
+    store.set_tile(3, 4, terrain=7, resource=70_000)
+    store.set_tile(-1, -1, occupancy=1)
+    store.flush()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["-1_-1.tiles", "0_0.tiles"]
+    reopened = TileStore(tmp_path, chunk_size=8, max_open=2)
+    assert reopened.tile(3, 4) == {"resource": 70_000, "terrain": 7, "occupancy": 0}
+    assert reopened.tile(-1, -1) == {"resource": 0, "terrain": 0, "occupancy": 1}
+    assert reopened.read(0, 0).terrain[4, 3] == 7
+
+
+def test_unwritten_chunks_read_as_zeros_without_files(tmp_path):
+    store = TileStore(tmp_path, chunk_size=8, max_open=2)
+    chunk = store.read(5, 5)
+    assert chunk.tobytes() == bytes(store.chunk_bytes)
+    assert not np.any(chunk.terrain) and not chunk.terrain.flags.writeable
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_evicted_chunks_are_flushed(tmp_path):
+    store = TileStore(tmp_path, chunk_size=4, max_open=2)
+    for cx in range(5):
+        store.set_tile(cx * 4, 0, terrain=cx + 1)
+    assert store.stats()["open_chunks"] == 2
+
+    assert [TileStore(tmp_path, 4, 1).tile(cx * 4, 0)["terrain"] for cx in range(3)] == [1, 2, 3]
+    with pytest.raises(RuntimeError):
+        TileStore(tmp_path, chunk_size=8, max_open=1).read(0, 0)
+    with pytest.raises(ValueError):
+        store.set_tile(0, 0, height=1)
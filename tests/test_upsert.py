@@ -0,0 +1,40 @@
+import pytest
+
+from src.database.models import ItemType
+from src.database import upsert
+from src.database.upsert import upsert_rows
+
+
+@pytest.mark.asyncio
+async def test_upsert_rows_inserts_and_updates_by_name(test_client, db_session):
+    first, second = await upsert_rows(db_session, ItemType, [
+        {"name": "Upsert Copper", "durability": 1},
+        {"name": "Upsert Tin", "durability": 2},
+    ])
+    await db_session.commit()
+
+    updated, added = await upsert_rows(db_session, ItemType, [
+        {"name": "Upsert Copper", "durability": 5},
+        {"name": "Upsert Zinc", "durability": None},
+    ])
+    await db_session.commit()
+
+    assert updated.id == first.id
+    assert updated.durability == 5
+    assert added.name == "Upsert Zinc" and added.id not in (first.id, second.id)
+
+
+@pytest.mark.asyncio
+async def test_upsert_rows_falls_back_on_other_dialects(test_client, db_session, monkeypatch):
+    monkeypatch.delitem(upsert._DIALECT_INSERTS, "sqlite")
+
+    first, = await upsert_rows(db_session, ItemType, {"name": "Fallback Iron", "durability": 1})
+    await db_session.commit()
+    updated, added = await upsert_rows(db_session, ItemType, [
+        {"name": "Fallback Iron", "durability": 4},
+        {"name": "Fallback Lead", "durability": None},
+    ])
+    await db_session.commit()
+
+    assert updated.id == first.id and updated.durability == 4
+    assert added.name == "Fallback Lead" and added.id != first.id
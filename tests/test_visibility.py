@@ -0,0 +1,73 @@
+import uuid
+from datetime import datetime
+
+from src.world import TileBitset, VisibilityEngine
+from src.world.spatial import BotEntry
+from src.world.visibility import ClientVisibility, vision_disc
+
+
+def _disc(x, y, radius):
+    return {(x + dx, y + dy) for dx, dy in vision_disc(radius)}
+
+
+def test_tile_bitset_spans_chunks_and_negative_tiles():
+    bits = TileBitset(chunk_size=8)
+    tiles = {(0, 0), (7, 7), (8, 0), (-1, -1), (-9, 20)}
+    for tile in tiles:
+        bits.add(tile)
+    bits.add((0, 0))
+
+    assert set(bits) == tiles and len(bits) == 5
+    assert (-1, -1) in bits and (1, 1) not in bits
+    bits.discard((8, 0))
+    bits.discard((8, 0))
+    assert set(bits) == tiles - {(8, 0)}
+
+
+def test_moves_update_only_the_changed_tiles():
+    client = ClientVisibility(chunk_size=8, log_size=1000)
+    client.apply([(None, (0, 0, 3)), (None, (2, 0, 1))])
+    assert set(client.visible) == _disc(0, 0, 3)
+    assert client.version == 1
+
+    client.apply([((0, 0, 3), (1, 0, 3))])
+    assert set(client.visible) == _disc(1, 0, 3)
+    assert set(client.explored) == _disc(0, 0, 3) | _disc(1, 0, 3)
+
+    reset, tiles = client.changes_since(1)
+    assert not reset
+    assert {tile for tile, _, _ in tiles} == _disc(0, 0, 3) ^ _disc(1, 0, 3)
+    assert all(visible == (tile in _disc(1, 0, 3)) and explored for tile, visible, explored in tiles)
+
+    # the second bot still sees (2, 0) once the first one leaves
+    client.apply([((1, 0, 3), None)])
+    assert set(client.visible) == _disc(2, 0, 1)
+    assert client.changes_since(client.version) == (False, [])
+
+
+def test_trimmed_log_falls_back_to_reset():
+    client = ClientVisibility(chunk_size=8, log_size=10)
+    for x in range(0, 50, 5):
+        client.apply([(None, (x, 0, 1))])
+
+    reset, tiles = client.changes_since(1)
+    assert reset
+    assert {tile for tile, _, _ in tiles} == set(client.explored)
+    assert not client.changes_since(client.version - 1)[0]
+
+
+def test_engine_follows_bot_ownership_and_vision():
+    engine = VisibilityEngine(chunk_size=8, log_size=1000)
+    first, second, bot_type = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    bot = BotEntry(uuid.uuid4(), "Scout", bot_type, first, 0, 0, 1, datetime.now())
+    engine.apply({bot.id: bot}, lambda type_id: 2)
+    assert set(engine.client(first).visible) == _disc(0, 0, 2)
+
+    traded = BotEntry(bot.id, "Scout", bot_type, second, 0, 0, 1, datetime.now())
+    engine.apply({bot.id: traded}, lambda type_id: 2)
+    assert len(engine.client(first).visible) == 0
+    assert set(engine.client(first).explored) == _disc(0, 0, 2)
+    assert set(engine.client(second).visible) == _disc(0, 0, 2)
+
+    engine.apply({bot.id: None}, lambda type_id: 2)
+    assert len(engine.client(second).visible) == 0